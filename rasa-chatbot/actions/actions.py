@@ -1,14 +1,64 @@
-from typing import Any, Text, Dict, List
+import os
+from typing import Any, Text, Dict, List, Optional, Tuple
 from rasa_sdk import Action, Tracker
 from rasa_sdk.executor import CollectingDispatcher
-import os
-import json
-from src.infrastructure.data_sources.json_data_source import JsonDataSource
+from src.infrastructure.data_sources.catalog_cache import CatalogCache
+from src.infrastructure.data_sources.mmap_catalog import MmapCatalog, snapshot_path_for
+from src.config.settings import Settings
+from src.infrastructure.data_sources.sqlite_data_source import SqliteDataSource
+from src.infrastructure.monitoring.metrics import metrics
+
+COMPANY_DATA_PATH = 'data/company_a_data.json'  # Ajustar según la compañía actual
+                                                # (.db para usar el catálogo migrado a SQLite)
+
+# Umbrales para la resolución difusa de entidades (nombres con errores o parciales)
+FUZZY_ACCEPT_SCORE = 0.75
+FUZZY_ACCEPT_MARGIN = 0.1
+
+# El servidor de acciones no termina como main.py: sus métricas se exportan
+# periódicamente, un archivo por proceso para el textfile collector
+metrics.start_export(str(Settings.METRICS_DIR / f'actions_{os.getpid()}.prom'),
+                     Settings.METRICS_EXPORT_INTERVAL)
+
+
+_sqlite_catalogs: Dict[str, SqliteDataSource] = {}
+
+
+def _get_catalog():
+    """Catalog for the current company.
+
+    A ``.db`` path is queried directly through its SQLite indexes. For a
+    JSON path the binary snapshot written next to it is memory-mapped
+    (shared by all action-server workers); without a snapshot it falls back
+    to the in-memory index of the cached catalog version.
+    """
+    if COMPANY_DATA_PATH.endswith('.db'):
+        catalog = _sqlite_catalogs.get(COMPANY_DATA_PATH)
+        if catalog is None:
+            catalog = _sqlite_catalogs.setdefault(COMPANY_DATA_PATH, SqliteDataSource(COMPANY_DATA_PATH))
+        return catalog
+    snapshot_path = snapshot_path_for(COMPANY_DATA_PATH)
+    if os.path.exists(snapshot_path):
+        return MmapCatalog.for_path(snapshot_path)
+    return CatalogCache.for_path(COMPANY_DATA_PATH).get_index()
+
+
+def _confident_match(candidates: List[Tuple[Dict[Text, Any], float]]) -> Optional[Dict[Text, Any]]:
+    """Return the best fuzzy candidate if it clearly wins, otherwise None"""
+    if not candidates:
+        return None
+    best, score = candidates[0]
+    runner_up = candidates[1][1] if len(candidates) > 1 else 0.0
+    if score >= FUZZY_ACCEPT_SCORE and score - runner_up >= FUZZY_ACCEPT_MARGIN:
+        return best
+    return None
+
 
 class ActionProductInfo(Action):
     def name(self) -> Text:
         return "action_product_info"
 
+    @metrics.timed('action_seconds', action='action_product_info')
     def run(self, dispatcher: CollectingDispatcher, tracker: Tracker, domain: Dict[Text, Any]) -> List[Dict[Text, Any]]:
         # Obtener el producto mencionado
         product_name = next(tracker.get_latest_entity_values("product"), None)
@@ -17,18 +67,23 @@ class ActionProductInfo(Action):
             dispatcher.utter_message(text="I'm not sure which product you're asking about. Could you please specify?")
             return []
             
-        # Cargar datos de la compañía
-        data_source = JsonDataSource('data/company_a_data.json')  # Ajustar según la compañía actual
-        company_data = data_source.load_data()
-        
-        # Buscar el producto
-        product = next((p for p in company_data.get('products', []) if p['name'].lower() == product_name.lower()), None)
+        # Buscar el producto en el índice de la versión actual del catálogo
+        catalog = _get_catalog()
+        product = catalog.get_product_by_name(product_name)
+        candidates = []
+        if not product:
+            candidates = catalog.resolve_product(product_name, limit=3)
+            metrics.inc('action_fuzzy_lookups_total', entity='product')
+            product = _confident_match(candidates)
         
         if product:
             response = f"Here's what I know about {product['name']}:\n"
             response += f"Description: {product['description']}\n"
             response += f"Price: ${product['price']:.2f}"
             dispatcher.utter_message(text=response)
+        elif candidates:
+            options = ', '.join(p['name'] for p, _ in candidates)
+            dispatcher.utter_message(text=f"I couldn't find {product_name} exactly. Did you mean: {options}?")
         else:
             dispatcher.utter_message(text=f"I'm sorry, I couldn't find information about {product_name}")
         
@@ -38,6 +93,7 @@ class ActionServiceInfo(Action):
     def name(self) -> Text:
         return "action_service_info"
 
+    @metrics.timed('action_seconds', action='action_service_info')
     def run(self, dispatcher: CollectingDispatcher, tracker: Tracker, domain: Dict[Text, Any]) -> List[Dict[Text, Any]]:
         # Obtener el servicio mencionado
         service_name = next(tracker.get_latest_entity_values("service"), None)
@@ -46,12 +102,14 @@ class ActionServiceInfo(Action):
             dispatcher.utter_message(text="I'm not sure which service you're asking about. Could you please specify?")
             return []
             
-        # Cargar datos de la compañía
-        data_source = JsonDataSource('data/company_a_data.json')  # Ajustar según la compañía actual
-        company_data = data_source.load_data()
-        
-        # Buscar el servicio
-        service = next((s for s in company_data.get('services', []) if s['name'].lower() == service_name.lower()), None)
+        # Buscar el servicio en el índice de la versión actual del catálogo
+        catalog = _get_catalog()
+        service = catalog.get_service_by_name(service_name)
+        candidates = []
+        if not service:
+            candidates = catalog.resolve_service(service_name, limit=3)
+            metrics.inc('action_fuzzy_lookups_total', entity='service')
+            service = _confident_match(candidates)
         
         if service:
             response = f"Here's what I know about our {service['name']} service:\n"
@@ -60,7 +118,141 @@ class ActionServiceInfo(Action):
             if service.get('duration'):
                 response += f"\nDuration: {service['duration']}"
             dispatcher.utter_message(text=response)
+        elif candidates:
+            options = ', '.join(s['name'] for s, _ in candidates)
+            dispatcher.utter_message(text=f"I couldn't find {service_name} exactly. Did you mean: {options}?")
         else:
             dispatcher.utter_message(text=f"I'm sorry, I couldn't find information about {service_name}")
         
-        return []
\ No newline at end of file
+        return []
+
+class ActionShowProducts(Action):
+    """Acción para mostrar productos disponibles"""
+    
+    def name(self) -> Text:
+        return "action_show_products"
+    
+    @metrics.timed('action_seconds', action='action_show_products')
+    def run(self, dispatcher: CollectingDispatcher,
+            tracker: Tracker,
+            domain: Dict[Text, Any]) -> List[Dict[Text, Any]]:
+        
+        try:
+            catalog = _get_catalog()
+            total = catalog.count_products()
+            
+            if not total:
+                dispatcher.utter_message(text="No tenemos productos disponibles en este momento.")
+                return []
+            
+            # Formatear respuesta
+            if total <= 3:
+                # Mostrar todos si son pocos
+                message = "Estos son nuestros productos disponibles:\n\n"
+                for product in catalog.list_products():
+                    message += f"🔹 **{product['name']}**\n"
+                    message += f"   {product['description']}\n"
+                    message += f"   💰 Precio: ${product['price']:.2f}\n\n"
+            else:
+                # Mostrar resumen si son muchos (conteos precalculados en el índice)
+                categories = catalog.product_category_counts()
+                message = f"Tenemos {total} productos en {len(categories)} categorías:\n\n"
+                
+                for category, count in list(categories.items())[:5]:  # Mostrar hasta 5 categorías
+                    message += f"🏷️ **{category}**: {count} productos\n"
+                
+                message += f"\n¿Te interesa alguna categoría en particular?"
+            
+            dispatcher.utter_message(text=message)
+            
+        except Exception as e:
+            dispatcher.utter_message(text="Disculpa, ocurrió un error al cargar los productos.")
+            print(f"Error en ActionShowProducts: {e}")
+        
+        return []
+
+
+class ActionShowServices(Action):
+    """Acción para mostrar servicios disponibles"""
+    
+    def name(self) -> Text:
+        return "action_show_services"
+    
+    @metrics.timed('action_seconds', action='action_show_services')
+    def run(self, dispatcher: CollectingDispatcher,
+            tracker: Tracker,
+            domain: Dict[Text, Any]) -> List[Dict[Text, Any]]:
+        
+        try:
+            catalog = _get_catalog()
+            total = catalog.count_services()
+            
+            if not total:
+                dispatcher.utter_message(text="No tenemos servicios disponibles en este momento.")
+                return []
+            
+            message = "Estos son nuestros servicios:\n\n"
+            for service in catalog.list_services(5):  # Mostrar hasta 5 servicios
+                message += f"🔸 **{service['name']}**\n"
+                message += f"   {service['description']}\n"
+                message += f"   💰 Precio: ${service['price']:.2f}\n"
+                if service.get('duration'):
+                    message += f"   ⏱️ Duración: {service['duration']}\n"
+                message += "\n"
+            
+            if total > 5:
+                message += f"Y {total - 5} servicios más disponibles."
+            
+            dispatcher.utter_message(text=message)
+            
+        except Exception as e:
+            dispatcher.utter_message(text="Disculpa, ocurrió un error al cargar los servicios.")
+            print(f"Error en ActionShowServices: {e}")
+        
+        return []
+
+
+class ActionShowPrice(Action):
+    """Acción para mostrar precio de producto/servicio específico"""
+    
+    MAX_RESULTS = 10
+    
+    def name(self) -> Text:
+        return "action_show_price"
+    
+    @metrics.timed('action_seconds', action='action_show_price')
+    def run(self, dispatcher: CollectingDispatcher,
+            tracker: Tracker,
+            domain: Dict[Text, Any]) -> List[Dict[Text, Any]]:
+        
+        # Obtener entidades mencionadas
+        product_name = tracker.get_slot("product")
+        service_name = tracker.get_slot("service")
+        
+        try:
+            catalog = _get_catalog()
+            
+            found_items = []
+            
+            # Buscar en productos (nombres parciales vía índice de prefijos)
+            if product_name:
+                for product in catalog.search_products(product_name, self.MAX_RESULTS):
+                    found_items.append(f"🔹 {product['name']}: ${product['price']:.2f}")
+            
+            # Buscar en servicios
+            if service_name:
+                for service in catalog.search_services(service_name, self.MAX_RESULTS):
+                    found_items.append(f"🔸 {service['name']}: ${service['price']:.2f}")
+            
+            if found_items:
+                message = "Aquí tienes los precios:\n\n" + "\n".join(found_items)
+            else:
+                message = "No encontré información de precio para ese producto o servicio. ¿Podrías ser más específico?"
+            
+            dispatcher.utter_message(text=message)
+            
+        except Exception as e:
+            dispatcher.utter_message(text="Disculpa, ocurrió un error al buscar el precio.")
+            print(f"Error en ActionShowPrice: {e}")
+        
+        return []
@@ -0,0 +1,94 @@
+# rasa-chatbot/benchmarks/bench_extraction.py
+"""
+Compara la extracción de tarjetas de CompanyAScraper (un find() por campo) con
+SelectorScraper (plan compilado, un solo recorrido por tarjeta) sobre la misma
+página ya parseada, y parseo + extracción completos. Verifica que ambos
+devuelvan exactamente los mismos items.
+
+Uso: python -m benchmarks.bench_extraction --cards 5000 --repeat 3
+"""
+
+import argparse
+import os
+import time
+
+os.environ.setdefault('HTTP_CACHE_ENABLED', '0')
+
+from benchmarks.bench_parsing import synthetic_page
+from src.infrastructure.scrapers.company_a_scraper import CompanyAScraper
+from src.infrastructure.scrapers.selector_scraper import SelectorScraper
+
+# Lo mismo que lee CompanyAScraper._parse_products, en forma declarativa
+COMPANY_A_SELECTORS = {
+    'price': {'implied_decimals': 2},
+    'products': {
+        'card': 'div.product-card',
+        'fields': {
+            'id': {'attr': 'data-id', 'default': ''},
+            'name': 'h2',
+            'description': 'p.description',
+            'price': {'selector': 'span.price', 'type': 'price'},
+            'category': 'span.category',
+        },
+    },
+}
+
+
+def _best(fn, repeat: int) -> float:
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def run(cards: int, noise: int, repeat: int, parser: str = 'lxml') -> list:
+    markup = synthetic_page(cards, noise)
+    hand_written = CompanyAScraper('http://localhost', parser=parser)
+    declarative = SelectorScraper('http://localhost', COMPANY_A_SELECTORS, parser=parser)
+    plan = declarative.plans['products']
+    results = []
+    try:
+        soup = hand_written._make_soup(markup)
+        expected = list(hand_written._parse_products(soup))
+        assert len(expected) == cards
+        assert list(plan(soup)) == expected, 'SelectorScraper output differs from CompanyAScraper'
+
+        for label, extract in (('CompanyAScraper', hand_written._parse_products), ('SelectorScraper', plan)):
+            seconds = _best(lambda: sum(1 for _ in extract(soup)), repeat)
+            results.append({'stage': 'extract', 'scraper': label, 'seconds': round(seconds, 4)})
+        soup.decompose()
+
+        for label, scraper, extract, card_filter in (
+            ('CompanyAScraper', hand_written, hand_written._parse_products, hand_written.PRODUCT_CARDS),
+            ('SelectorScraper', declarative, plan, declarative.card_filters['products']),
+        ):
+            def parse_and_extract():
+                return sum(1 for _ in extract(scraper._make_soup(markup, card_filter)))
+            seconds = _best(parse_and_extract, repeat)
+            results.append({'stage': 'parse + extract', 'scraper': label, 'seconds': round(seconds, 4)})
+    finally:
+        hand_written.close()
+        declarative.close()
+    for baseline, result in zip(results[::2], results[1::2]):
+        result['speedup'] = round(baseline['seconds'] / result['seconds'], 2)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--cards', type=int, default=5000)
+    parser.add_argument('--noise', type=int, default=3, help='bloques ajenos por tarjeta')
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--parser', default='lxml', choices=['html.parser', 'lxml'])
+    args = parser.parse_args()
+
+    print(f"{args.cards} cards, parser {args.parser}")
+    for result in run(args.cards, args.noise, args.repeat, args.parser):
+        speedup = f"  (x{result['speedup']})" if 'speedup' in result else ''
+        print(f"{result['stage']:>16} {result['scraper']:<16}: {result['seconds']:.3f}s{speedup}")
+
+
+if __name__ == '__main__':
+    main()
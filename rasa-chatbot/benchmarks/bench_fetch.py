@@ -0,0 +1,61 @@
+# rasa-chatbot/benchmarks/bench_fetch.py
+"""
+Compara el tiempo de descarga serie (una petición bloqueante a la vez, como
+BaseScraper._get_soup) contra FetchEngine sobre un servidor local con latencia.
+
+Uso: python -m benchmarks.bench_fetch --pages 40 --latency 0.05
+"""
+
+import argparse
+import time
+
+import requests
+
+from benchmarks.local_server import CatalogSiteServer
+from src.infrastructure.scrapers.fetch_engine import FetchEngine
+
+
+def run(pages: int, latency: float, workers: int, per_host: int) -> dict:
+    with CatalogSiteServer(latency=latency, pages=pages) as site:
+        urls = [f'{site.url}/products?page={n}' for n in range(1, pages + 1)]
+
+        session = requests.Session()
+        start = time.perf_counter()
+        for url in urls:
+            response = session.get(url)
+            response.raise_for_status()
+        serial = time.perf_counter() - start
+        session.close()
+
+        with FetchEngine(max_workers=workers, per_host_limit=per_host) as engine:
+            start = time.perf_counter()
+            engine.fetch_all(urls)
+            concurrent = time.perf_counter() - start
+            engine.session.close()
+
+    return {
+        'pages': pages,
+        'latency_s': latency,
+        'workers': workers,
+        'per_host_limit': per_host,
+        'serial_s': round(serial, 4),
+        'concurrent_s': round(concurrent, 4),
+        'speedup': round(serial / concurrent, 2),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--pages', type=int, default=40)
+    parser.add_argument('--latency', type=float, default=0.05)
+    parser.add_argument('--workers', type=int, default=8)
+    parser.add_argument('--per-host', type=int, default=8)
+    args = parser.parse_args()
+
+    result = run(args.pages, args.latency, args.workers, args.per_host)
+    for key, value in result.items():
+        print(f"{key:>16}: {value}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,110 @@
+# rasa-chatbot/benchmarks/bench_imports.py
+"""
+Mide el tiempo de import (en un intérprete nuevo por corrida) de los puntos de
+entrada del CLI y del servidor de acciones, cuántos módulos cargan y si
+arrastran requests/bs4/lxml/yaml. Con --baseline compara contra otro commit.
+
+Uso: python -m benchmarks.bench_imports --repeat 10 [--baseline HEAD~1]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tarfile
+import tempfile
+from typing import Dict, Any, List
+
+TARGETS = [
+    'main',
+    'src.config.company_config',
+    # Lo que importa actions/actions.py además de rasa_sdk
+    'src.infrastructure.data_sources.catalog_cache',
+    'src.infrastructure.data_sources.mmap_catalog',
+    'src.infrastructure.data_sources.sqlite_data_source',
+    'actions.actions',
+]
+HEAVY_MODULES = ['requests', 'bs4', 'lxml', 'yaml']
+
+_PROBE = (
+    "import json, sys, time\n"
+    "start = time.perf_counter()\n"
+    "try:\n"
+    "    __import__({target!r})\n"
+    "    error = None\n"
+    "except ImportError as e:\n"
+    "    error = str(e)\n"
+    "print(json.dumps({{'ms': (time.perf_counter() - start) * 1000, 'modules': len(sys.modules),\n"
+    "                  'heavy': [m for m in {heavy!r} if m in sys.modules], 'error': error}}))\n"
+)
+
+
+def measure(target: str, cwd: str, repeat: int) -> Dict[str, Any]:
+    """Median import time of ``target`` over ``repeat`` fresh interpreters"""
+    runs = []
+    for _ in range(repeat):
+        output = subprocess.run(
+            [sys.executable, '-c', _PROBE.format(target=target, heavy=HEAVY_MODULES)],
+            cwd=cwd, capture_output=True, text=True, check=True,
+            env=dict(os.environ, PYTHONDONTWRITEBYTECODE='1'),
+        ).stdout
+        runs.append(json.loads(output.strip().splitlines()[-1]))
+        if runs[-1]['error']:
+            break
+    return {
+        'target': target,
+        'ms': round(statistics.median(run['ms'] for run in runs), 1),
+        'modules': runs[-1]['modules'],
+        'heavy': runs[-1]['heavy'],
+        'error': runs[-1]['error'],
+    }
+
+
+def checkout(ref: str, directory: str) -> str:
+    """Extract this project as of git ``ref`` into ``directory``"""
+    here = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    archive = os.path.join(directory, 'tree.tar')
+    # Desde un subdirectorio, git archive exporta solo ese subdirectorio
+    subprocess.run(['git', 'archive', '--format=tar', '-o', archive, ref], cwd=here, check=True)
+    with tarfile.open(archive) as tar:
+        tar.extractall(directory)
+    return directory
+
+
+def run(cwd: str, repeat: int) -> List[Dict[str, Any]]:
+    return [measure(target, cwd, repeat) for target in TARGETS]
+
+
+def _print(label: str, results: List[Dict[str, Any]]) -> None:
+    print(label)
+    for result in results:
+        if result['error']:
+            print(f"  {result['target']:<52} not importable: {result['error']}")
+            continue
+        print(f"  {result['target']:<52} {result['ms']:7.1f} ms  {result['modules']:4d} modules  "
+              f"{', '.join(result['heavy']) or '-'}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--repeat', type=int, default=10)
+    parser.add_argument('--baseline', help='commit contra el que comparar (p.ej. HEAD~1)')
+    args = parser.parse_args()
+
+    here = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    current = run(here, args.repeat)
+    _print('current tree', current)
+    if args.baseline:
+        with tempfile.TemporaryDirectory() as tmp:
+            baseline = run(checkout(args.baseline, tmp), args.repeat)
+        _print(f'baseline {args.baseline}', baseline)
+        print('speedup')
+        for before, after in zip(baseline, current):
+            if not before['error'] and not after['error']:
+                print(f"  {after['target']:<52} x{before['ms'] / after['ms']:.2f}")
+
+
+if __name__ == '__main__':
+    main()
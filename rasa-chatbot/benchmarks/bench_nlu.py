@@ -0,0 +1,107 @@
+# rasa-chatbot/benchmarks/bench_nlu.py
+"""
+Compara la generación de nlu.yml para un catálogo sintético grande:
+el camino anterior (lista de ejemplos + join + yaml.dump puro), el mismo con
+el CDumper de libyaml y el escritor en streaming (write_nlu_yaml).
+
+El tiempo se mide sin tracemalloc; el pico de memoria en una segunda pasada
+con tracemalloc, que se omite para el dumper puro (mismas estructuras en
+memoria que con CDumper y demasiado lento bajo tracemalloc).
+
+Uso: python -m benchmarks.bench_nlu --items 50000
+"""
+
+import argparse
+import os
+import tempfile
+import time
+import tracemalloc
+
+import yaml
+
+from src.infrastructure.rasa_integration.nlu_generator import (
+    GOODBYE_EXAMPLES, GREET_EXAMPLES, generate_product_intents, generate_service_intents, write_nlu_yaml,
+)
+
+
+def synthetic_catalog(items: int) -> dict:
+    return {
+        'name': 'Bench Co',
+        'products': [{'name': f'Producto {i} modelo X{i % 97}'} for i in range(items)],
+        'services': [{'name': f'Servicio {i}'} for i in range(max(1, items // 10))],
+    }
+
+
+def legacy_nlu(company_data: dict, dumper) -> str:
+    """nlu.yml como se generaba antes: todo en memoria y un solo yaml.dump"""
+    return yaml.dump({
+        'version': '3.1',
+        'nlu': [
+            generate_product_intents(company_data['products']),
+            generate_service_intents(company_data['services']),
+            {'intent': 'greet', 'examples': '\n'.join(f'- {e}' for e in GREET_EXAMPLES)},
+            {'intent': 'goodbye', 'examples': '\n'.join(f'- {e}' for e in GOODBYE_EXAMPLES)},
+        ],
+    }, Dumper=dumper, allow_unicode=True)
+
+
+def measure(name: str, fn, path: str, trace_memory: bool) -> dict:
+    start = time.perf_counter()
+    fn(path)
+    seconds = time.perf_counter() - start
+    peak = None
+    if trace_memory:
+        tracemalloc.start()
+        fn(path)
+        peak = tracemalloc.get_traced_memory()[1] / 1e6
+        tracemalloc.stop()
+    return {'name': name, 'seconds': seconds, 'peak_mb': peak, 'size_mb': os.path.getsize(path) / 1e6}
+
+
+def run(items: int) -> list:
+    company_data = synthetic_catalog(items)
+
+    def write_with(dumper):
+        def write(path):
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write(legacy_nlu(company_data, dumper))
+        return write
+
+    def write_streaming(path):
+        with open(path, 'w', encoding='utf-8') as f:
+            write_nlu_yaml(company_data, f)
+
+    cases = [('yaml.dump (pure Python)', write_with(yaml.Dumper), False)]
+    if getattr(yaml, '__with_libyaml__', False):
+        cases.append(('yaml.dump (CDumper)', write_with(yaml.CDumper), True))
+    cases.append(('write_nlu_yaml (streaming)', write_streaming, True))
+
+    results = []
+    loaded = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for name, fn, trace_memory in cases:
+            path = os.path.join(tmp, 'nlu.yml')
+            results.append(measure(name, fn, path, trace_memory))
+            # Todas las variantes deben producir los mismos datos de entrenamiento
+            with open(path, 'r', encoding='utf-8') as f:
+                loaded.append(yaml.load(f, Loader=getattr(yaml, 'CSafeLoader', yaml.SafeLoader)))
+    assert all(data == loaded[0] for data in loaded), "outputs differ"
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--items', type=int, default=50000, help='productos del catálogo')
+    args = parser.parse_args()
+
+    print(f"{args.items} products, {args.items * 4} product examples")
+    results = run(args.items)
+    baseline = results[0]['seconds']
+    for result in results:
+        peak = f"{result['peak_mb']:7.1f} MB" if result['peak_mb'] is not None else f"{'-':>10}"
+        print(f"{result['name']:>28}: {result['seconds']:7.2f}s  (x{baseline / result['seconds']:.1f})  "
+              f"peak {peak}  file {result['size_mb']:.1f} MB")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,136 @@
+# rasa-chatbot/benchmarks/bench_nlu_modes.py
+"""
+Compara los modos de generación de NLU ('templates' y 'lookup') a medida que
+crece el catálogo: ejemplos de entrenamiento, tamaño de nlu.yml y, con --train
+(requiere rasa instalado), tiempo de 'rasa train nlu' y precisión sobre un set
+de prueba con frases y nombres que no están en los ejemplos.
+
+Pendiente: la parte de --train (tiempo de entrenamiento y precisión) todavía
+no se corrió, porque rasa no está instalado en el entorno donde se agregó el
+modo 'lookup'. Los números publicados cubren solo ejemplos, tamaño y tiempo
+de generación; la comparación de precisión entre modos queda sin medir.
+
+Uso: python -m benchmarks.bench_nlu_modes --sizes 1000 10000 --train
+"""
+
+import argparse
+import json
+import os
+import random
+import shutil
+import subprocess
+import tempfile
+import time
+
+from benchmarks.bench_nlu import synthetic_catalog
+from src.infrastructure.rasa_integration.nlu_generator import (
+    NluOptions, iter_nlu_sections, write_nlu_yaml,
+)
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Frases que no aparecen en las plantillas de entrenamiento
+TEST_TEMPLATES = {
+    ('ask_product_info', 'product'): ["How much does [{name}](product) cost?",
+                                      "Is [{name}](product) in stock?"],
+    ('ask_service_info', 'service'): ["Can you explain the [{name}](service) service?",
+                                      "How long does [{name}](service) take?"],
+}
+
+
+def count_examples(company_data: dict, options: NluOptions) -> int:
+    return sum(sum(1 for _ in examples)
+               for section, _, examples in iter_nlu_sections(company_data, options)
+               if section == 'intent')
+
+
+def write_test_set(company_data: dict, path: str, samples: int, seed: int = 0) -> None:
+    rng = random.Random(seed)
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write("version: '3.1'\nnlu:\n")
+        for (intent, entity), templates in TEST_TEMPLATES.items():
+            items = company_data['products' if entity == 'product' else 'services']
+            f.write(f"- intent: {intent}\n  examples: |-\n")
+            for item in rng.sample(items, min(samples, len(items))):
+                f.write(f"    - {rng.choice(templates).format(name=item['name'])}\n")
+
+
+def train_and_test(nlu_path: str, test_path: str, workdir: str) -> dict:
+    """Train an NLU model with the repo's config.yml and evaluate it"""
+    start = time.perf_counter()
+    subprocess.run(['rasa', 'train', 'nlu', '--config', os.path.join(BASE_DIR, 'config.yml'),
+                    '--nlu', nlu_path, '--out', os.path.join(workdir, 'models'),
+                    '--fixed-model-name', 'bench'], check=True, cwd=workdir,
+                   stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    train_seconds = time.perf_counter() - start
+    results_dir = os.path.join(workdir, 'results')
+    subprocess.run(['rasa', 'test', 'nlu', '--nlu', test_path,
+                    '--model', os.path.join(workdir, 'models', 'bench.tar.gz'),
+                    '--out', results_dir], check=True, cwd=workdir,
+                   stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    with open(os.path.join(results_dir, 'intent_report.json'), encoding='utf-8') as f:
+        intent_report = json.load(f)
+    entity_f1 = None
+    entity_report_path = os.path.join(results_dir, 'DIETClassifier_report.json')
+    if os.path.exists(entity_report_path):
+        with open(entity_report_path, encoding='utf-8') as f:
+            entity_f1 = json.load(f).get('weighted avg', {}).get('f1-score')
+    return {
+        'train_seconds': train_seconds,
+        'intent_accuracy': intent_report.get('accuracy'),
+        'entity_f1': entity_f1,
+    }
+
+
+def run(sizes: list, train: bool, test_samples: int) -> list:
+    results = []
+    for size in sizes:
+        company_data = synthetic_catalog(size)
+        for mode in ('templates', 'lookup'):
+            options = NluOptions(mode=mode)
+            with tempfile.TemporaryDirectory() as workdir:
+                nlu_path = os.path.join(workdir, 'nlu.yml')
+                start = time.perf_counter()
+                with open(nlu_path, 'w', encoding='utf-8') as f:
+                    write_nlu_yaml(company_data, f, options)
+                result = {
+                    'items': size,
+                    'mode': mode,
+                    'examples': count_examples(company_data, options),
+                    'generate_seconds': time.perf_counter() - start,
+                    'size_mb': os.path.getsize(nlu_path) / 1e6,
+                }
+                if train:
+                    test_path = os.path.join(workdir, 'test.yml')
+                    write_test_set(company_data, test_path, test_samples)
+                    result.update(train_and_test(nlu_path, test_path, workdir))
+            results.append(result)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1000, 10000, 100000])
+    parser.add_argument('--train', action='store_true', help="entrenar y evaluar con rasa")
+    parser.add_argument('--test-samples', type=int, default=200)
+    parser.add_argument('--output', help='guardar los resultados en un JSON')
+    args = parser.parse_args()
+
+    if args.train and shutil.which('rasa') is None:
+        parser.error("--train requires the rasa CLI")
+
+    results = run(args.sizes, args.train, args.test_samples)
+    for r in results:
+        line = (f"{r['items']:>8} items  {r['mode']:<10} {r['examples']:>8} examples  "
+                f"{r['size_mb']:7.2f} MB  gen {r['generate_seconds']:.2f}s")
+        if 'train_seconds' in r:
+            entity = f"{r['entity_f1']:.3f}" if r['entity_f1'] is not None else '-'
+            line += f"  train {r['train_seconds']:.0f}s  intent acc {r['intent_accuracy']:.3f}  entity f1 {entity}"
+        print(line)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=4)
+
+
+if __name__ == '__main__':
+    main()
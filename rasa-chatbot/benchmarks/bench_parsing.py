@@ -0,0 +1,75 @@
+# rasa-chatbot/benchmarks/bench_parsing.py
+"""
+Mide parseo + extracción de tarjetas sobre páginas de catálogo sintéticas grandes
+con cada backend de BaseScraper (html.parser / lxml, árbol completo o solo tarjetas).
+
+Uso: python -m benchmarks.bench_parsing --cards 5000 --repeat 3
+"""
+
+import argparse
+import os
+import time
+
+os.environ.setdefault('HTTP_CACHE_ENABLED', '0')
+
+from benchmarks.local_server import render_catalog_page
+from src.infrastructure.scrapers.company_a_scraper import CompanyAScraper
+
+BACKENDS = [
+    ('html.parser', False),
+    ('html.parser', True),
+    ('lxml', False),
+    ('lxml', True),
+]
+
+
+def synthetic_page(cards: int, noise: int) -> str:
+    """Catalog page with ``noise`` unrelated blocks (menus, banners) per card"""
+    page = render_catalog_page('products', 1, cards)
+    filler = ''.join(
+        f'<div class="banner"><ul><li><a href="/promo/{i}">Oferta {i}</a></li>'
+        f'<li><span class="badge">Nuevo</span></li></ul></div>'
+        for i in range(noise)
+    )
+    return page.replace('</div><div class="product-card"', f'</div>{filler}<div class="product-card"')
+
+
+def run(cards: int, noise: int, repeat: int) -> list:
+    markup = synthetic_page(cards, noise)
+    results = []
+    for parser, restricted in BACKENDS:
+        scraper = CompanyAScraper('http://localhost', parser=parser, restrict_to_cards=restricted)
+        best = float('inf')
+        for _ in range(repeat):
+            start = time.perf_counter()
+            soup = scraper._make_soup(markup, scraper.PRODUCT_CARDS)
+            items = list(scraper._parse_products(soup))
+            best = min(best, time.perf_counter() - start)
+        assert len(items) == cards
+        results.append({
+            'parser': parser,
+            'restrict_to_cards': restricted,
+            'seconds': round(best, 4),
+        })
+        scraper.close()
+    baseline = results[0]['seconds']
+    for result in results:
+        result['speedup'] = round(baseline / result['seconds'], 2)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--cards', type=int, default=5000)
+    parser.add_argument('--noise', type=int, default=3, help='bloques ajenos por tarjeta')
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"{args.cards} cards, page size {len(synthetic_page(args.cards, args.noise)) / 1e6:.1f} MB")
+    for result in run(args.cards, args.noise, args.repeat):
+        label = f"{result['parser']}{' + cards only' if result['restrict_to_cards'] else ''}"
+        print(f"{label:>26}: {result['seconds']:.3f}s  (x{result['speedup']})")
+
+
+if __name__ == '__main__':
+    main()
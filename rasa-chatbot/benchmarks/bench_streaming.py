@@ -0,0 +1,80 @@
+# rasa-chatbot/benchmarks/bench_streaming.py
+"""
+Compara BaseScraper en modo normal (descarga completa y después parseo) contra
+stream=True (las tarjetas se parsean mientras la página se descarga) sobre un
+servidor local con ancho de banda limitado: tiempo total, tiempo hasta el
+primer item y pico de memoria de Python. Verifica que ambos modos devuelvan
+los mismos items.
+
+Uso: python -m benchmarks.bench_streaming --cards 20000 --bandwidth 4 [--gzip]
+"""
+
+import argparse
+import os
+import time
+import tracemalloc
+
+os.environ.setdefault('HTTP_CACHE_ENABLED', '0')
+
+from benchmarks.local_server import CatalogSiteServer
+from src.infrastructure.scrapers.company_a_scraper import CompanyAScraper
+
+
+def scrape(url: str, parser: str, stream: bool, trace_memory: bool) -> dict:
+    scraper = CompanyAScraper(url, parser=parser, restrict_to_cards=True, stream=stream)
+    if trace_memory:
+        tracemalloc.start()
+    start = time.perf_counter()
+    first_item = None
+    items = []
+    try:
+        for item in scraper.iter_products():
+            if first_item is None:
+                first_item = time.perf_counter() - start
+            items.append(item)
+        seconds = time.perf_counter() - start
+        peak = tracemalloc.get_traced_memory()[1] if trace_memory else None
+    finally:
+        if trace_memory:
+            tracemalloc.stop()
+        scraper.close()
+    return {'items': items, 'seconds': seconds, 'first_item': first_item, 'peak': peak}
+
+
+def run(cards: int, bandwidth_mb: float, compress: bool, parser: str) -> list:
+    results = []
+    with CatalogSiteServer(latency=0, per_page=cards, bandwidth=bandwidth_mb * 1e6, compress=compress) as site:
+        expected = None
+        for stream in (False, True):
+            timed = scrape(site.url, parser, stream, trace_memory=False)
+            # El pico de memoria se mide en otra corrida: tracemalloc altera los tiempos
+            traced = scrape(site.url, parser, stream, trace_memory=True)
+            if expected is None:
+                expected = timed['items']
+            assert timed['items'] == expected and traced['items'] == expected, 'streaming changed the items'
+            results.append({
+                'mode': 'stream' if stream else 'full body',
+                'items': len(timed['items']),
+                'seconds': round(timed['seconds'], 3),
+                'first_item_s': round(timed['first_item'], 3),
+                'peak_mb': round(traced['peak'] / 1e6, 1),
+            })
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--cards', type=int, default=20000)
+    parser.add_argument('--bandwidth', type=float, default=4.0, help='MB/s que entrega el servidor')
+    parser.add_argument('--gzip', action='store_true', help='el servidor comprime con gzip')
+    parser.add_argument('--parser', default='lxml', choices=['html.parser', 'lxml'])
+    args = parser.parse_args()
+
+    print(f"{args.cards} cards, {args.bandwidth} MB/s, parser {args.parser}{', gzip' if args.gzip else ''}")
+    for result in run(args.cards, args.bandwidth, args.gzip, args.parser):
+        print(f"{result['mode']:>10}: {result['seconds']:.3f}s total, first item after "
+              f"{result['first_item_s']:.3f}s, peak {result['peak_mb']} MB")
+
+
+if __name__ == '__main__':
+    main()
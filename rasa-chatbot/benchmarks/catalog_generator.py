@@ -0,0 +1,130 @@
+# rasa-chatbot/benchmarks/catalog_generator.py
+"""
+Generador determinístico de catálogos sintéticos (productos y servicios con
+nombres, categorías y descripciones realistas en español e inglés).
+
+Con la misma semilla y tamaño siempre produce el mismo catálogo, así los
+benchmarks son comparables entre commits.
+
+Uso: python -m benchmarks.catalog_generator --products 100000 --output /tmp/catalog.json
+"""
+
+import argparse
+import json
+import random
+from typing import Dict, Any, Iterator
+
+BRANDS = ['Samsung', 'Sony', 'LG', 'Philips', 'Bosch', 'Lenovo', 'HP', 'Xiaomi', 'Motorola', 'Canon',
+          'Nikon', 'Logitech', 'Asus', 'Acer', 'Whirlpool', 'Electrolux', 'Atma', 'Noblex', 'BGH', 'Drean']
+
+# categoría -> (sustantivos en español, sustantivos en inglés)
+CATEGORIES = {
+    'Televisores': (['Televisor', 'Smart TV', 'Monitor'], ['Television', 'Smart TV', 'Display']),
+    'Audio': (['Parlante', 'Auriculares', 'Barra de sonido'], ['Speaker', 'Headphones', 'Soundbar']),
+    'Computación': (['Notebook', 'Teclado', 'Mouse', 'Tablet'], ['Laptop', 'Keyboard', 'Mouse', 'Tablet']),
+    'Celulares': (['Celular', 'Cargador', 'Funda'], ['Smartphone', 'Charger', 'Case']),
+    'Fotografía': (['Cámara', 'Lente', 'Trípode'], ['Camera', 'Lens', 'Tripod']),
+    'Electrodomésticos': (['Heladera', 'Lavarropas', 'Microondas', 'Cafetera'],
+                          ['Fridge', 'Washing machine', 'Microwave', 'Coffee maker']),
+    'Climatización': (['Aire acondicionado', 'Ventilador', 'Calefactor'], ['Air conditioner', 'Fan', 'Heater']),
+    'Gaming': (['Consola', 'Joystick', 'Silla gamer'], ['Console', 'Gamepad', 'Gaming chair']),
+}
+
+ADJECTIVES_ES = ['inalámbrico', 'portátil', 'compacto', 'profesional', 'ultra delgado', 'inteligente']
+ADJECTIVES_EN = ['wireless', 'portable', 'compact', 'pro', 'ultra slim', 'smart']
+SUFFIXES = ['', ' Pro', ' Max', ' Lite', ' Plus', ' Ultra', ' Mini']
+
+DESCRIPTIONS_ES = [
+    '{name} con garantía oficial de {years} años.',
+    '{name}, ideal para el hogar y la oficina. Envío gratis.',
+    'Nuevo {name} con tecnología de última generación y bajo consumo.',
+]
+DESCRIPTIONS_EN = [
+    '{name} with an official {years}-year warranty.',
+    '{name}, perfect for home and office. Free shipping.',
+    'Brand new {name} featuring the latest technology and low power usage.',
+]
+
+SERVICES_ES = ['Instalación de {noun}', 'Reparación de {noun}', 'Mantenimiento de {noun}',
+               'Configuración de {noun}', 'Garantía extendida para {noun}']
+SERVICES_EN = ['{noun} installation', '{noun} repair', '{noun} maintenance',
+               '{noun} setup', 'Extended warranty for {noun}']
+DURATIONS = ['30 minutos', '1 hora', '2 horas', 'medio día', '1 día', '1 hour', '2 hours']
+
+
+def iter_products(count: int, seed: int = 0) -> Iterator[Dict[str, Any]]:
+    """Yield ``count`` products; the same seed always yields the same items"""
+    rng = random.Random(f"products:{seed}")
+    categories = list(CATEGORIES)
+    for i in range(count):
+        category = rng.choice(categories)
+        spanish = rng.random() < 0.6
+        nouns = CATEGORIES[category][0 if spanish else 1]
+        adjective = rng.choice(ADJECTIVES_ES if spanish else ADJECTIVES_EN)
+        model = f"{rng.choice('ABCDEFGHKMNPQRSTXZ')}{rng.randint(10, 9999)}{rng.choice(SUFFIXES)}"
+        if spanish:
+            name = f"{rng.choice(nouns)} {rng.choice(BRANDS)} {adjective} {model}"
+        else:
+            name = f"{rng.choice(BRANDS)} {adjective} {rng.choice(nouns)} {model}"
+        description = rng.choice(DESCRIPTIONS_ES if spanish else DESCRIPTIONS_EN).format(
+            name=name, years=rng.randint(1, 3))
+        yield {
+            'id': f"p{i}",
+            'name': name,
+            'description': description,
+            # Distribución sesgada: muchos productos baratos, pocos caros
+            'price': round(rng.lognormvariate(4.5, 1.2), 2),
+            'category': category,
+            'stock': rng.choice([None, 0, rng.randint(1, 500)]),
+        }
+
+
+def iter_services(count: int, seed: int = 0) -> Iterator[Dict[str, Any]]:
+    """Yield ``count`` services; the same seed always yields the same items"""
+    rng = random.Random(f"services:{seed}")
+    categories = list(CATEGORIES)
+    for i in range(count):
+        spanish = rng.random() < 0.6
+        nouns = CATEGORIES[rng.choice(categories)][0 if spanish else 1]
+        noun = rng.choice(nouns)
+        name = rng.choice(SERVICES_ES if spanish else SERVICES_EN).format(
+            noun=noun.lower() if spanish else noun)
+        name = f"{name} {rng.choice(BRANDS)} #{i}"
+        yield {
+            'id': f"s{i}",
+            'name': name,
+            'description': f"{name}. {'Servicio técnico oficial.' if spanish else 'Official technical service.'}",
+            'price': round(rng.uniform(20, 800), 2),
+            'duration': rng.choice(DURATIONS),
+        }
+
+
+def generate_catalog(products: int, services: int = None, seed: int = 0) -> Dict[str, Any]:
+    """Company data dict with ``products`` products and ``services`` services
+    (by default one service every 10 products)"""
+    if services is None:
+        services = max(1, products // 10)
+    return {
+        'name': 'Synthetic Store',
+        'website': 'https://synthetic.example.com',
+        'products': list(iter_products(products, seed)),
+        'services': list(iter_services(services, seed)),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--products', type=int, default=1000)
+    parser.add_argument('--services', type=int, default=None)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--output', required=True)
+    args = parser.parse_args()
+
+    catalog = generate_catalog(args.products, args.services, args.seed)
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(catalog, f, ensure_ascii=False)
+    print(f"{len(catalog['products'])} products and {len(catalog['services'])} services -> {args.output}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,312 @@
+# rasa-chatbot/benchmarks/load_test_actions.py
+"""
+Prueba de carga offline de las acciones personalizadas, sin servidor de Rasa.
+
+Ejecuta las acciones registradas en actions/actions.py con un tracker y un
+dispatcher locales, reproduciendo conversaciones grabadas (historias en YAML
+con pasos ``action:``) o generadas a partir de un catálogo sintético, con
+varias conversaciones en paralelo. Informa latencia p50/p95/p99, throughput y,
+por acción, cuánto creció el RSS del proceso durante sus llamadas (medido
+antes y después de cada una; con --concurrency > 1 incluye también lo que
+asignan las conversaciones que corren en paralelo).
+
+Uso: python -m benchmarks.load_test_actions --products 10000 --conversations 500 --concurrency 8
+     python -m benchmarks.load_test_actions --stories benchmarks/load_test_stories.yml --repeat 100 --backend sqlite
+"""
+
+import argparse
+import importlib
+import inspect
+import json
+import math
+import os
+import random
+import resource
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Iterator, List, Optional
+
+import yaml
+
+from benchmarks.catalog_generator import generate_catalog
+from src.infrastructure.data_sources.json_data_source import JsonDataSource
+from src.infrastructure.data_sources.mmap_catalog import snapshot_path_for
+from src.infrastructure.data_sources.sqlite_data_source import SqliteDataSource
+
+BACKENDS = ('json', 'mmap', 'sqlite')
+
+
+class StubTracker:
+    """Stand-in for rasa_sdk's Tracker with the parts the actions read"""
+
+    def __init__(self, sender_id: str, slots: Dict[str, Any], entities: Dict[str, Any], text: str = ''):
+        self.sender_id = sender_id
+        self.slots = dict(slots)
+        self.latest_message = {
+            'text': text,
+            'entities': [{'entity': name, 'value': value} for name, value in entities.items()],
+        }
+
+    def get_slot(self, key: str) -> Optional[Any]:
+        return self.slots.get(key)
+
+    def current_slot_values(self) -> Dict[str, Any]:
+        return self.slots
+
+    def get_latest_entity_values(self, entity_type: str, entity_role: Optional[str] = None,
+                                 entity_group: Optional[str] = None) -> Iterator[str]:
+        return (entity['value'] for entity in self.latest_message['entities']
+                if entity['entity'] == entity_type)
+
+
+class StubDispatcher:
+    """Stand-in for CollectingDispatcher that keeps the uttered messages"""
+
+    def __init__(self):
+        self.messages: List[Dict[str, Any]] = []
+
+    def utter_message(self, text: Optional[str] = None, **kwargs) -> None:
+        self.messages.append(dict(kwargs, text=text))
+
+
+def registered_actions(module_name: str = 'actions.actions') -> Dict[str, Any]:
+    """Instances of every custom action defined in ``module_name``, by action name"""
+    from rasa_sdk import Action
+    module = importlib.import_module(module_name)
+    actions = {}
+    for _, cls in inspect.getmembers(module, inspect.isclass):
+        if issubclass(cls, Action) and cls is not Action and cls.__module__ == module.__name__:
+            action = cls()
+            actions[action.name()] = action
+    return actions
+
+
+def _step_entities(step: Dict[str, Any]) -> Dict[str, Any]:
+    entities = {}
+    for entity in step.get('entities') or []:
+        if isinstance(entity, dict):
+            entities.update(entity)
+    return entities
+
+
+def load_stories(path: str, action_names: List[str]) -> List[List[Dict[str, Any]]]:
+    """Conversations from a Rasa stories file; only custom action steps become turns"""
+    with open(path, 'r', encoding='utf-8') as f:
+        stories = (yaml.safe_load(f) or {}).get('stories') or []
+    conversations = []
+    for story in stories:
+        turns = []
+        slots: Dict[str, Any] = {}
+        entities: Dict[str, Any] = {}
+        for step in story.get('steps') or []:
+            if 'intent' in step:
+                entities = _step_entities(step)
+                slots.update(entities)
+            elif 'slot_was_set' in step:
+                for slot in step['slot_was_set']:
+                    if isinstance(slot, dict):
+                        slots.update(slot)
+            elif step.get('action') in action_names:
+                turns.append({'action': step['action'], 'entities': dict(entities), 'slots': dict(slots),
+                              'text': step.get('user', '')})
+        if turns:
+            conversations.append(turns)
+    return conversations
+
+
+def _misspell(name: str, rng: random.Random) -> str:
+    if len(name) < 5:
+        return name
+    position = rng.randrange(len(name))
+    return name[:position] + name[position + 1:]
+
+
+def generate_conversations(catalog: Dict[str, Any], count: int, seed: int = 0,
+                           turns: int = 4) -> List[List[Dict[str, Any]]]:
+    """Synthetic conversations mixing exact, misspelled and partial product/service names"""
+    rng = random.Random(seed)
+    products = [p['name'] for p in catalog.get('products', [])]
+    services = [s['name'] for s in catalog.get('services', [])]
+    conversations = []
+    for _ in range(count):
+        conversation = []
+        slots: Dict[str, Any] = {}
+        for _ in range(turns):
+            kind = rng.choice(['product', 'product', 'service', 'products', 'services', 'price'])
+            if kind in ('products', 'services'):
+                conversation.append({'action': f'action_show_{kind}', 'entities': {}, 'slots': dict(slots)})
+                continue
+            names = services if kind == 'service' else products
+            if not names:
+                continue
+            name = rng.choice(names)
+            variant = rng.random()
+            if variant < 0.25:
+                name = _misspell(name, rng)
+            elif variant < 0.5:
+                name = ' '.join(name.split()[:2])
+            entity = 'service' if kind == 'service' else 'product'
+            slots[entity] = name
+            action = 'action_show_price' if kind == 'price' else f'action_{entity}_info'
+            conversation.append({'action': action, 'entities': {entity: name}, 'slots': dict(slots)})
+        conversations.append(conversation)
+    return conversations
+
+
+def _rss_mb() -> float:
+    """Current resident set size (falls back to the peak where /proc is missing)"""
+    try:
+        with open('/proc/self/statm', 'r') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE') / 1e6
+    except (OSError, ValueError):
+        return _peak_rss_mb()
+
+
+def _peak_rss_mb() -> float:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss está en KB en Linux y en bytes en macOS
+    return peak / 1e6 if sys.platform == 'darwin' else peak / 1e3
+
+
+def _percentile(sorted_values: List[float], percent: float) -> float:
+    """Nearest-rank percentile of an already sorted list"""
+    if not sorted_values:
+        return 0.0
+    rank = max(0, math.ceil(percent / 100 * len(sorted_values)) - 1)
+    return sorted_values[rank]
+
+
+def run_load(actions: Dict[str, Any], conversations: List[List[Dict[str, Any]]],
+             concurrency: int = 8) -> Dict[str, Any]:
+    """Replay every conversation (turns in order) with ``concurrency`` conversations at a time"""
+    samples: Dict[str, List[float]] = {name: [] for name in actions}
+    rss_growth: Dict[str, List[float]] = {name: [] for name in actions}
+    errors: Dict[str, int] = {name: 0 for name in actions}
+    lock = threading.Lock()
+
+    def replay(index: int, conversation: List[Dict[str, Any]]) -> None:
+        for turn in conversation:
+            action = actions.get(turn['action'])
+            if action is None:
+                continue
+            tracker = StubTracker(f'load-{index}', turn.get('slots', {}), turn.get('entities', {}),
+                                  turn.get('text', ''))
+            dispatcher = StubDispatcher()
+            rss_before = _rss_mb()
+            start = time.perf_counter()
+            try:
+                action.run(dispatcher, tracker, {})
+                failed = False
+            except Exception as e:
+                failed = True
+                print(f"Error en {turn['action']}: {e}")
+            elapsed = time.perf_counter() - start
+            growth = _rss_mb() - rss_before
+            with lock:
+                samples[turn['action']].append(elapsed)
+                rss_growth[turn['action']].append(growth)
+                errors[turn['action']] += failed
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        for future in [executor.submit(replay, i, c) for i, c in enumerate(conversations)]:
+            future.result()
+    wall = time.perf_counter() - start
+
+    per_action = {}
+    for name, latencies in samples.items():
+        if not latencies:
+            continue
+        latencies.sort()
+        per_action[name] = {
+            'calls': len(latencies),
+            'errors': errors[name],
+            'p50_ms': round(_percentile(latencies, 50) * 1000, 3),
+            'p95_ms': round(_percentile(latencies, 95) * 1000, 3),
+            'p99_ms': round(_percentile(latencies, 99) * 1000, 3),
+            'max_ms': round(latencies[-1] * 1000, 3),
+            'calls_per_sec': round(len(latencies) / wall, 1),
+            # Lo que creció el RSS del proceso durante las llamadas de esta acción
+            'rss_growth_mb': round(sum(max(0.0, growth) for growth in rss_growth[name]), 3),
+            'max_call_rss_growth_mb': round(max(rss_growth[name]), 3),
+        }
+    total_calls = sum(stats['calls'] for stats in per_action.values())
+    return {
+        'conversations': len(conversations),
+        'concurrency': concurrency,
+        'calls': total_calls,
+        'wall_seconds': round(wall, 3),
+        'calls_per_sec': round(total_calls / wall, 1) if wall else None,
+        'peak_rss_mb': round(_peak_rss_mb(), 1),
+        'actions': per_action,
+    }
+
+
+def prepare_catalog(catalog: Dict[str, Any], backend: str, directory: str) -> str:
+    """Persist ``catalog`` the way ``backend`` is served and return the data path"""
+    if backend == 'sqlite':
+        path = os.path.join(directory, 'load_test.db')
+        SqliteDataSource(path).save_data(catalog)
+        return path
+    path = os.path.join(directory, 'load_test.json')
+    JsonDataSource(path, snapshot_path=snapshot_path_for(path) if backend == 'mmap' else None).save_data(catalog)
+    return path
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--products', type=int, default=10000, help='productos del catálogo sintético')
+    parser.add_argument('--data', help='catálogo JSON existente en lugar del sintético')
+    parser.add_argument('--backend', choices=BACKENDS, default='mmap')
+    parser.add_argument('--stories', help='historias a reproducir (por defecto conversaciones generadas)')
+    parser.add_argument('--conversations', type=int, default=500)
+    parser.add_argument('--repeat', type=int, default=1, help='veces que se reproduce cada conversación')
+    parser.add_argument('--concurrency', type=int, default=8)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--actions-module', default='actions.actions')
+    parser.add_argument('--output', help='guardar el reporte en JSON')
+    args = parser.parse_args()
+
+    if args.data:
+        # Snapshot más el log de cambios, sin la clave interna _version
+        catalog = JsonDataSource(args.data, read_only=True).load_data()
+        if not catalog.get('products') and not catalog.get('services'):
+            parser.error(f"{args.data} has no published catalog")
+    else:
+        catalog = generate_catalog(args.products, seed=args.seed)
+
+    actions_module = importlib.import_module(args.actions_module)
+    actions = registered_actions(args.actions_module)
+    if args.stories:
+        conversations = load_stories(args.stories, list(actions))
+        if not conversations:
+            print(f"{args.stories} has no steps running custom actions ({', '.join(sorted(actions))})")
+            return
+    else:
+        conversations = generate_conversations(catalog, args.conversations, args.seed)
+    conversations = conversations * args.repeat
+
+    with tempfile.TemporaryDirectory() as tmp:
+        actions_module.COMPANY_DATA_PATH = prepare_catalog(catalog, args.backend, tmp)
+        report = run_load(actions, conversations, args.concurrency)
+    report['backend'] = args.backend
+    report['products'] = len(catalog.get('products', []))
+
+    print(f"{report['conversations']} conversations, {report['calls']} calls, concurrency "
+          f"{report['concurrency']}, backend {args.backend}: {report['calls_per_sec']} calls/s, "
+          f"peak RSS {report['peak_rss_mb']} MB")
+    for name, stats in sorted(report['actions'].items()):
+        print(f"  {name:<22} {stats['calls']:>6} calls  p50 {stats['p50_ms']:8.3f}ms  "
+              f"p95 {stats['p95_ms']:8.3f}ms  p99 {stats['p99_ms']:8.3f}ms  "
+              f"{stats['calls_per_sec']:8.1f}/s  RSS growth +{stats['rss_growth_mb']} MB"
+              + (f"  errors {stats['errors']}" if stats['errors'] else ''))
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=4)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,125 @@
+# rasa-chatbot/benchmarks/local_server.py
+"""
+Servidor HTTP local que imita el sitio de una compañía (formato de CompanyAScraper)
+para medir y probar los scrapers sin salir a la red.
+"""
+
+import gzip
+import hashlib
+import threading
+import time
+from html import escape
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional
+from urllib.parse import parse_qs, urlsplit
+
+
+def render_catalog_page(kind: str, page: int, per_page: int, pages: int = 1) -> str:
+    """Render one page of product or service cards, linking to the next page"""
+    cards = []
+    for i in range((page - 1) * per_page, page * per_page):
+        if kind == 'products':
+            cards.append(
+                f'<div class="product-card" data-id="p{i}">'
+                f'<h2>{escape(f"Producto {i}")}</h2>'
+                f'<p class="description">Descripción del producto {i}</p>'
+                f'<span class="price">${i % 1000}.{i % 100:02d}</span>'
+                f'<span class="category">Categoría {i % 20}</span>'
+                f'</div>'
+            )
+        else:
+            cards.append(
+                f'<div class="service-card" data-id="s{i}">'
+                f'<h2>{escape(f"Servicio {i}")}</h2>'
+                f'<p class="description">Descripción del servicio {i}</p>'
+                f'<span class="price">${i % 500}.{i % 100:02d}</span>'
+                f'<span class="duration">{i % 8 + 1} horas</span>'
+                f'</div>'
+            )
+    pager = f'<a rel="next" href="/{kind}?page={page + 1}">Siguiente</a>' if page < pages else ''
+    return (
+        '<html><head><title>Catálogo</title></head><body>'
+        '<nav><a href="/">Inicio</a></nav>'
+        f'<main>{"".join(cards)}</main>{pager}'
+        '<footer>Company A</footer></body></html>'
+    )
+
+
+class CatalogSiteServer:
+    """Threaded stand-in for a company website with artificial latency.
+
+    ``bandwidth`` (bytes/s) slows the body down like a real download and
+    ``compress`` gzips it for clients that accept gzip.
+    """
+
+    CHUNK_SIZE = 16 * 1024
+
+    def __init__(self, latency: float = 0.05, per_page: int = 50, pages: int = 1,
+                 bandwidth: Optional[float] = None, compress: bool = False):
+        self.latency = latency
+        self.per_page = per_page
+        self.pages = pages
+        self.bandwidth = bandwidth
+        self.compress = compress
+        self.requests_served = 0
+        self._server = ThreadingHTTPServer(('127.0.0.1', 0), self._make_handler())
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f'http://{host}:{port}'
+
+    def __enter__(self) -> 'CatalogSiteServer':
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def _make_handler(self):
+        site = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                site.requests_served += 1
+                parts = urlsplit(self.path)
+                kind = parts.path.strip('/')
+                if kind not in ('products', 'services'):
+                    self.send_error(404)
+                    return
+                page = int(parse_qs(parts.query).get('page', ['1'])[0])
+                if page > site.pages:
+                    self.send_error(404)
+                    return
+                time.sleep(site.latency)
+                body = render_catalog_page(kind, page, site.per_page, site.pages).encode('utf-8')
+                etag = f'"{hashlib.sha1(body).hexdigest()}"'
+                if self.headers.get('If-None-Match') == etag:
+                    self.send_response(304)
+                    self.send_header('ETag', etag)
+                    self.end_headers()
+                    return
+                self.send_response(200)
+                self.send_header('ETag', etag)
+                self.send_header('Content-Type', 'text/html; charset=utf-8')
+                if site.compress and 'gzip' in self.headers.get('Accept-Encoding', ''):
+                    body = gzip.compress(body)
+                    self.send_header('Content-Encoding', 'gzip')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                if not site.bandwidth:
+                    self.wfile.write(body)
+                    return
+                for start in range(0, len(body), site.CHUNK_SIZE):
+                    chunk = body[start:start + site.CHUNK_SIZE]
+                    self.wfile.write(chunk)
+                    self.wfile.flush()
+                    time.sleep(len(chunk) / site.bandwidth)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
@@ -0,0 +1,263 @@
+# rasa-chatbot/benchmarks/run_suite.py
+"""
+Suite de micro-benchmarks sobre catálogos sintéticos (benchmarks.catalog_generator):
+JsonDataSource (save/load/update), generadores de nlu/domain/stories, _clean_price,
+parseo de páginas de catálogo y latencia de búsqueda de las acciones con cada
+backend (CatalogIndex, MmapCatalog, SQLite).
+
+Los resultados se guardan en JSON junto con el commit, para comparar corridas
+entre commits con --compare.
+
+Uso: python -m benchmarks.run_suite --sizes 1000,10000,100000 [--compare benchmarks/results/<otro>.json]
+"""
+
+import argparse
+import io
+import json
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from html import escape
+from typing import Dict, Any, Callable, List, Optional
+
+os.environ.setdefault('HTTP_CACHE_ENABLED', '0')
+
+from benchmarks.catalog_generator import generate_catalog
+from src.domain.services.catalog_index import CatalogIndex
+from src.infrastructure.data_sources.json_data_source import JsonDataSource
+from src.infrastructure.data_sources.mmap_catalog import MmapCatalog, write_catalog_snapshot
+from src.infrastructure.data_sources.sqlite_data_source import SqliteDataSource
+from src.infrastructure.rasa_integration.domain_generator import generate_domain_yaml
+from src.infrastructure.rasa_integration.nlu_generator import write_nlu_yaml
+from src.infrastructure.rasa_integration.stories_generator import generate_stories_yaml
+from src.infrastructure.scrapers.company_a_scraper import CompanyAScraper
+
+RESULTS_DIR = os.path.join(os.path.dirname(__file__), 'results')
+LOOKUP_QUERIES = 500
+# Candidatos difusos que piden las acciones cuando no hay coincidencia exacta
+RESOLVE_LIMIT = 3
+
+
+def _best_of(fn: Callable[[], Any], repeat: int, setup: Optional[Callable[[], Any]] = None) -> float:
+    best = float('inf')
+    for _ in range(repeat):
+        if setup is not None:
+            setup()
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def _result(group: str, name: str, size: int, seconds: float, ops: int = 1, **extra) -> Dict[str, Any]:
+    result = {'group': group, 'name': name, 'size': size, 'seconds': round(seconds, 6),
+              'ops_per_sec': round(ops / seconds, 1) if seconds else None}
+    result.update(extra)
+    return result
+
+
+def render_cards(products: List[Dict[str, Any]]) -> str:
+    """Catalog page in CompanyAScraper's markup for the given products"""
+    cards = ''.join(
+        f'<div class="product-card" data-id="{escape(p["id"])}">'
+        f'<h2>{escape(p["name"])}</h2>'
+        f'<p class="description">{escape(p["description"])}</p>'
+        f'<span class="price">${p["price"]:.2f}</span>'
+        f'<span class="category">{escape(p["category"])}</span>'
+        f'</div>'
+        for p in products
+    )
+    return f'<html><body><nav><a href="/">Inicio</a></nav><main>{cards}</main></body></html>'
+
+
+def lookup_queries(catalog: Dict[str, Any], count: int, seed: int = 0) -> List[str]:
+    """Mix of what users type: exact names, misspelled names and partial names"""
+    rng = random.Random(seed)
+    names = [p['name'] for p in catalog['products']]
+    queries = []
+    for i in range(count):
+        name = rng.choice(names)
+        if i % 4 == 0 and len(name) > 4:
+            position = rng.randrange(len(name))
+            name = name[:position] + name[position + 1:]    # letra faltante
+        elif i % 4 == 1:
+            name = ' '.join(name.split()[:2])               # nombre parcial
+        queries.append(name)
+    return queries
+
+
+def bench_data_source(catalog: Dict[str, Any], size: int, repeat: int, tmp: str) -> List[Dict[str, Any]]:
+    source = JsonDataSource(os.path.join(tmp, 'bench_data.json'))
+    results = [
+        _result('json_data_source', 'save_data', size, _best_of(lambda: source.save_data(catalog), repeat)),
+        _result('json_data_source', 'load_data', size, _best_of(source.load_data, repeat)),
+    ]
+    # Actualización típica de un scraping: cambia el precio del 1% de los productos
+    updated = dict(catalog)
+    updated['products'] = [dict(p, price=p['price'] + 1) if i % 100 == 0 else p
+                           for i, p in enumerate(catalog['products'])]
+    seconds = _best_of(lambda: source.update_data(updated), repeat, setup=lambda: source.save_data(catalog))
+    results.append(_result('json_data_source', 'update_data (1% changed)', size, seconds))
+    return results
+
+
+def bench_generators(catalog: Dict[str, Any], size: int, repeat: int) -> List[Dict[str, Any]]:
+    def nlu():
+        write_nlu_yaml(catalog, io.StringIO())
+    return [
+        _result('generators', 'write_nlu_yaml', size, _best_of(nlu, repeat)),
+        _result('generators', 'generate_domain_yaml', size,
+                _best_of(lambda: generate_domain_yaml(catalog), repeat)),
+        _result('generators', 'generate_stories_yaml', size,
+                _best_of(lambda: generate_stories_yaml(catalog), repeat)),
+    ]
+
+
+def bench_scraper(catalog: Dict[str, Any], size: int, repeat: int, max_cards: int) -> List[Dict[str, Any]]:
+    products = catalog['products'][:max_cards]
+    prices = [f"${p['price']:,.2f}" for p in catalog['products']]
+    markup = render_cards(products)
+    results = []
+    scraper = CompanyAScraper('http://localhost')
+    try:
+        def clean_prices():
+            for price in prices:
+                scraper._clean_price(price)
+        results.append(_result('scraper', '_clean_price', size, _best_of(clean_prices, repeat), len(prices)))
+
+        for parser, restricted in (('html.parser', False), ('lxml', True)):
+            scraper.parser = parser
+            scraper.restrict_to_cards = restricted
+
+            def parse():
+                soup = scraper._make_soup(markup, scraper.PRODUCT_CARDS)
+                assert sum(1 for _ in scraper._parse_products(soup)) == len(products)
+            label = f"parse {parser}{' + cards only' if restricted else ''}"
+            results.append(_result('scraper', label, len(products), _best_of(parse, repeat), len(products),
+                                   page_mb=round(len(markup) / 1e6, 2)))
+    finally:
+        scraper.close()
+    return results
+
+
+def _lookup(catalog, text: str) -> Optional[Dict[str, Any]]:
+    """Same path as ActionProductInfo: exact name, then fuzzy candidates"""
+    product = catalog.get_product_by_name(text)
+    if product is None:
+        catalog.resolve_product(text, limit=RESOLVE_LIMIT)
+    return product
+
+
+def bench_lookups(catalog: Dict[str, Any], size: int, tmp: str) -> List[Dict[str, Any]]:
+    queries = lookup_queries(catalog, LOOKUP_QUERIES)
+    snapshot_path = os.path.join(tmp, 'bench_data.catalog')
+    write_catalog_snapshot(catalog, snapshot_path)
+    sqlite = SqliteDataSource(os.path.join(tmp, 'bench_data.db'))
+    sqlite.save_data(catalog)
+
+    backends = [
+        ('CatalogIndex', lambda: CatalogIndex(catalog)),
+        ('MmapCatalog', lambda: MmapCatalog(snapshot_path)),
+        ('SqliteDataSource', lambda: sqlite),
+    ]
+    results = []
+    for name, open_backend in backends:
+        start = time.perf_counter()
+        backend = open_backend()
+        if hasattr(backend, 'warm_up'):
+            backend.warm_up()
+        warm_up = time.perf_counter() - start
+
+        latencies = []
+        for query in queries:
+            start = time.perf_counter()
+            _lookup(backend, query)
+            latencies.append(time.perf_counter() - start)
+        latencies.sort()
+        results.append(_result(
+            'action_lookup', name, size, sum(latencies), len(latencies),
+            warm_up_seconds=round(warm_up, 4),
+            p50_ms=round(latencies[len(latencies) // 2] * 1000, 3),
+            p95_ms=round(latencies[int(len(latencies) * 0.95)] * 1000, 3),
+            mean_ms=round(statistics.mean(latencies) * 1000, 3),
+        ))
+    return results
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True,
+                              check=True, cwd=os.path.dirname(__file__)).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run(sizes: List[int], repeat: int = 3, seed: int = 0, max_cards: int = 5000) -> Dict[str, Any]:
+    results = []
+    for size in sizes:
+        catalog = generate_catalog(size, seed=seed)
+        print(f"{size} products, {len(catalog['services'])} services")
+        with tempfile.TemporaryDirectory() as tmp:
+            for bench in (lambda: bench_data_source(catalog, size, repeat, tmp),
+                          lambda: bench_generators(catalog, size, repeat),
+                          lambda: bench_scraper(catalog, size, repeat, max_cards),
+                          lambda: bench_lookups(catalog, size, tmp)):
+                for result in bench():
+                    print(f"  {result['group']:>16} {result['name']:<28} {result['seconds']:10.4f}s")
+                    results.append(result)
+    return {
+        'commit': _git_commit(),
+        'timestamp': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'python': sys.version.split()[0],
+        'platform': platform.platform(),
+        'seed': seed,
+        'repeat': repeat,
+        'results': results,
+    }
+
+
+def compare(current: Dict[str, Any], previous: Dict[str, Any]) -> None:
+    """Print the time ratio of every benchmark present in both runs"""
+    before = {(r['group'], r['name'], r['size']): r['seconds'] for r in previous['results']}
+    print(f"\n{previous.get('commit')} -> {current.get('commit')}")
+    for result in current['results']:
+        old = before.get((result['group'], result['name'], result['size']))
+        if old:
+            print(f"  {result['group']:>16} {result['name']:<28} {result['size']:>8}  "
+                  f"{old:10.4f}s -> {result['seconds']:10.4f}s  (x{old / result['seconds']:.2f})")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--sizes', default='1000,10000,100000',
+                        help='tamaños de catálogo separados por coma (hasta 1000000)')
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--max-cards', type=int, default=5000, help='tarjetas por página a parsear')
+    parser.add_argument('--output', help='archivo JSON de resultados (por defecto en benchmarks/results/)')
+    parser.add_argument('--compare', help='resultados anteriores contra los que comparar')
+    args = parser.parse_args()
+
+    report = run([int(size) for size in args.sizes.split(',')], args.repeat, args.seed, args.max_cards)
+    output = args.output
+    if output is None:
+        os.makedirs(RESULTS_DIR, exist_ok=True)
+        stamp = report['timestamp'].replace(':', '').replace('-', '')[:15]
+        output = os.path.join(RESULTS_DIR, f"{stamp}_{report['commit'] or 'nogit'}.json")
+    with open(output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=4)
+    print(f"Results -> {output}")
+
+    if args.compare:
+        with open(args.compare, 'r', encoding='utf-8') as f:
+            compare(report, json.load(f))
+
+
+if __name__ == '__main__':
+    main()
@@ -6,13 +6,22 @@ Integra la arquitectura Clean con Rasa existente
 
 import os                   # Asegúrate de que el entorno virtual esté activado
 import sys                  # Para modificar el path de importación
+import time
+import argparse
 from pathlib import Path    # Para manejar rutas de archivos
+from typing import Dict, Any, List, Optional, Tuple
+from concurrent.futures import ProcessPoolExecutor, as_completed
 
 # Agregar src al path para imports
 sys.path.append(str(Path(__file__).parent / "src"))
 
 from src.config.company_config import CompanyRegistry
+from src.config.settings import Settings
 from src.infrastructure.data_sources.json_data_source import JsonDataSource
+from src.infrastructure.data_sources.mmap_catalog import snapshot_path_for
+from src.application.use_cases.scrape_company_data import ScrapeCompanyDataUseCase
+from src.infrastructure.monitoring.metrics import metrics
+from src.infrastructure.monitoring.profiler import MODES as PROFILE_MODES, profiler
 
 
 class ChatbotManager:
@@ -20,49 +29,243 @@ class ChatbotManager:
     
     def __init__(self, company_id: str):
         self.company_config = CompanyRegistry.get_company_config(company_id)
-        self.data_source = JsonDataSource(
-            os.path.join('data', f'{company_id}_data.json')
-        )
+        data_path = os.path.join('data', f'{company_id}_data.json')
+        # Cada publicación regenera el snapshot binario que mapea el servidor de acciones
+        self.data_source = JsonDataSource(data_path, snapshot_path=snapshot_path_for(data_path))
     
     def update_company_data(self) -> None:
         """Update company data from website"""
-        scraper = self.company_config.scraper_class(self.company_config.website)
+        scraper = self.company_config.create_scraper()
         
-        company_data = {
-            'products': scraper.scrape_products(),
-            'services': scraper.scrape_services(),
-            'name': self.company_config.name,
-            'website': self.company_config.website
-        }
+        # Los items se escriben a medida que llegan (memoria constante)
+        counts = ScrapeCompanyDataUseCase(scraper, self.data_source).execute(
+            self.company_config.name, self.company_config.website
+        )
+        print(f"Scraped {counts['products']} products and {counts['services']} services")
+        http_cache = getattr(scraper, 'http_cache', None)
+        if http_cache is not None:
+            print(http_cache.stats.report())
         
-        self.data_source.save_data(company_data)
         print(f"Updated data for {self.company_config.name}")
 
 
-def main():
-    """Main entry point"""
-    # Ejemplo de uso
-    company_id = 'company_a'  # Este ID debe coincidir con los registrados en CompanyRegistry
+def refresh_company(company_id: str, output_dir: str, collect_metrics: bool = False,
+                    profile: Optional[Tuple[str, List[str]]] = None) -> Dict[str, Any]:
+    """Scrape, save and generate training files for one company.
+    
+    Runs inside a worker process of ``refresh-all``; errors are returned
+    instead of raised so one failing tenant does not stop the others.
+    With ``collect_metrics`` the worker's metrics are returned in the
+    result so the parent process can merge them. ``profile`` is the
+    (directory, modes) of ``--profile``; each company gets a subdirectory.
+    """
+    result = {'company_id': company_id, 'ok': False, 'error': None, 'retrain_needed': None, 'timings': {}}
+    if collect_metrics:
+        metrics.enabled = True
+        metrics.reset()
+    if profile is not None:
+        profiler.configure(os.path.join(profile[0], company_id), profile[1])
+    metrics.set_labels(company=company_id)
+    start = time.perf_counter()
+    try:
+        manager = ChatbotManager(company_id)
+        
+        stage_start = time.perf_counter()
+        with profiler.stage('update_company_data'):
+            manager.update_company_data()
+        result['timings']['scrape'] = time.perf_counter() - stage_start
+        
+        from src.domain.services.chatbot_orchestrator import ChatbotOrchestrator
+        stage_start = time.perf_counter()
+        training_files = ChatbotOrchestrator(
+            manager.data_source, manager.company_config.nlu
+        ).generate_training_files(output_dir)
+        result['timings']['training_files'] = time.perf_counter() - stage_start
+        result['retrain_needed'] = training_files.retrain_needed
+        
+        result['ok'] = True
+    except Exception as e:
+        result['error'] = f"{type(e).__name__}: {e}"
+        metrics.inc('refresh_failures_total')
+    result['timings']['total'] = time.perf_counter() - start
+    for stage, seconds in result['timings'].items():
+        metrics.observe('pipeline_stage_seconds', seconds, stage=stage)
+    if metrics.enabled:
+        result['metrics'] = metrics.snapshot()
+    profiler.save()
+    return result
+
+
+def refresh_all(max_workers: int, profile: Optional[Tuple[str, List[str]]] = None) -> List[Dict[str, Any]]:
+    """Refresh every registered company in a process pool"""
+    results = []
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            executor.submit(refresh_company, company_id, os.path.join('data', company_id),
+                            metrics.enabled, profile): company_id
+            for company_id in CompanyRegistry.company_ids()
+        }
+        for future in as_completed(futures):
+            try:
+                result = future.result()
+            except Exception as e:
+                # El proceso del worker murió (p.ej. sin memoria)
+                result = {'company_id': futures[future], 'ok': False,
+                          'error': f"{type(e).__name__}: {e}", 'timings': {}}
+            if result['ok']:
+                status = 'ok, retrain needed' if result.get('retrain_needed') else 'ok, training data unchanged'
+            else:
+                status = f"FAILED ({result['error']})"
+            print(f"[{result['company_id']}] {status}")
+            if 'metrics' in result:
+                metrics.merge(result.pop('metrics'))
+            results.append(result)
+    
+    wall_time = time.perf_counter() - start
+    print_refresh_summary(results, wall_time)
+    write_metrics('refresh-all', wall_seconds=round(wall_time, 3), companies=results)
+    return results
+
+
+def print_refresh_summary(results: List[Dict[str, Any]], wall_time: float) -> None:
+    """Print a per-company timing table"""
+    print(f"\n{'company':<20} {'status':<8} {'scrape':>9} {'training':>9} {'total':>9}")
+    for result in sorted(results, key=lambda r: r['company_id']):
+        timings = result['timings']
+        columns = [timings.get(key) for key in ('scrape', 'training_files', 'total')]
+        cells = ' '.join(f"{t:>8.2f}s" if t is not None else f"{'-':>9}" for t in columns)
+        print(f"{result['company_id']:<20} {'ok' if result['ok'] else 'failed':<8} {cells}")
+    failed = sum(1 for r in results if not r['ok'])
+    print(f"{len(results)} companies, {failed} failed, wall time {wall_time:.2f}s")
+
+
+def write_metrics(command: str, **report: Any) -> None:
+    """Write the Prometheus text file and the JSON run report (only with metrics enabled)"""
+    if not metrics.enabled:
+        return
+    metrics_dir = Path(Settings.METRICS_DIR)
+    metrics.write_prometheus(str(metrics_dir / 'chatbot.prom'))
+    metrics.write_report(str(metrics_dir / 'last_run.json'), command=command,
+                         finished_at=time.strftime('%Y-%m-%dT%H:%M:%S%z'), **report)
+    print(f"Metrics written to {metrics_dir}")
+
+
+def train_chatbot(training_files, training_dir: str, dry_run: bool) -> None:
+    """Skip, finetune or retrain the Rasa model for the files generated in ``training_dir``"""
+    from src.application.use_cases.train_chatbot import TrainChatbotUseCase
+    from src.domain.services.training_service import TrainingService
+    from src.infrastructure.rasa_integration.rasa_trainer import RasaCliTrainer
     
+    use_case = TrainChatbotUseCase(
+        RasaCliTrainer(data_dir=training_dir, models_dir='models'),
+        TrainingService(os.path.join('data', '.training_state.json'))
+    )
+    result = use_case.execute(training_files, dry_run=dry_run)
+    expected = f" (usually {result['expected_seconds']:.0f}s)" if result['expected_seconds'] else ''
+    if dry_run:
+        print(f"Training plan: {result['mode']}{expected} - {result['reason']}")
+        if result['mode'] != 'skip':
+            print("To train the model, run: python main.py refresh --train")
+    elif result['mode'] == 'skip':
+        print(f"Training skipped: {result['reason']}")
+    else:
+        print(f"Trained ({result['mode']}, {result['reason']}) in {result['seconds']:.1f}s: {result['model']}")
+
+
+def run_single(company_id: str, train: bool = False) -> None:
+    """Refresh data and training files for a single company"""
+    metrics.set_labels(company=company_id)
+    start = time.perf_counter()
+    ok = False
     try:
         # Inicializar el manager
         manager = ChatbotManager(company_id)
         
         # Actualizar datos de la compañía
-        manager.update_company_data()
+        with metrics.timer('pipeline_stage_seconds', stage='scrape'), profiler.stage('update_company_data'):
+            manager.update_company_data()
         print("Data update completed successfully")
         
-        # Generar archivos de entrenamiento
+        # Generar archivos de entrenamiento (incluido el domain.yml que usa rasa train)
         from src.domain.services.chatbot_orchestrator import ChatbotOrchestrator
-        orchestrator = ChatbotOrchestrator(manager.data_source)
-        orchestrator.generate_training_files('data')
+        training_dir = 'data'
+        orchestrator = ChatbotOrchestrator(manager.data_source, manager.company_config.nlu)
+        with metrics.timer('pipeline_stage_seconds', stage='training_files'):
+            training_files = orchestrator.generate_training_files(training_dir)
         print("Training files generated successfully")
         
-        # Aquí podrías agregar el comando para entrenar el modelo
-        print("To train the model, run: rasa train")
+        # Entrenar solo lo necesario (o mostrar el plan)
+        with metrics.timer('pipeline_stage_seconds', stage='train'):
+            train_chatbot(training_files, training_dir, dry_run=not train)
+        ok = True
         
     except Exception as e:
+        metrics.inc('refresh_failures_total')
         print(f"Error: {str(e)}")
+    profile_dir = profiler.save()
+    if profile_dir:
+        print(f"Profiles written to {profile_dir}")
+    write_metrics('refresh', company_id=company_id, ok=ok,
+                  wall_seconds=round(time.perf_counter() - start, 3))
+
+
+def migrate_sqlite(data_dir: str) -> None:
+    """Convert every ``*_data.json`` catalog in ``data_dir`` to SQLite (``*_data.db``)"""
+    from src.infrastructure.data_sources.sqlite_data_source import migrate_json_to_sqlite
+    for json_path in sorted(Path(data_dir).glob('*_data.json')):
+        db_path = json_path.with_suffix('.db')
+        try:
+            counts = migrate_json_to_sqlite(str(json_path), str(db_path))
+            print(f"{json_path} -> {db_path}: "
+                  f"{counts.get('products', 0)} products, {counts.get('services', 0)} services")
+        except Exception as e:
+            print(f"Error migrating {json_path}: {str(e)}")
+
+
+def main():
+    """Main entry point"""
+    parser = argparse.ArgumentParser(description="Chatbot data refresh")
+    parser.add_argument('--metrics', action='store_true',
+                        help=f'write metrics to {Settings.METRICS_DIR} (also METRICS_ENABLED=1)')
+    parser.add_argument('--profile', action='store_true',
+                        help='profile each stage (.pstats, collapsed stacks, tracemalloc peaks); '
+                             'renders every training file so all generators are profiled')
+    parser.add_argument('--profile-modes', default=','.join(PROFILE_MODES),
+                        help=f"comma-separated subset of {', '.join(PROFILE_MODES)}")
+    parser.add_argument('--profile-dir', help='where to write the profiles (default: data/profiles/<timestamp>)')
+    subparsers = parser.add_subparsers(dest='command')
+    
+    refresh_parser = subparsers.add_parser('refresh', help='refresh one company (default)')
+    # Este ID debe coincidir con los registrados en CompanyRegistry
+    refresh_parser.add_argument('--company', default='company_a')
+    refresh_parser.add_argument('--train', action='store_true',
+                                help='skip, finetune or retrain the model as needed')
+    
+    refresh_all_parser = subparsers.add_parser('refresh-all', help='refresh every registered company')
+    refresh_all_parser.add_argument('--workers', type=int, default=min(4, os.cpu_count() or 1),
+                                    help='max companies refreshed at the same time')
+    
+    migrate_parser = subparsers.add_parser('migrate-sqlite', help='convert the JSON catalogs to SQLite')
+    migrate_parser.add_argument('--data-dir', default='data')
+    
+    args = parser.parse_args()
+    if args.metrics:
+        metrics.enabled = True
+    profile = None
+    if args.profile:
+        profile_dir = args.profile_dir or os.path.join('data', 'profiles', time.strftime('%Y%m%d-%H%M%S'))
+        profile = (profile_dir, [mode.strip() for mode in args.profile_modes.split(',') if mode.strip()])
+    
+    if args.command == 'migrate-sqlite':
+        migrate_sqlite(args.data_dir)
+    elif args.command == 'refresh-all':
+        results = refresh_all(args.workers, profile)
+        sys.exit(0 if all(r['ok'] for r in results) else 1)
+    else:
+        if profile is not None:
+            profiler.configure(*profile)
+        run_single(getattr(args, 'company', 'company_a'), getattr(args, 'train', False))
 
 
 if __name__ == "__main__":
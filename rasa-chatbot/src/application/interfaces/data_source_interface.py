@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Iterable, Optional
+from src.domain.services.catalog_index import normalize_name
 
 class DataSourceInterface(ABC):
     """Interface for data sources"""
@@ -17,4 +18,60 @@ class DataSourceInterface(ABC):
     @abstractmethod
     def update_data(self, data: Dict[str, Any]) -> None:
         """Update existing data in the data source"""
-        pass
\ No newline at end of file
+        pass
+    
+    def save_stream(self, data: Dict[str, Any],
+                    streams: Dict[str, Iterable[Dict[str, Any]]]) -> Dict[str, int]:
+        """Save ``data`` plus one list per entry of ``streams``, consuming the
+        iterables as items arrive. Returns the number of items per list.
+        
+        The default implementation materializes the lists; data sources that
+        can write incrementally should override it.
+        """
+        full_data = dict(data)
+        for key, items in streams.items():
+            full_data[key] = list(items)
+        self.save_data(full_data)
+        return {key: len(full_data[key]) for key in streams}
+    
+    def current_version(self) -> Optional[int]:
+        """Monotonic version of the stored data, or None if not tracked"""
+        return None
+    
+    def changes_since(self, version: int) -> Optional[List[Dict[str, Any]]]:
+        """Deltas published after ``version`` (oldest first), or None when
+        they are not available and the caller must reload everything"""
+        return None
+    
+    # Consultas opcionales. Las implementaciones por defecto recorren
+    # load_data(); los data sources con índices deberían sobrescribirlas.
+    
+    def get_product_by_name(self, name: str) -> Optional[Dict[str, Any]]:
+        """Find a product by its (normalized) exact name"""
+        return self._find_by_name('products', name)
+    
+    def get_service_by_name(self, name: str) -> Optional[Dict[str, Any]]:
+        """Find a service by its (normalized) exact name"""
+        return self._find_by_name('services', name)
+    
+    def list_products_by_category(self, category: str, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Products of one category, in catalog order"""
+        found = [p for p in self.load_data().get('products', []) if p.get('category') == category]
+        return found if limit is None else found[:limit]
+    
+    def list_by_price_range(self, kind: str, min_price: float, max_price: float,
+                            limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Items of ``kind`` ('products' or 'services') priced within the range, cheapest first"""
+        found = sorted(
+            (item for item in self.load_data().get(kind, [])
+             if isinstance(item.get('price'), (int, float)) and min_price <= item['price'] <= max_price),
+            key=lambda item: item['price'],
+        )
+        return found if limit is None else found[:limit]
+    
+    def _find_by_name(self, kind: str, name: str) -> Optional[Dict[str, Any]]:
+        normalized = normalize_name(name)
+        for item in self.load_data().get(kind, []):
+            if normalize_name(str(item.get('name', ''))) == normalized:
+                return item
+        return None
\ No newline at end of file
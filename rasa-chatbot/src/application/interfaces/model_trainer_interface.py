@@ -0,0 +1,15 @@
+from abc import ABC, abstractmethod
+from typing import Optional
+
+class ModelTrainerInterface(ABC):
+    """Interface for chatbot model trainers"""
+    
+    @abstractmethod
+    def train(self, finetune_from: Optional[str] = None) -> str:
+        """Train a model (optionally finetuning ``finetune_from``) and return its path"""
+        pass
+    
+    @abstractmethod
+    def latest_model(self) -> Optional[str]:
+        """Path of the most recent trained model, or None"""
+        pass
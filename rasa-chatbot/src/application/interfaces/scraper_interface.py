@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Iterator
 
 class ScraperInterface(ABC):
     """Interface for web scrapers"""
@@ -12,4 +12,16 @@ class ScraperInterface(ABC):
     @abstractmethod
     def scrape_services(self) -> List[Dict[str, Any]]:
         """Scrape services data from the website"""
+        pass
+    
+    def iter_products(self) -> Iterator[Dict[str, Any]]:
+        """Yield products one by one as they are scraped"""
+        yield from self.scrape_products()
+    
+    def iter_services(self) -> Iterator[Dict[str, Any]]:
+        """Yield services one by one as they are scraped"""
+        yield from self.scrape_services()
+    
+    def close(self) -> None:
+        """Release network resources held by the scraper"""
         pass
\ No newline at end of file
@@ -0,0 +1,93 @@
+# rasa-chatbot/src/application/use_cases/scrape_company_data.py
+import queue
+import threading
+from typing import Dict, Any, Iterable, Iterator
+from src.application.interfaces.scraper_interface import ScraperInterface
+from src.application.interfaces.data_source_interface import DataSourceInterface
+
+_DONE = object()
+
+
+class _Prefetcher:
+    """Consume ``items`` in a background thread through a bounded buffer.
+
+    Lets a second scraper stream make progress while the first one is being
+    written, without ever holding more than ``buffer_size`` items. The thread
+    starts right away; ``close`` stops it (even if nothing was iterated),
+    closes ``items`` and waits for it, so the scraper can be closed after.
+    """
+
+    # Cada cuánto el productor bloqueado en un put() revisa si debe parar
+    POLL_SECONDS = 0.1
+
+    def __init__(self, items: Iterable[Dict[str, Any]], buffer_size: int):
+        self._items = items
+        self._buffer: queue.Queue = queue.Queue(maxsize=buffer_size)
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._produce, daemon=True)
+        self._thread.start()
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        while True:
+            item = self._buffer.get()
+            if item is _DONE:
+                return
+            if isinstance(item, BaseException):
+                raise item
+            yield item
+
+    def close(self) -> None:
+        self._stop.set()
+        # Liberar al productor si quedó bloqueado en un put()
+        while not self._buffer.empty():
+            self._buffer.get_nowait()
+        self._thread.join()
+
+    def _produce(self) -> None:
+        try:
+            for item in self._items:
+                if not self._put(item):
+                    return
+            self._put(_DONE)
+        except BaseException as e:
+            self._put(e)
+        finally:
+            # El generador se cierra en el hilo que lo estaba recorriendo
+            close = getattr(self._items, 'close', None)
+            if close is not None:
+                close()
+
+    def _put(self, value: Any) -> bool:
+        while not self._stop.is_set():
+            try:
+                self._buffer.put(value, timeout=self.POLL_SECONDS)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+
+class ScrapeCompanyDataUseCase:
+    """Scrape a company website and stream the items into a data source"""
+
+    def __init__(self, scraper: ScraperInterface, data_source: DataSourceInterface,
+                 buffer_size: int = 1000):
+        self.scraper = scraper
+        self.data_source = data_source
+        self.buffer_size = buffer_size
+
+    def execute(self, name: str, website: str) -> Dict[str, int]:
+        """Run the scraping pipeline; returns the number of items saved per list"""
+        services = _Prefetcher(self.scraper.iter_services(), self.buffer_size)
+        try:
+            return self.data_source.save_stream(
+                {'name': name, 'website': website},
+                {
+                    'products': self.scraper.iter_products(),
+                    'services': iter(services),
+                },
+            )
+        finally:
+            # El productor debe terminar antes de cerrar la sesión del scraper
+            services.close()
+            self.scraper.close()
@@ -0,0 +1,34 @@
+import time
+from typing import Dict, Any
+from src.application.interfaces.model_trainer_interface import ModelTrainerInterface
+from src.domain.services.chatbot_orchestrator import TrainingFilesResult
+from src.domain.services.training_service import FINETUNE, SKIP, TrainingService
+
+
+class TrainChatbotUseCase:
+    """Use case for training the chatbot after its training files were generated"""
+
+    def __init__(self, trainer: ModelTrainerInterface, training_service: TrainingService):
+        self.trainer = trainer
+        self.training_service = training_service
+
+    def execute(self, training_files: TrainingFilesResult, dry_run: bool = False) -> Dict[str, Any]:
+        """Skip, finetune or fully retrain depending on what changed.
+
+        With ``dry_run`` only the plan is returned (nothing is trained or recorded).
+        """
+        latest_model = self.trainer.latest_model()
+        plan = self.training_service.plan(training_files.hashes, training_files.nlu_schema, latest_model)
+        result = {'mode': plan.mode, 'reason': plan.reason, 'changed': plan.changed,
+                  'seconds': 0.0, 'model': latest_model,
+                  'expected_seconds': self.training_service.average_seconds(plan.mode)}
+        if dry_run:
+            return result
+
+        start = time.perf_counter()
+        if plan.mode != SKIP:
+            result['model'] = self.trainer.train(latest_model if plan.mode == FINETUNE else None)
+        result['seconds'] = time.perf_counter() - start
+        self.training_service.record(plan, result['seconds'], training_files.hashes,
+                                     training_files.nlu_schema, result['model'])
+        return result
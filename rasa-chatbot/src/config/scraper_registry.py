@@ -0,0 +1,53 @@
+# rasa-chatbot/src/config/scraper_registry.py
+import importlib
+import threading
+from typing import Dict, Type
+from src.application.interfaces.scraper_interface import ScraperInterface
+
+# Grupo de entry points donde paquetes externos pueden publicar scrapers
+ENTRY_POINT_GROUP = 'chatbot_ia.scrapers'
+
+_classes: Dict[str, Type[ScraperInterface]] = {}
+_lock = threading.Lock()
+
+
+def load_scraper_class(reference: str) -> Type[ScraperInterface]:
+    """Import the scraper class named by ``reference``, only on first use.
+
+    ``reference`` is a dotted path (``package.module:ClassName`` or
+    ``package.module.ClassName``) or the name of an entry point in the
+    ``chatbot_ia.scrapers`` group. Resolved classes are cached.
+    """
+    cls = _classes.get(reference)
+    if cls is not None:
+        return cls
+    with _lock:
+        cls = _classes.get(reference)
+        if cls is None:
+            cls = _resolve(reference)
+            if not (isinstance(cls, type) and issubclass(cls, ScraperInterface)):
+                raise TypeError(f"{reference} is not a ScraperInterface subclass")
+            _classes[reference] = cls
+    return cls
+
+
+def _resolve(reference: str) -> type:
+    if ':' in reference:
+        module_name, _, attribute = reference.partition(':')
+    elif '.' in reference:
+        module_name, _, attribute = reference.rpartition('.')
+    else:
+        return _from_entry_point(reference)
+    module = importlib.import_module(module_name)
+    try:
+        return getattr(module, attribute)
+    except AttributeError:
+        raise ImportError(f"{module_name} has no scraper {attribute}") from None
+
+
+def _from_entry_point(name: str) -> type:
+    from importlib.metadata import entry_points
+    matches = [ep for ep in entry_points(group=ENTRY_POINT_GROUP) if ep.name == name]
+    if not matches:
+        raise ImportError(f"No scraper named {name} (not a dotted path nor a '{ENTRY_POINT_GROUP}' entry point)")
+    return matches[0].load()
@@ -0,0 +1,37 @@
+# rasa-chatbot/src/config/settings.py
+import os
+from pathlib import Path
+
+class Settings:
+    """Configuraciones globales del sistema"""
+    
+    BASE_DIR = Path(__file__).parent.parent.parent
+    SRC_DIR = BASE_DIR / "src"
+    DATA_DIR = BASE_DIR / "data"
+    MODELS_DIR = BASE_DIR / "models"
+    
+    # Archivos y directorios con las compañías soportadas (separados por ':')
+    COMPANIES_CONFIG = [
+        Path(path) for path in os.getenv(
+            'COMPANIES_CONFIG', os.pathsep.join([str(BASE_DIR / "companies.yml"), str(BASE_DIR / "companies.d")])
+        ).split(os.pathsep) if path
+    ]
+    
+    # Configuración de scraping
+    SCRAPING_DELAY = float(os.getenv('SCRAPING_DELAY', '1.0'))
+    MAX_RETRIES = int(os.getenv('MAX_RETRIES', '3'))
+    # Tamaño máximo (descomprimido) de una página descargada en modo streaming
+    SCRAPING_MAX_RESPONSE_MB = float(os.getenv('SCRAPING_MAX_RESPONSE_MB', '50'))
+    
+    # Configuración de datos
+    DATA_EXPIRY_HOURS = int(os.getenv('DATA_EXPIRY_HOURS', '24'))
+    
+    # Caché HTTP del scraping (peticiones condicionales con ETag/Last-Modified)
+    HTTP_CACHE_ENABLED = os.getenv('HTTP_CACHE_ENABLED', '1') == '1'
+    HTTP_CACHE_DIR = Path(os.getenv('HTTP_CACHE_DIR', str(DATA_DIR / "http_cache")))
+    
+    # Métricas del pipeline (archivo de texto para Prometheus y reporte JSON)
+    METRICS_ENABLED = os.getenv('METRICS_ENABLED', '0') == '1'
+    METRICS_DIR = Path(os.getenv('METRICS_DIR', str(DATA_DIR / "metrics")))
+    # Cada cuántos segundos el servidor de acciones reescribe su archivo de métricas
+    METRICS_EXPORT_INTERVAL = float(os.getenv('METRICS_EXPORT_INTERVAL', '15'))
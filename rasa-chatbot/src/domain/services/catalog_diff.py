@@ -0,0 +1,107 @@
+# rasa-chatbot/src/domain/services/catalog_diff.py
+from typing import Dict, List, Any, Optional
+
+# Listas de items que se comparan por su 'id'
+ITEM_LISTS = ('products', 'services')
+
+
+def _index_by_id(items: List[Dict[str, Any]]) -> Optional[Dict[str, Dict[str, Any]]]:
+    """Map id -> item, or None when ids are missing or repeated"""
+    by_id = {}
+    for item in items:
+        item_id = item.get('id')
+        if not item_id or item_id in by_id:
+            return None
+        by_id[item_id] = item
+    return by_id
+
+
+def diff_items(old_items: List[Dict[str, Any]], new_items: List[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    """Diff two item lists keyed by 'id'.
+
+    Returns ``{'added': [...], 'removed': [ids], 'changed': [{'id', 'fields', 'unset'}],
+    'order': [ids]}`` (empty lists are omitted), or None if the lists cannot
+    be keyed by id. ``order`` is only present when the new list is not the
+    old order (minus removed items) followed by the added items.
+    """
+    old_by_id = _index_by_id(old_items)
+    new_by_id = _index_by_id(new_items)
+    if old_by_id is None or new_by_id is None:
+        return None
+
+    diff: Dict[str, Any] = {}
+    added = [item for item_id, item in new_by_id.items() if item_id not in old_by_id]
+    removed = [item_id for item_id in old_by_id if item_id not in new_by_id]
+    changed = []
+    for item_id, new_item in new_by_id.items():
+        old_item = old_by_id.get(item_id)
+        if old_item is None or old_item == new_item:
+            continue
+        change: Dict[str, Any] = {
+            'id': item_id,
+            'fields': {k: v for k, v in new_item.items() if old_item.get(k, object()) != v},
+        }
+        unset = [k for k in old_item if k not in new_item]
+        if unset:
+            change['unset'] = unset
+        changed.append(change)
+
+    if added:
+        diff['added'] = added
+    if removed:
+        diff['removed'] = removed
+    if changed:
+        diff['changed'] = changed
+    # Orden que dejaría apply_delta sin 'order': los que quedan y después los agregados
+    order = list(new_by_id)
+    kept = [item_id for item_id in old_by_id if item_id in new_by_id]
+    if order != kept + [item['id'] for item in added]:
+        diff['order'] = order
+    return diff
+
+
+def diff_catalog(old_data: Dict[str, Any], new_data: Dict[str, Any]) -> Dict[str, Any]:
+    """Diff the keys of ``new_data`` against ``old_data`` (``dict.update`` semantics).
+
+    Item lists are diffed per item; any other key that changed (or a list
+    without usable ids) is recorded whole under ``'set'``. An empty dict
+    means nothing changed.
+    """
+    delta: Dict[str, Any] = {}
+    for key, value in new_data.items():
+        old_value = old_data.get(key)
+        if key in ITEM_LISTS and isinstance(value, list) and isinstance(old_value, list):
+            items_diff = diff_items(old_value, value)
+            if items_diff is not None:
+                if items_diff:
+                    delta.setdefault('items', {})[key] = items_diff
+                continue
+        if key not in old_data or old_value != value:
+            delta.setdefault('set', {})[key] = value
+    return delta
+
+
+def apply_delta(data: Dict[str, Any], delta: Dict[str, Any]) -> Dict[str, Any]:
+    """Return a new catalog dict with ``delta`` applied (``data`` is not modified)"""
+    result = dict(data)
+    result.update(delta.get('set', {}))
+    for key, items_diff in delta.get('items', {}).items():
+        removed = set(items_diff.get('removed', []))
+        changes = {change['id']: change for change in items_diff.get('changed', [])}
+        items = []
+        for item in result.get(key, []):
+            item_id = item.get('id')
+            if item_id in removed:
+                continue
+            change = changes.get(item_id)
+            if change is not None:
+                item = {k: v for k, v in item.items() if k not in change.get('unset', ())}
+                item.update(change['fields'])
+            items.append(item)
+        items.extend(items_diff.get('added', []))
+        order = items_diff.get('order')
+        if order is not None:
+            position = {item_id: i for i, item_id in enumerate(order)}
+            items.sort(key=lambda item: position[item['id']])
+        result[key] = items
+    return result
@@ -0,0 +1,135 @@
+# rasa-chatbot/src/domain/services/catalog_index.py
+import unicodedata
+from bisect import bisect_left
+from typing import Dict, List, Any, Optional, Tuple
+
+
+def normalize_name(name: str) -> str:
+    """Normalize a product/service name for lookups.
+
+    Casefolds, strips accents (``"Cámara"`` -> ``"camara"``) and collapses
+    whitespace so user input and catalog names compare equal.
+    """
+    decomposed = unicodedata.normalize('NFKD', name)
+    stripped = ''.join(c for c in decomposed if not unicodedata.combining(c))
+    return ' '.join(stripped.casefold().split())
+
+
+class _NameIndex:
+    """Exact and word-prefix index over the names of a list of items"""
+
+    def __init__(self, items: List[Dict[str, Any]]):
+        self.items = items
+        self._fuzzy = None
+        self.by_name: Dict[str, Dict[str, Any]] = {}
+        entries = []
+        for position, item in enumerate(items):
+            normalized = normalize_name(str(item.get('name', '')))
+            if not normalized:
+                continue
+            self.by_name.setdefault(normalized, item)
+            # Una entrada por cada comienzo de palabra: "pro max" encuentra "iphone 15 pro max"
+            words = normalized.split(' ')
+            for i in range(len(words)):
+                entries.append((' '.join(words[i:]), position))
+        entries.sort()
+        self._keys = [key for key, _ in entries]
+        self._positions = [position for _, position in entries]
+
+    def get(self, name: str) -> Optional[Dict[str, Any]]:
+        return self.by_name.get(normalize_name(name))
+
+    def search(self, text: str, limit: int) -> List[Dict[str, Any]]:
+        prefix = normalize_name(text)
+        if not prefix:
+            return []
+        found = []
+        seen = set()
+        i = bisect_left(self._keys, prefix)
+        while i < len(self._keys) and self._keys[i].startswith(prefix):
+            position = self._positions[i]
+            if position not in seen:
+                seen.add(position)
+                found.append(self.items[position])
+                if len(found) >= limit:
+                    break
+            i += 1
+        return found
+
+    def resolve(self, text: str, limit: int, min_score: float) -> List[Tuple[Dict[str, Any], float]]:
+        if self._fuzzy is None:
+            # Import diferido: fuzzy_resolver depende de normalize_name
+            from src.domain.services.fuzzy_resolver import FuzzyResolver
+            self._fuzzy = FuzzyResolver([str(item.get('name', '')) for item in self.items])
+        return [(self.items[position], score)
+                for position, score in self._fuzzy.resolve(text, limit, min_score)]
+
+    def warm_up(self) -> None:
+        """Build the fuzzy index ahead of the first query"""
+        self.resolve('', 0, 1.0)
+
+
+class CatalogIndex:
+    """Lookup index over a company catalog, built once per catalog version.
+
+    Exact lookups are a dict hit on the normalized name; partial names are
+    resolved with a binary search over the sorted word-start suffixes of
+    every name, so lookups cost O(log N + k) instead of a scan.
+    """
+
+    def __init__(self, company_data: Dict[str, Any]):
+        self.products = _NameIndex(company_data.get('products', []))
+        self.services = _NameIndex(company_data.get('services', []))
+        self.product_categories: Dict[str, int] = {}
+        for product in self.products.items:
+            category = product.get('category') or ''
+            self.product_categories[category] = self.product_categories.get(category, 0) + 1
+
+    def get_product_by_name(self, name: str) -> Optional[Dict[str, Any]]:
+        """Find a product by its (normalized) exact name"""
+        return self.products.get(name)
+
+    def get_service_by_name(self, name: str) -> Optional[Dict[str, Any]]:
+        """Find a service by its (normalized) exact name"""
+        return self.services.get(name)
+
+    def search_products(self, text: str, limit: int = 10) -> List[Dict[str, Any]]:
+        """Find products whose name contains a word starting with ``text``"""
+        return self.products.search(text, limit)
+
+    def search_services(self, text: str, limit: int = 10) -> List[Dict[str, Any]]:
+        """Find services whose name contains a word starting with ``text``"""
+        return self.services.search(text, limit)
+
+    def resolve_product(self, text: str, limit: int = 5,
+                        min_score: float = 0.3) -> List[Tuple[Dict[str, Any], float]]:
+        """Fuzzy-match a product name; returns (product, score) best first"""
+        return self.products.resolve(text, limit, min_score)
+
+    def resolve_service(self, text: str, limit: int = 5,
+                        min_score: float = 0.3) -> List[Tuple[Dict[str, Any], float]]:
+        """Fuzzy-match a service name; returns (service, score) best first"""
+        return self.services.resolve(text, limit, min_score)
+
+    def list_products(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Products in catalog order"""
+        return self.products.items if limit is None else self.products.items[:limit]
+
+    def list_services(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Services in catalog order"""
+        return self.services.items if limit is None else self.services.items[:limit]
+
+    def count_products(self) -> int:
+        return len(self.products.items)
+
+    def count_services(self) -> int:
+        return len(self.services.items)
+
+    def product_category_counts(self) -> Dict[str, int]:
+        """Number of products per category, in order of first appearance"""
+        return self.product_categories
+
+    def warm_up(self) -> None:
+        """Build the lazily created fuzzy indexes"""
+        self.products.warm_up()
+        self.services.warm_up()
@@ -1,36 +1,304 @@
+import hashlib
+import inspect
+import json
 import os
-from typing import Dict, Any
-from src.infrastructure.rasa_integration.nlu_generator import generate_nlu_yaml
+import re
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass, field, replace
+from typing import Dict, Any, Callable, List, Optional, TextIO, Tuple
+from src.domain.services.catalog_index import normalize_name
+from src.domain.services.example_sampler import split_budget
+from src.infrastructure.rasa_integration import nlu_generator
+from src.infrastructure.rasa_integration.nlu_generator import NluOptions, nlu_schema, write_nlu_yaml
 from src.infrastructure.rasa_integration.domain_generator import generate_domain_yaml
 from src.infrastructure.rasa_integration.stories_generator import generate_stories_yaml
 from src.application.interfaces.data_source_interface import DataSourceInterface
+from src.infrastructure.monitoring.metrics import metrics
+from src.infrastructure.monitoring.profiler import profiler
+
+MANIFEST_FILE = '.training_manifest.json'
+NLU_SHARD_DIR = 'nlu'
+
+
+def _sha256(content: Any) -> str:
+    if not isinstance(content, (bytes, str)):
+        content = json.dumps(content, sort_keys=True, ensure_ascii=False, default=str)
+    if isinstance(content, str):
+        content = content.encode('utf-8')
+    return hashlib.sha256(content).hexdigest()
+
+
+def _file_sha256(path: str) -> Optional[str]:
+    try:
+        with open(path, 'rb') as f:
+            return hashlib.sha256(f.read()).hexdigest()
+    except FileNotFoundError:
+        return None
+
+
+class _HashingWriter:
+    """Text stream that hashes everything written through it"""
+
+    def __init__(self, stream: TextIO):
+        self.stream = stream
+        self.sha256 = hashlib.sha256()
+
+    def write(self, text: str) -> int:
+        self.sha256.update(text.encode('utf-8'))
+        return self.stream.write(text)
+
+
+@dataclass
+class NluShard:
+    """Picklable description of one NLU shard, rendered in a worker process"""
+    data: Dict[str, Any]
+    options: NluOptions
+    common: bool
+
+
+@dataclass
+class TrainingArtifact:
+    """A generated training file and the part of the catalog it depends on"""
+    filename: str                       # relativo al directorio de salida
+    write: Callable[[TextIO], None]
+    inputs: Any
+    generator: Any      # módulo generador: su código también forma parte del fingerprint
+    shard: Optional[NluShard] = None    # si está, puede generarse en otro proceso
+
+
+@dataclass
+class TrainingFilesResult:
+    """What ``generate_training_files`` did for each artifact"""
+    written: List[str] = field(default_factory=list)
+    unchanged: List[str] = field(default_factory=list)
+    removed: List[str] = field(default_factory=list)
+    fingerprint: str = ''   # hash de todos los archivos generados
+    hashes: Dict[str, str] = field(default_factory=dict)    # archivo -> hash del contenido
+    nlu_schema: str = ''    # hash de los intents/entidades anotados en el NLU
+
+    @property
+    def retrain_needed(self) -> bool:
+        """True when some training file changed content"""
+        return bool(self.written or self.removed)
+
+
+def _names(items: List[Dict[str, Any]]) -> List[str]:
+    return [item.get('name') for item in items]
+
+
+def _nlu_inputs(data: Dict[str, Any], options: NluOptions) -> Any:
+    """Catalog fields nlu.yml depends on with these options"""
+    inputs: List[Any] = [asdict(options)]
+    for key in ('products', 'services'):
+        items = data.get(key, [])
+        if options.max_examples_per_intent is None and options.mode == 'templates':
+            inputs.append(_names(items))
+        else:
+            # El muestreo estratificado también depende de categoría y precio
+            inputs.append([(item.get('name'), item.get('category'), item.get('price')) for item in items])
+    return inputs
+
+
+def _nlu_fields(item: Dict[str, Any]) -> Dict[str, Any]:
+    return {key: item.get(key) for key in ('name', 'category', 'price')}
+
+
+def _shard_slug(category: str, used: set) -> str:
+    slug = re.sub(r'[^a-z0-9]+', '_', normalize_name(category)).strip('_') or 'uncategorized'
+    if slug in used:
+        slug = f"{slug}_{hashlib.sha1(category.encode('utf-8')).hexdigest()[:8]}"
+    used.add(slug)
+    return slug
+
+
+def _nlu_shard_artifacts(data: Dict[str, Any], options: NluOptions) -> List[TrainingArtifact]:
+    """One NLU file per product category plus one with services and common intents.
+
+    With an example budget, each category gets a share proportional to its
+    size (the shares add up to the budget), so shards then also depend on
+    the size of the whole catalog.
+    """
+    # Los shards viajan a los procesos: solo los campos que usa el generador
+    products = [_nlu_fields(product) for product in data.get('products', [])]
+    services = [_nlu_fields(service) for service in data.get('services', [])]
+    by_category: Dict[str, List[Dict[str, Any]]] = {}
+    for product in products:
+        by_category.setdefault(str(product.get('category') or ''), []).append(product)
+
+    shards = [('common', NluShard({'products': [], 'services': services}, options, True))]
+    used = {'common'}
+    shares = None
+    if options.max_examples_per_intent is not None:
+        shares = split_budget({category: len(items) for category, items in by_category.items()},
+                              options.max_examples_per_intent)
+    for category in sorted(by_category):
+        items = by_category[category]
+        shard_options = options
+        if shares is not None:
+            shard_options = replace(options, max_examples_per_intent=shares[category])
+        shards.append((f"products_{_shard_slug(category, used)}",
+                       NluShard({'products': items, 'services': []}, shard_options, False)))
+
+    return [
+        TrainingArtifact(f"{NLU_SHARD_DIR}/{name}.yml",
+                         lambda stream, shard=shard: write_nlu_yaml(shard.data, stream, shard.options, shard.common),
+                         [shard.common, _nlu_inputs(shard.data, shard.options)],
+                         nlu_generator, shard)
+        for name, shard in shards
+    ]
+
+
+def training_artifacts(data: Dict[str, Any], nlu_options: NluOptions) -> List[TrainingArtifact]:
+    """Artifacts generated for a company.
+
+    Each file is only regenerated when the data it depends on changes
+    (e.g. a price change does not touch nlu.yml).
+    """
+    if nlu_options.shard_by_category:
+        nlu_artifacts = _nlu_shard_artifacts(data, nlu_options)
+    else:
+        nlu_artifacts = [TrainingArtifact('nlu.yml', lambda stream: write_nlu_yaml(data, stream, nlu_options),
+                                          _nlu_inputs(data, nlu_options), nlu_generator)]
+    return nlu_artifacts + [
+        TrainingArtifact('domain.yml', lambda stream: stream.write(generate_domain_yaml(data)),
+                         data.get('name'), inspect.getmodule(generate_domain_yaml)),
+        TrainingArtifact('stories.yml', lambda stream: stream.write(generate_stories_yaml(data)),
+                         None, inspect.getmodule(generate_stories_yaml)),
+    ]
+
+
+def _render(path: str, write: Callable[[TextIO], None]) -> Tuple[str, bool]:
+    """Generate a file into a temp file and replace ``path`` only if the content changed.
+
+    Returns the content hash and whether ``path`` was rewritten.
+    """
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        writer = _HashingWriter(f)
+        write(writer)
+    output_hash = writer.sha256.hexdigest()
+    if output_hash == _file_sha256(path):
+        os.remove(tmp_path)
+        return output_hash, False
+    os.replace(tmp_path, path)
+    return output_hash, True
+
+
+def _render_nlu_shard(path: str, shard: NluShard) -> Tuple[str, bool]:
+    """Worker process entry point for one NLU shard"""
+    return _render(path, lambda stream: write_nlu_yaml(shard.data, stream, shard.options, shard.common))
+
 
 class ChatbotOrchestrator:
-    """Orchestrator for chatbot training data generation"""
+    """Orchestrator for chatbot training data generation
+    
+    Keeps a manifest in the output directory with, for every artifact, the
+    hash of its inputs (catalog data and generator code) and of the file it
+    produced. Artifacts whose inputs did not change are not regenerated, and
+    files are only rewritten when their content actually changes, so a no-op
+    refresh leaves mtimes alone and reports that no retrain is needed.
+    While profiling every artifact is rendered so each generator shows up
+    in the profile; unchanged files are still left untouched.
+    
+    With ``NluOptions.shard_by_category`` the NLU data goes to one file per
+    product category under ``<output_dir>/nlu/``; shards that need
+    regenerating are rendered in parallel worker processes.
+    """
+    
+    # Por debajo de este tamaño no compensa arrancar procesos
+    PARALLEL_MIN_ITEMS = 20000
     
-    def __init__(self, data_source: DataSourceInterface):
+    def __init__(self, data_source: DataSourceInterface, nlu_options: Optional[NluOptions] = None,
+                 max_workers: Optional[int] = None):
         self.data_source = data_source
+        self.nlu_options = nlu_options or NluOptions()
+        self.max_workers = max_workers or min(4, os.cpu_count() or 1)
     
-    def generate_training_files(self, output_dir: str) -> None:
+    def generate_training_files(self, output_dir: str) -> TrainingFilesResult:
         """Generate all necessary training files for Rasa"""
-        company_data = self.data_source.load_data()
+        with profiler.stage('load_data'):
+            company_data = self.data_source.load_data()
         
         # Ensure output directory exists
         os.makedirs(output_dir, exist_ok=True)
         
-        # Generate and save NLU data
-        nlu_content = generate_nlu_yaml(company_data)
-        with open(os.path.join(output_dir, 'nlu.yml'), 'w', encoding='utf-8') as f:
-            f.write(nlu_content)
+        manifest_path = os.path.join(output_dir, MANIFEST_FILE)
+        manifest = self._load_manifest(manifest_path)
+        result = TrainingFilesResult()
+        artifacts = training_artifacts(company_data, self.nlu_options)
+        sources: Dict[Any, str] = {}
         
-        # Generate and save domain
-        domain_content = generate_domain_yaml(company_data)
-        with open(os.path.join(output_dir, 'domain.yml'), 'w', encoding='utf-8') as f:
-            f.write(domain_content)
+        pending = []
+        for artifact in artifacts:
+            path = os.path.join(output_dir, artifact.filename)
+            if artifact.generator not in sources:
+                sources[artifact.generator] = inspect.getsource(artifact.generator)
+            input_hash = _sha256([sources[artifact.generator], artifact.inputs])
+            previous = manifest.get(artifact.filename, {})
+            # Con --profile se regenera todo para que cada generador quede
+            # perfilado; _render no reescribe archivos cuyo contenido no cambia
+            if (not profiler.enabled and previous.get('input_hash') == input_hash
+                    and _file_sha256(path) == previous.get('output_hash')):
+                result.unchanged.append(artifact.filename)
+            else:
+                pending.append((artifact, path, input_hash))
         
-        # Generate and save stories
-        stories_content = generate_stories_yaml(company_data)
-        with open(os.path.join(output_dir, 'stories.yml'), 'w', encoding='utf-8') as f:
-            f.write(stories_content)
+        for (artifact, _, input_hash), (output_hash, changed) in zip(pending, self._render_all(pending)):
+            (result.written if changed else result.unchanged).append(artifact.filename)
+            manifest[artifact.filename] = {'input_hash': input_hash, 'output_hash': output_hash}
         
-        print(f"Training files generated in {output_dir}")
\ No newline at end of file
+        # Archivos generados antes que ya no corresponden (categoría eliminada,
+        # cambio entre nlu.yml y shards)
+        current = {artifact.filename for artifact in artifacts}
+        for filename in sorted(set(manifest) - current):
+            path = os.path.join(output_dir, filename)
+            if os.path.exists(path):
+                os.remove(path)
+                result.removed.append(filename)
+            del manifest[filename]
+        
+        result.hashes = {a.filename: manifest[a.filename]['output_hash'] for a in artifacts}
+        result.fingerprint = _sha256([result.hashes[a.filename] for a in artifacts])
+        result.nlu_schema = _sha256(nlu_schema(self.nlu_options))
+        with open(manifest_path, 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, indent=4, sort_keys=True)
+        
+        for status, filenames in (('written', result.written), ('unchanged', result.unchanged),
+                                  ('removed', result.removed)):
+            metrics.inc('training_files_total', len(filenames), status=status)
+        
+        if result.written or result.removed:
+            changes = result.written + [f"{filename} (removed)" for filename in result.removed]
+            print(f"Training files generated in {output_dir}: {', '.join(changes)} changed")
+        else:
+            print(f"Training files in {output_dir} are up to date")
+        return result
+    
+    def _render_all(self, pending: List[Tuple[TrainingArtifact, str, str]]) -> List[Tuple[str, bool]]:
+        """Render the pending artifacts, shards in a process pool when worth it"""
+        shards = [(path, artifact.shard) for artifact, path, _ in pending if artifact.shard is not None]
+        shard_items = sum(len(shard.data['products']) + len(shard.data['services']) for _, shard in shards)
+        shard_results: Dict[str, Tuple[str, bool]] = {}
+        # Con --profile cada generador corre en este proceso para poder perfilarlo
+        if (len(shards) > 1 and self.max_workers > 1 and shard_items >= self.PARALLEL_MIN_ITEMS
+                and not profiler.enabled):
+            with ProcessPoolExecutor(max_workers=self.max_workers) as executor:
+                futures = {path: executor.submit(_render_nlu_shard, path, shard) for path, shard in shards}
+                shard_results = {path: future.result() for path, future in futures.items()}
+        results = []
+        for artifact, path, _ in pending:
+            if path in shard_results:
+                results.append(shard_results[path])
+                continue
+            with profiler.stage(f"generate:{artifact.filename}"):
+                results.append(_render(path, artifact.write))
+        return results
+    
+    @staticmethod
+    def _load_manifest(path: str) -> Dict[str, Dict[str, str]]:
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (FileNotFoundError, ValueError):
+            return {}
\ No newline at end of file
@@ -0,0 +1,124 @@
+# rasa-chatbot/src/domain/services/example_sampler.py
+import hashlib
+import random
+import re
+from bisect import bisect_right
+from typing import Dict, Any, List, Optional, Tuple
+from src.domain.services.catalog_index import normalize_name
+
+_WORD_RE = re.compile(r'\w+')
+
+
+def _price_cuts(items: List[Dict[str, Any]], bands: int) -> List[float]:
+    """Quantile boundaries splitting the catalog prices into ``bands`` bands"""
+    prices = sorted(item['price'] for item in items if isinstance(item.get('price'), (int, float)))
+    if not prices or bands <= 1:
+        return []
+    return sorted({prices[len(prices) * i // bands] for i in range(1, bands)})
+
+
+def _stratum(item: Dict[str, Any], cuts: List[float]) -> Tuple[str, int]:
+    price = item.get('price')
+    band = bisect_right(cuts, price) if isinstance(price, (int, float)) else -1
+    return str(item.get('category') or ''), band
+
+
+def split_budget(weights: Dict[Any, int], budget: int) -> Dict[Any, int]:
+    """Split ``budget`` proportionally to ``weights``; the shares add up to exactly ``budget``"""
+    total = sum(weights.values())
+    if not total:
+        return {key: 0 for key in weights}
+    quotas = {key: budget * weight / total for key, weight in weights.items()}
+    shares = {key: int(quota) for key, quota in quotas.items()}
+    # Largest remainder: lo que falta va a los mayores restos (desempate estable por clave)
+    missing = budget - sum(shares.values())
+    for key in sorted(weights, key=lambda k: (-(quotas[k] - shares[k]), repr(k)))[:missing]:
+        shares[key] += 1
+    return shares
+
+
+def _allocate(sizes: Dict[Any, int], budget: int) -> Dict[Any, int]:
+    """Split ``budget`` across strata proportionally (largest remainder)"""
+    total = sum(sizes.values())
+    quotas = {key: budget * size / total for key, size in sizes.items()}
+    allocation = {key: min(int(quota), sizes[key]) for key, quota in quotas.items()}
+    # Los estratos con más resto reciben lo que falta (desempate estable por clave)
+    for key in sorted(sizes, key=lambda k: (-(quotas[k] - int(quotas[k])), repr(k))):
+        if sum(allocation.values()) >= budget:
+            break
+        if allocation[key] < sizes[key]:
+            allocation[key] += 1
+    return allocation
+
+
+def sample_items(items: List[Dict[str, Any]], budget: int, seed: int = 0,
+                 price_bands: int = 4) -> List[Dict[str, Any]]:
+    """Pick at most ``budget`` items, stratified by category and price band.
+
+    Every (category, price band) stratum gets a share proportional to its
+    size. Sampling inside a stratum is seeded with ``seed`` and the stratum
+    key, so the same catalog always yields the same sample and one stratum
+    changing does not reshuffle the others. Items keep their catalog order.
+    """
+    if budget >= len(items):
+        return list(items)
+    if budget <= 0:
+        return []
+    cuts = _price_cuts(items, price_bands)
+    strata: Dict[Tuple[str, int], List[int]] = {}
+    for position, item in enumerate(items):
+        strata.setdefault(_stratum(item, cuts), []).append(position)
+
+    allocation = _allocate({key: len(positions) for key, positions in strata.items()}, budget)
+    chosen = []
+    for key, positions in strata.items():
+        count = allocation[key]
+        if not count:
+            continue
+        stratum_seed = hashlib.sha256(f"{seed}:{key!r}".encode('utf-8')).hexdigest()
+        chosen.extend(random.Random(stratum_seed).sample(positions, count))
+    return [items[position] for position in sorted(chosen)]
+
+
+def _template_words(template: str) -> frozenset:
+    return frozenset(_WORD_RE.findall(normalize_name(template.replace('{name}', ' '))))
+
+
+def dedupe_templates(templates: List[str], threshold: float = 0.8) -> List[str]:
+    """Drop templates whose words overlap an earlier one by ``threshold`` or more (Jaccard)"""
+    kept: List[Tuple[str, frozenset]] = []
+    for template in templates:
+        words = _template_words(template)
+        if any(len(words & other) / max(1, len(words | other)) >= threshold for _, other in kept):
+            continue
+        kept.append((template, words))
+    return [template for template, _ in kept]
+
+
+def budgeted_examples(items: List[Dict[str, Any]], templates: List[str], budget: Optional[int],
+                      seed: int = 0, price_bands: int = 4) -> List[Tuple[Dict[str, Any], str]]:
+    """(item, template) pairs to generate for one intent, at most ``budget``.
+
+    Near-duplicate templates are dropped first. If everything fits, every
+    template is used for every item. Otherwise a stratified sample of items
+    is taken and the templates rotate across it, so the budget is spent on
+    covering as many different names as possible.
+    """
+    templates = dedupe_templates(templates)
+    if budget is None or len(items) * len(templates) <= budget:
+        return [(item, template) for item in items for template in templates]
+    sampled = sample_items(items, budget, seed, price_bands)
+    if not sampled:
+        return []
+    per_item = max(1, min(len(templates), budget // len(sampled)))
+    pairs = []
+    seen = set()
+    for i, item in enumerate(sampled):
+        # Nombres que solo difieren en mayúsculas o tildes darían ejemplos repetidos
+        key = normalize_name(str(item.get('name', '')))
+        if key in seen:
+            continue
+        seen.add(key)
+        for j in range(per_item):
+            pairs.append((item, templates[(i + j) % len(templates)]))
+    return pairs
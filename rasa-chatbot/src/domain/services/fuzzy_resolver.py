@@ -0,0 +1,76 @@
+# rasa-chatbot/src/domain/services/fuzzy_resolver.py
+from array import array
+from collections import Counter
+from typing import Dict, List, Set, Tuple
+
+from src.domain.services.catalog_index import normalize_name
+
+
+def _trigrams(normalized: str) -> Set[str]:
+    """Character trigrams of an already normalized string (space padded)"""
+    padded = f' {normalized} '
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class FuzzyResolver:
+    """Approximate name matching over a character trigram inverted index.
+
+    Built once from the catalog names. Queries only walk the rarest posting
+    lists of the query trigrams up to ``max_postings`` entries, so latency
+    is bounded regardless of catalog size; the best ``candidates`` names
+    are then scored exactly with the Dice coefficient of their trigrams.
+    """
+
+    def __init__(self, names: List[str], max_postings: int = 1000, candidates: int = 20):
+        self.max_postings = max_postings
+        self.candidates = candidates
+        self._padded: List[str] = []
+        self._gram_counts = array('H')
+        postings: Dict[str, array] = {}
+        for position, name in enumerate(names):
+            normalized = normalize_name(name)
+            grams = _trigrams(normalized)
+            self._padded.append(f' {normalized} ')
+            self._gram_counts.append(min(len(grams), 0xFFFF))
+            for gram in grams:
+                posting = postings.get(gram)
+                if posting is None:
+                    posting = postings[gram] = array('I')
+                posting.append(position)
+        self._postings = postings
+
+    def resolve(self, query: str, limit: int = 5, min_score: float = 0.0) -> List[Tuple[int, float]]:
+        """Return up to ``limit`` (position, score) pairs, best match first.
+
+        ``position`` is the index of the matched name in the list given to
+        the constructor and ``score`` is in [0, 1].
+        """
+        normalized = normalize_name(query)
+        if not normalized:
+            return []
+        query_grams = _trigrams(normalized)
+        posting_lists = sorted(
+            (self._postings[gram] for gram in query_grams if gram in self._postings),
+            key=len,
+        )
+
+        counts: Counter = Counter()
+        budget = self.max_postings
+        for posting in posting_lists:
+            if len(posting) > budget:
+                if not counts:
+                    counts.update(posting[:budget])
+                break
+            counts.update(posting)
+            budget -= len(posting)
+
+        scored = []
+        for position, _ in counts.most_common(self.candidates):
+            # |Q ∩ G| sin construir el conjunto de trigramas del candidato
+            padded = self._padded[position]
+            shared = sum(1 for gram in query_grams if gram in padded)
+            score = 2 * shared / (len(query_grams) + self._gram_counts[position])
+            if score >= min_score:
+                scored.append((position, score))
+        scored.sort(key=lambda pair: pair[1], reverse=True)
+        return scored[:limit]
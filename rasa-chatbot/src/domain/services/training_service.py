@@ -0,0 +1,117 @@
+import hashlib
+import json
+import os
+import time
+from dataclasses import dataclass
+from typing import Dict, Any, List, Optional
+
+SKIP = 'skip'
+FINETUNE = 'finetune'
+FULL = 'full'
+
+
+@dataclass
+class TrainingPlan:
+    """How the model should be (re)trained and why"""
+    mode: str                   # SKIP, FINETUNE o FULL
+    reason: str
+    changed: List[str]          # archivos de entrenamiento que cambiaron desde el último modelo
+
+
+def _is_nlu_file(filename: str) -> bool:
+    return filename == 'nlu.yml' or filename.startswith('nlu/')
+
+
+class TrainingService:
+    """Decides between skipping, finetuning and a full retrain.
+
+    The state file remembers the hashes of the training files, the NLU
+    schema and ``config.yml`` used for the last trained model, plus the wall
+    time of every training run. Only catalog-driven NLU changes are
+    finetuned: Rasa can only finetune when the domain, config and labels are
+    unchanged, so anything else (or too many finetunes in a row) gets a full
+    retrain.
+    """
+
+    MAX_CONSECUTIVE_FINETUNES = 5
+    HISTORY_SIZE = 100
+
+    def __init__(self, state_path: str, config_path: str = 'config.yml',
+                 max_consecutive_finetunes: Optional[int] = None):
+        self.state_path = state_path
+        self.config_path = config_path
+        if max_consecutive_finetunes is not None:
+            self.MAX_CONSECUTIVE_FINETUNES = max_consecutive_finetunes
+        self.state = self._load_state()
+
+    def plan(self, file_hashes: Dict[str, str], nlu_schema: str, latest_model: Optional[str]) -> TrainingPlan:
+        """Pick the training mode for the current training files"""
+        trained = self.state.get('trained') or {}
+        trained_hashes = trained.get('files', {})
+        changed = sorted(name for name in set(file_hashes) | set(trained_hashes)
+                         if file_hashes.get(name) != trained_hashes.get(name))
+        config_changed = trained.get('config') != self._config_hash()
+
+        if latest_model is None:
+            return TrainingPlan(FULL, 'no trained model yet', changed)
+        if not changed and not config_changed and trained.get('model') == latest_model:
+            return TrainingPlan(SKIP, 'training data unchanged since the last model', changed)
+        if config_changed:
+            return TrainingPlan(FULL, 'config.yml changed', changed)
+        if trained.get('model') != latest_model:
+            return TrainingPlan(FULL, 'latest model was not trained from this state', changed)
+        if trained.get('nlu_schema') != nlu_schema:
+            return TrainingPlan(FULL, 'NLU intents/entities changed', changed)
+        not_nlu = [name for name in changed if not _is_nlu_file(name)]
+        if not_nlu:
+            return TrainingPlan(FULL, f"{', '.join(not_nlu)} changed", changed)
+        if self.state.get('consecutive_finetunes', 0) >= self.MAX_CONSECUTIVE_FINETUNES:
+            return TrainingPlan(FULL, f'{self.MAX_CONSECUTIVE_FINETUNES} finetunes in a row', changed)
+        return TrainingPlan(FINETUNE, 'catalog-only NLU changes', changed)
+
+    def record(self, plan: TrainingPlan, seconds: float, file_hashes: Dict[str, str],
+               nlu_schema: str, model: Optional[str]) -> None:
+        """Save the result of a training run (or skip) and its wall time"""
+        if plan.mode != SKIP:
+            self.state['trained'] = {
+                'files': file_hashes,
+                'nlu_schema': nlu_schema,
+                'config': self._config_hash(),
+                'model': model,
+            }
+            self.state['consecutive_finetunes'] = (
+                self.state.get('consecutive_finetunes', 0) + 1 if plan.mode == FINETUNE else 0
+            )
+        history = self.state.setdefault('history', [])
+        history.append({'mode': plan.mode, 'reason': plan.reason, 'seconds': round(seconds, 3),
+                        'finished_at': time.time(), 'model': model})
+        del history[:-self.HISTORY_SIZE]
+        self._save_state()
+
+    def average_seconds(self, mode: str) -> Optional[float]:
+        """Mean wall time of the recorded runs of ``mode``"""
+        times = [entry['seconds'] for entry in self.state.get('history', []) if entry['mode'] == mode]
+        return sum(times) / len(times) if times else None
+
+    def _config_hash(self) -> Optional[str]:
+        try:
+            with open(self.config_path, 'rb') as f:
+                return hashlib.sha256(f.read()).hexdigest()
+        except FileNotFoundError:
+            return None
+
+    def _load_state(self) -> Dict[str, Any]:
+        try:
+            with open(self.state_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (FileNotFoundError, ValueError):
+            return {}
+
+    def _save_state(self) -> None:
+        directory = os.path.dirname(self.state_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{self.state_path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.state, f, indent=4)
+        os.replace(tmp_path, self.state_path)
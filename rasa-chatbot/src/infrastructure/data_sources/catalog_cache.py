@@ -0,0 +1,173 @@
+# rasa-chatbot/src/infrastructure/data_sources/catalog_cache.py
+import os
+import threading
+import time
+from typing import Dict, Any, Optional, Tuple
+from src.domain.services.catalog_index import CatalogIndex
+from src.domain.services.catalog_diff import apply_delta
+from src.infrastructure.data_sources.json_data_source import JsonDataSource
+
+_Stat = Optional[Tuple[int, int]]
+
+
+class CatalogCache:
+    """Process-wide in-memory cache of a company catalog JSON file.
+
+    The first read loads the file synchronously. Afterwards the snapshot
+    and its change log are stat'ed at most once per ``check_interval``
+    seconds; when their mtime or size changes the catalog is refreshed in a
+    background thread while readers keep getting the previous version. If
+    only the change log grew, just the new deltas are applied; a new
+    version is only published when the data version actually moved.
+    A file that does not exist yet is served as an empty catalog until it
+    is published.
+    """
+
+    _instances: Dict[str, 'CatalogCache'] = {}
+    _instances_lock = threading.Lock()
+
+    def __init__(self, file_path: str, check_interval: float = 1.0):
+        self.file_path = file_path
+        self.check_interval = check_interval
+        # Solo lectura: el servidor de acciones no debe crear el catálogo
+        self.data_source = JsonDataSource(file_path, read_only=True)
+        self._data: Optional[Dict[str, Any]] = None
+        self._index: Optional[Tuple[Dict[str, Any], CatalogIndex]] = None
+        self._fingerprint: Optional[Tuple[_Stat, _Stat]] = None
+        self._data_version = 0
+        self._version = 0
+        self._last_check = 0.0
+        self._reloading = False
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._reloads = 0
+        self._delta_reloads = 0
+        self._reload_errors = 0
+
+    @classmethod
+    def for_path(cls, file_path: str, check_interval: float = 1.0) -> 'CatalogCache':
+        """Get the shared cache for a catalog file, creating it on first use"""
+        key = os.path.abspath(file_path)
+        cache = cls._instances.get(key)
+        if cache is None:
+            with cls._instances_lock:
+                cache = cls._instances.get(key)
+                if cache is None:
+                    cache = cls(file_path, check_interval)
+                    cls._instances[key] = cache
+        return cache
+
+    @property
+    def version(self) -> int:
+        """Version number of the catalog currently served (0 = not loaded)"""
+        return self._version
+
+    def get(self) -> Dict[str, Any]:
+        """Return the cached catalog, loading it on first access"""
+        data = self._data
+        if data is None:
+            with self._lock:
+                if self._data is None:
+                    self._misses += 1
+                    self._reload()
+                    return self._data
+                data = self._data
+        self._hits += 1
+        self._maybe_schedule_reload()
+        return data
+
+    def get_index(self) -> CatalogIndex:
+        """Return the lookup index for the cached catalog, built once per version"""
+        data = self.get()
+        cached = self._index
+        if cached is not None and cached[0] is data:
+            return cached[1]
+        index = CatalogIndex(data)
+        self._index = (data, index)
+        return index
+
+    def stats(self) -> Dict[str, Any]:
+        """Return hit/miss/reload counters for monitoring"""
+        return {
+            'file_path': self.file_path,
+            'version': self._version,
+            'data_version': self._data_version,
+            'hits': self._hits,
+            'misses': self._misses,
+            'reloads': self._reloads,
+            'delta_reloads': self._delta_reloads,
+            'reload_errors': self._reload_errors,
+        }
+
+    def _stat(self) -> Tuple[_Stat, _Stat]:
+        """Cheap change detector: (mtime_ns, size) of the snapshot and the change log"""
+        return self._stat_file(self.file_path), self._stat_file(self.data_source.changes_path)
+
+    @staticmethod
+    def _stat_file(path: str) -> _Stat:
+        try:
+            st = os.stat(path)
+        except FileNotFoundError:
+            return None
+        return st.st_mtime_ns, st.st_size
+
+    def _maybe_schedule_reload(self) -> None:
+        """Start a background reload when the file changed on disk"""
+        now = time.monotonic()
+        if now - self._last_check < self.check_interval:
+            return
+        self._last_check = now
+        if self._stat() == self._fingerprint:
+            return
+        with self._lock:
+            if self._reloading:
+                return
+            self._reloading = True
+        threading.Thread(target=self._background_reload, daemon=True).start()
+
+    def _background_reload(self) -> None:
+        try:
+            with self._lock:
+                self._reload()
+            # Construir los índices fuera del camino de las peticiones
+            self.get_index().warm_up()
+        except Exception as e:
+            # Se sigue sirviendo la versión anterior (p.ej. archivo a medio escribir)
+            self._reload_errors += 1
+            print(f"Error reloading catalog {self.file_path}: {e}")
+        finally:
+            self._reloading = False
+
+    def _reload(self) -> None:
+        """Bring the cached catalog up to date with the data source.
+
+        Must be called with ``self._lock`` held.
+        """
+        fingerprint = self._stat()
+        if self._data is not None and self._fingerprint is not None \
+                and fingerprint[0] == self._fingerprint[0]:
+            # Mismo snapshot: solo hay entradas nuevas en el log de cambios
+            changes = self.data_source.changes_since(self._data_version)
+            if changes is not None:
+                if changes:
+                    data = self._data
+                    for entry in changes:
+                        data = apply_delta(data, entry['delta'])
+                    self._delta_reloads += 1
+                    self._publish(data, changes[-1]['version'])
+                self._fingerprint = fingerprint
+                return
+
+        data, data_version = self.data_source.load_with_version()
+        # Versión 0 = archivo sin versionar: no se puede saber si cambió
+        if self._data is None or data_version != self._data_version or data_version == 0:
+            if self._data is not None:
+                self._reloads += 1
+            self._publish(data, data_version)
+        self._fingerprint = fingerprint
+
+    def _publish(self, data: Dict[str, Any], data_version: int) -> None:
+        self._data = data
+        self._data_version = data_version
+        self._version += 1
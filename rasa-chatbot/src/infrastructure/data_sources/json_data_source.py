@@ -1,20 +1,54 @@
 # rasa-chatbot/src/infrastructure/data_sources/json_data_source.py
-#             print("¡Listo para interactuar con los clientes!")
-#         else:
-#             print("\n❌ Error configurando el chatbot.")
-#     except Exception as e:
 import json
 import os
+import re
+import shutil
+import threading
+import time
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, Iterable, List, Optional, Tuple
 from src.application.interfaces.data_source_interface import DataSourceInterface
+from src.domain.services.catalog_diff import ITEM_LISTS, diff_catalog, apply_delta
+from src.infrastructure.data_sources.mmap_catalog import CatalogSnapshotBuilder, write_catalog_snapshot
+from src.infrastructure.monitoring.metrics import metrics
 
 class JsonDataSource(DataSourceInterface):
-    """Implementación de almacenamiento en archivos JSON"""
+    """Implementación de almacenamiento en archivos JSON
     
-    def __init__(self, file_path: str):
+    El archivo principal es un snapshot completo que guarda su número de
+    versión en la clave ``_version``. ``update_data`` no lo reescribe: agrega
+    solo el delta (items agregados/quitados/modificados por ``id``) a un log
+    ``<archivo>.changes.jsonl`` que se compacta en un snapshot nuevo cada
+    ``COMPACT_AFTER_CHANGES`` entradas.
+    
+    Cada snapshot se publica sin reescribir archivos en uso: se escribe en un
+    temporal, se renombra a ``<archivo>.versions/<versión>.json`` y el archivo
+    principal se reemplaza (rename atómico) por un hard link a esa versión.
+    Un lector nunca ve un archivo a medio escribir y puede fijar una versión
+    con ``load_version`` mientras se publican otras; las versiones viejas se
+    borran ``VERSION_GRACE_SECONDS`` después de ser reemplazadas.
+    
+    Con ``read_only`` (lectores como el servidor de acciones) no se crea ni
+    se escribe ningún archivo: si el catálogo todavía no existe se lee vacío.
+    
+    Con ``snapshot_path`` cada publicación (snapshot completo, delta del log
+    o compactación) regenera también el snapshot binario de ``MmapCatalog``,
+    así el servidor de acciones nunca lee un catálogo más viejo que el JSON.
+    """
+    
+    VERSION_KEY = '_version'
+    COMPACT_AFTER_CHANGES = 50
+    VERSION_GRACE_SECONDS = 600
+    _VERSION_RE = re.compile(rb'^\s*\{\s*"_version"\s*:\s*(\d+)')
+    
+    def __init__(self, file_path: str, read_only: bool = False, snapshot_path: Optional[str] = None):
         self.file_path = file_path
-        self._ensure_file_exists()
+        self.changes_path = f"{file_path}.changes.jsonl"
+        self.versions_dir = f"{file_path}.versions"
+        self.read_only = read_only
+        self.snapshot_path = snapshot_path
+        if not read_only:
+            self._ensure_file_exists()
     
     def _ensure_file_exists(self):
         """Asegura que el archivo JSON exista"""
@@ -23,333 +57,221 @@ class JsonDataSource(DataSourceInterface):
             self.save_data({})
     
     def save_data(self, data: Dict[str, Any]) -> None:
-        """Guarda datos en archivo JSON"""
-        with open(self.file_path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=4, ensure_ascii=False)
+        """Guarda datos en archivo JSON (snapshot completo, nueva versión)"""
+        self._write_snapshot(data, self.current_version() + 1)
     
     def load_data(self) -> Dict[str, Any]:
-        """Carga datos desde archivo JSON"""
-        with open(self.file_path, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        """Carga datos desde archivo JSON (snapshot + cambios pendientes)"""
+        return self.load_with_version()[0]
     
-    def update_data(self, data: Dict[str, Any]) -> None:
-        """Actualiza datos existentes en el archivo JSON"""
-        current_data = self.load_data()
-        current_data.update(data)
-        self.save_data(current_data)
-
-
-# rasa-chatbot/src/infrastructure/rasa_integration/rasa_training_generator.py
-import yaml
-from typing import Dict, Any, List
-from pathlib import Path
-from src.domain.entities.company import CompanyData
-from src.application.interfaces.training_data_generator_interface import ITrainingDataGenerator
-
-class RasaTrainingGenerator(ITrainingDataGenerator):
-    """Generador completo de archivos de entrenamiento para Rasa"""
+    @metrics.timed('data_source_seconds', source='json', operation='load')
+    def load_with_version(self) -> Tuple[Dict[str, Any], int]:
+        """Carga los datos junto con su número de versión"""
+        data, version = self._read_snapshot()
+        for entry in self._read_changes():
+            if entry['version'] > version:
+                data = apply_delta(data, entry['delta'])
+                version = entry['version']
+        return data, version
     
-    def generate_nlu_data(self, company_data: CompanyData) -> Dict[str, Any]:
-        """Genera datos NLU completos"""
-        
-        nlu_data = {
-            'version': '3.1',
-            'nlu': [
-                {
-                    'intent': 'greet',
-                    'examples': self._get_greet_examples()
-                },
-                {
-                    'intent': 'goodbye',
-                    'examples': self._get_goodbye_examples()
-                },
-                {
-                    'intent': 'ask_products',
-                    'examples': self._generate_product_examples(company_data.products)
-                },
-                {
-                    'intent': 'ask_services',
-                    'examples': self._generate_service_examples(company_data.services)
-                },
-                {
-                    'intent': 'ask_price',
-                    'examples': self._generate_price_examples(company_data)
-                },
-                {
-                    'intent': 'ask_company_info',
-                    'examples': self._generate_company_info_examples(company_data.company_info)
-                },
-                {
-                    'intent': 'affirm',
-                    'examples': '- sí\n- si\n- está bien\n- perfecto\n- de acuerdo\n- correcto\n- exacto'
-                },
-                {
-                    'intent': 'deny',
-                    'examples': '- no\n- no gracias\n- no es correcto\n- no está bien\n- negativo'
-                }
-            ]
-        }
+    @metrics.timed('data_source_seconds', source='json', operation='update')
+    def update_data(self, data: Dict[str, Any]) -> None:
+        """Actualiza datos existentes en el archivo JSON
         
-        return nlu_data
+        Mismo resultado que ``dict.update`` sobre los datos actuales, pero solo
+        se persiste la diferencia como una entrada nueva del log de cambios.
+        """
+        self._check_writable()
+        current_data, version = self.load_with_version()
+        delta = diff_catalog(current_data, data)
+        if not delta:
+            return
+        entry = {'version': version + 1, 'delta': delta}
+        with open(self.changes_path, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(entry, ensure_ascii=False) + '\n')
+        if len(self._read_changes()) >= self.COMPACT_AFTER_CHANGES:
+            self.compact()
+        elif self.snapshot_path is not None:
+            self._write_catalog_snapshot(apply_delta(current_data, delta), version + 1)
     
-    def generate_domain_data(self, company_data: CompanyData) -> Dict[str, Any]:
-        """Genera domain.yml completo"""
-        
-        # Extraer nombres para entidades
-        product_names = [p.name.lower() for p in company_data.products]
-        service_names = [s.name.lower() for s in company_data.services]
-        categories = company_data.get_all_categories()
-        
-        domain_data = {
-            'version': '3.1',
-            'intents': [
-                'greet',
-                'goodbye', 
-                'ask_products',
-                'ask_services',
-                'ask_price',
-                'ask_company_info',
-                'affirm',
-                'deny'
-            ],
-            'entities': [
-                'product',
-                'service', 
-                'category'
-            ],
-            'slots': {
-                'product': {
-                    'type': 'text',
-                    'influence_conversation': True,
-                    'mappings': [
-                        {
-                            'type': 'from_entity',
-                            'entity': 'product'
-                        }
-                    ]
-                },
-                'service': {
-                    'type': 'text',
-                    'influence_conversation': True,
-                    'mappings': [
-                        {
-                            'type': 'from_entity',
-                            'entity': 'service'
-                        }
-                    ]
-                },
-                'category': {
-                    'type': 'text',
-                    'influence_conversation': True,
-                    'mappings': [
-                        {
-                            'type': 'from_entity',
-                            'entity': 'category'
-                        }
-                    ]
-                }
-            },
-            'responses': {
-                'utter_greet': [
-                    {'text': f'¡Hola! Soy el asistente virtual de {company_data.company_info.name}. ¿En qué puedo ayudarte?'},
-                    {'text': f'¡Bienvenido a {company_data.company_info.name}! ¿Qué información necesitas?'},
-                    {'text': '¡Hola! ¿Te puedo ayudar con información sobre nuestros productos o servicios?'}
-                ],
-                'utter_goodbye': [
-                    {'text': '¡Hasta luego! Que tengas un excelente día.'},
-                    {'text': 'Adiós, fue un placer ayudarte.'},
-                    {'text': 'Nos vemos pronto. ¡Cuídate!'}
-                ],
-                'utter_ask_rephrase': [
-                    {'text': 'No entendí bien. ¿Podrías reformular tu pregunta?'},
-                    {'text': 'Disculpa, no comprendí. ¿Puedes preguntarlo de otra manera?'}
-                ],
-                'utter_default': [
-                    {'text': 'No estoy seguro de cómo ayudarte con eso. ¿Puedes preguntarme sobre productos, servicios o precios?'}
-                ]
-            },
-            'actions': [
-                'action_show_products',
-                'action_show_services', 
-                'action_show_price',
-                'utter_greet',
-                'utter_goodbye',
-                'utter_ask_rephrase',
-                'utter_default'
-            ],
-            'session_config': {
-                'session_expiration_time': 60,
-                'carry_over_slots_to_new_session': True
-            }
-        }
-        
-        return domain_data
+    def current_version(self) -> int:
+        """Versión más reciente (snapshot o último cambio del log)"""
+        changes = self._read_changes()
+        return max(self._peek_snapshot_version(), changes[-1]['version'] if changes else 0)
     
-    def generate_stories_data(self, company_data: CompanyData) -> Dict[str, Any]:
-        """Genera stories.yml completo"""
-        
-        stories_data = {
-            'version': '3.1',
-            'stories': [
-                {
-                    'story': 'saludo básico',
-                    'steps': [
-                        {'intent': 'greet'},
-                        {'action': 'utter_greet'}
-                    ]
-                },
-                {
-                    'story': 'consulta productos',
-                    'steps': [
-                        {'intent': 'greet'},
-                        {'action': 'utter_greet'},
-                        {'intent': 'ask_products'},
-                        {'action': 'action_show_products'}
-                    ]
-                },
-                {
-                    'story': 'consulta servicios',
-                    'steps': [
-                        {'intent': 'ask_services'},
-                        {'action': 'action_show_services'}
-                    ]
-                },
-                {
-                    'story': 'consulta precios con producto',
-                    'steps': [
-                        {'intent': 'ask_price', 'entities': [{'entity': 'product', 'value': 'ejemplo'}]},
-                        {'action': 'action_show_price'}
-                    ]
-                },
-                {
-                    'story': 'despedida',
-                    'steps': [
-                        {'intent': 'goodbye'},
-                        {'action': 'utter_goodbye'}
-                    ]
-                },
-                {
-                    'story': 'flujo completo productos',
-                    'steps': [
-                        {'intent': 'greet'},
-                        {'action': 'utter_greet'},
-                        {'intent': 'ask_products'},
-                        {'action': 'action_show_products'},
-                        {'intent': 'ask_price'},
-                        {'action': 'action_show_price'},
-                        {'intent': 'goodbye'},
-                        {'action': 'utter_goodbye'}
-                    ]
-                }
-            ]
-        }
+    def changes_since(self, version: int) -> Optional[List[Dict[str, Any]]]:
+        """Deltas publicados después de ``version``, en orden.
         
-        return stories_data
+        Devuelve None si esos cambios ya fueron compactados en el snapshot y
+        hay que recargar los datos completos.
+        """
+        if version < self._peek_snapshot_version():
+            return None
+        return [entry for entry in self._read_changes() if entry['version'] > version]
     
-    def _get_greet_examples(self) -> str:
-        return '''- hola
-- buenos días
-- buenas tardes
-- buenas noches
-- hey
-- saludos
-- hola qué tal
-- buenas
-- hello
-- hi'''
+    def load_version(self, version: int) -> Optional[Dict[str, Any]]:
+        """Carga un snapshot publicado, o None si no existe o ya fue borrado"""
+        try:
+            with open(self.version_path(version), 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return None
+        data.pop(self.VERSION_KEY, None)
+        return data
     
-    def _get_goodbye_examples(self) -> str:
-        return '''- adiós
-- hasta luego
-- nos vemos
-- bye
-- chau
-- hasta pronto
-- me voy
-- gracias, adiós
-- eso es todo
-- hasta la vista'''
+    def version_path(self, version: int) -> str:
+        return os.path.join(self.versions_dir, f"{version:010d}.json")
     
-    def _generate_product_examples(self, products) -> str:
-        examples = [
-            '- qué productos tienen',
-            '- cuáles son sus productos',
-            '- mostrar productos',
-            '- productos disponibles',
-            '- catálogo de productos',
-            '- lista de productos',
-            '- ver productos',
-            '- productos que venden'
-        ]
-        
-        for product in products[:3]:
-            examples.extend([
-                f'- información sobre {product.name.lower()}',
-                f'- detalles de {product.name.lower()}',
-                f'- cuéntame de {product.name.lower()}'
-            ])
-        
-        return '\n'.join([f'- {ex}' if not ex.startswith('- ') else ex for ex in examples])
+    def published_versions(self) -> List[int]:
+        """Versiones de snapshot todavía disponibles, de menor a mayor"""
+        try:
+            names = os.listdir(self.versions_dir)
+        except FileNotFoundError:
+            return []
+        return sorted(int(name[:-5]) for name in names if name.endswith('.json') and name[:-5].isdigit())
     
-    def _generate_service_examples(self, services) -> str:
-        examples = [
-            '- qué servicios ofrecen',
-            '- cuáles son sus servicios',
-            '- mostrar servicios',
-            '- servicios disponibles',
-            '- lista de servicios',
-            '- ver servicios',
-            '- servicios que brindan'
-        ]
+    def gc_versions(self, grace_seconds: Optional[float] = None) -> List[int]:
+        """Borra los snapshots reemplazados hace más de ``grace_seconds``.
         
-        for service in services[:3]:
-            examples.extend([
-                f'- información sobre {service.name.lower()}',
-                f'- detalles de {service.name.lower()}'
-            ])
-        
-        return '\n'.join([f'- {ex}' if not ex.startswith('- ') else ex for ex in examples])
+        La última versión nunca se borra. Devuelve las versiones eliminadas.
+        """
+        if grace_seconds is None:
+            grace_seconds = self.VERSION_GRACE_SECONDS
+        versions = self.published_versions()
+        now = time.time()
+        removed = []
+        for version, newer in zip(versions, versions[1:]):
+            try:
+                # Una versión deja de ser la actual cuando se publica la siguiente
+                replaced_at = os.path.getmtime(self.version_path(newer))
+                if now - replaced_at >= grace_seconds:
+                    os.remove(self.version_path(version))
+                    removed.append(version)
+            except FileNotFoundError:
+                continue
+        return removed
     
-    def _generate_price_examples(self, company_data) -> str:
-        examples = [
-            '- cuánto cuesta',
-            '- precio de',
-            '- qué precio tiene',
-            '- cuál es el precio',
-            '- costos',
-            '- precios',
-            '- cuánto vale',
-            '- información de precios'
-        ]
-        
-        # Agregar ejemplos específicos
-        for product in company_data.products[:2]:
-            examples.extend([
-                f'- cuánto cuesta {product.name.lower()}',
-                f'- precio de {product.name.lower()}'
-            ])
-        
-        for service in company_data.services[:2]:
-            examples.extend([
-                f'- cuánto cuesta {service.name.lower()}',
-                f'- precio de {service.name.lower()}'
-            ])
-        
-        return '\n'.join([f'- {ex}' if not ex.startswith('- ') else ex for ex in examples])
+    def compact(self) -> None:
+        """Reescribe el snapshot con los cambios aplicados y vacía el log"""
+        data, version = self.load_with_version()
+        self._write_snapshot(data, version)
     
-    def _generate_company_info_examples(self, company_info) -> str:
-        examples = [
-            '- información de la empresa',
-            '- datos de la empresa',
-            '- detalles de la empresa',
-            '- historia de la empresa',
-            '- misión y visión'
-        ]
-        
-        # Agregar ejemplos específicos
-        examples.extend([
-            f'- cuéntame sobre {company_info.name.lower()}',
-            f'- información sobre {company_info.name.lower()}'
-        ])
+    @metrics.timed('data_source_seconds', source='json', operation='save')
+    def _write_snapshot(self, data: Dict[str, Any], version: int) -> None:
+        self._check_writable()
+        tmp_path = self._tmp_path()
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({self.VERSION_KEY: version, **data}, f, indent=4, ensure_ascii=False)
+                f.flush()
+                os.fsync(f.fileno())
+            self._publish(tmp_path, version)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        if self.snapshot_path is not None:
+            self._write_catalog_snapshot(data, version)
+    
+    def _write_catalog_snapshot(self, data: Dict[str, Any], version: int) -> None:
+        write_catalog_snapshot(data, self.snapshot_path, version)
+    
+    def _publish(self, tmp_path: str, version: int) -> None:
+        """Publica un snapshot ya escrito como versión ``version`` y archivo actual"""
+        os.makedirs(self.versions_dir, exist_ok=True)
+        version_path = self.version_path(version)
+        os.replace(tmp_path, version_path)
+        link_path = self._tmp_path()
+        try:
+            os.link(version_path, link_path)
+        except OSError:
+            # Sistemas de archivos sin hard links
+            shutil.copyfile(version_path, link_path)
+        os.replace(link_path, self.file_path)
+        # Las entradas del log ya están incluidas en el snapshot
+        if os.path.exists(self.changes_path):
+            os.remove(self.changes_path)
+        self.gc_versions()
+    
+    def _check_writable(self) -> None:
+        if self.read_only:
+            raise PermissionError(f"{self.file_path} was opened read-only")
+    
+    def _tmp_path(self) -> str:
+        return f"{self.file_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    
+    def _read_snapshot(self) -> Tuple[Dict[str, Any], int]:
+        try:
+            with open(self.file_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            if not self.read_only:
+                raise
+            return {}, 0    # todavía no hay catálogo publicado
+        return data, data.pop(self.VERSION_KEY, 0)
+    
+    def _peek_snapshot_version(self) -> int:
+        """Lee la versión del snapshot sin parsear el archivo completo"""
+        try:
+            with open(self.file_path, 'rb') as f:
+                match = self._VERSION_RE.match(f.read(64))
+        except FileNotFoundError:
+            return 0
+        return int(match.group(1)) if match else 0
+    
+    def _read_changes(self) -> List[Dict[str, Any]]:
+        try:
+            with open(self.changes_path, 'r', encoding='utf-8') as f:
+                lines = f.read().split('\n')
+        except FileNotFoundError:
+            return []
+        # La última línea sin '\n' puede ser una escritura en curso
+        return [json.loads(line) for line in lines[:-1] if line]
+    
+    @metrics.timed('data_source_seconds', source='json', operation='save')
+    def save_stream(self, data: Dict[str, Any],
+                    streams: Dict[str, Iterable[Dict[str, Any]]]) -> Dict[str, int]:
+        """Guarda los datos escribiendo cada item a medida que llega.
         
-        return '\n'.join([f'- {ex}' if not ex.startswith('- ') else ex for ex in examples])
\ No newline at end of file
+        Se escribe en un archivo temporal que se publica como versión nueva al
+        terminar, así un error a mitad del scraping no deja el archivo truncado.
+        """
+        self._check_writable()
+        counts = {}
+        tmp_path = self._tmp_path()
+        version = self.current_version() + 1
+        # El snapshot binario se arma en la misma pasada, sin recargar el JSON
+        builder = CatalogSnapshotBuilder() if self.snapshot_path is not None else None
+        if builder is not None:
+            streams = {key: builder.wrap(key, items) if key in ITEM_LISTS else items
+                       for key, items in streams.items()}
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                f.write(f'{{\n    {json.dumps(self.VERSION_KEY)}: {version}')
+                separator = ',\n'
+                for key, value in data.items():
+                    if key in streams:
+                        continue
+                    f.write(f'{separator}    {json.dumps(key)}: {json.dumps(value, ensure_ascii=False)}')
+                    separator = ',\n'
+                for key, items in streams.items():
+                    f.write(f'{separator}    {json.dumps(key)}: [')
+                    count = 0
+                    for item in items:
+                        f.write(',\n        ' if count else '\n        ')
+                        f.write(json.dumps(item, ensure_ascii=False))
+                        count += 1
+                    f.write('\n    ]' if count else ']')
+                    counts[key] = count
+                    separator = ',\n'
+                f.write('\n}\n')
+                f.flush()
+                os.fsync(f.fileno())
+            self._publish(tmp_path, version)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        if builder is not None:
+            builder.write(data, self.snapshot_path, version)
+        return counts
\ No newline at end of file
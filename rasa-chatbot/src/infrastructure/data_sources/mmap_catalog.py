@@ -0,0 +1,435 @@
+# rasa-chatbot/src/infrastructure/data_sources/mmap_catalog.py
+import json
+import mmap
+import os
+import struct
+import threading
+import time
+from typing import Dict, Any, Iterable, Iterator, List, Optional, Tuple
+from src.domain.services.catalog_index import normalize_name
+
+# Formato del snapshot (little endian):
+#   cabecera: magic, versión del formato y 8 secciones (offset, tamaño/cantidad)
+#   meta:     JSON con los campos de la compañía, el conteo por categoría y la versión
+#   pool:     strings UTF-8 sin separadores (deduplicados)
+#   records:  un registro de ancho fijo por item, con referencias al pool
+#   names:    (offset, len, item) de cada nombre normalizado, ordenados
+#   suffixes: lo mismo para cada comienzo de palabra del nombre normalizado
+MAGIC = b'CATSNAP1'
+FORMAT_VERSION = 1
+SNAPSHOT_SUFFIX = '.catalog'
+
+_SECTIONS = ('meta', 'pool', 'products', 'services',
+             'product_names', 'service_names', 'product_suffixes', 'service_suffixes')
+_HEADER = struct.Struct('<8sI4x' + 'QQ' * len(_SECTIONS))
+# id, name, description, category/duration, extra (offset, len cada uno) + price, stock, flags
+_RECORD = struct.Struct('<10IdqI4x')
+_ENTRY = struct.Struct('<III')
+
+_STRING_FIELDS = {
+    'products': ('id', 'name', 'description', 'category'),
+    'services': ('id', 'name', 'description', 'duration'),
+}
+_PRICE_FLAG = 1 << 5
+_STOCK_FLAG = 1 << 6
+
+
+def snapshot_path_for(data_path: str) -> str:
+    """Snapshot file that goes with a ``*_data.json`` catalog"""
+    return os.path.splitext(data_path)[0] + SNAPSHOT_SUFFIX
+
+
+class _PoolWriter:
+    def __init__(self):
+        self.buffer = bytearray()
+        self._offsets: Dict[bytes, int] = {}
+
+    def add(self, text: str) -> Tuple[int, int]:
+        encoded = text.encode('utf-8')
+        offset = self._offsets.get(encoded)
+        if offset is None:
+            offset = len(self.buffer)
+            self.buffer += encoded
+            self._offsets[encoded] = offset
+        return offset, len(encoded)
+
+
+class _ItemPacker:
+    """Records and name indexes of one item kind, built one item at a time"""
+
+    def __init__(self, kind: str, pool: _PoolWriter):
+        self.kind = kind
+        self.count = 0
+        self.categories: Dict[str, int] = {}
+        self._fields = _STRING_FIELDS[kind]
+        self._pool = pool
+        self._records = bytearray()
+        self._names: List[Tuple[bytes, int, int, int]] = []
+        self._suffixes: List[Tuple[bytes, int, int, int]] = []
+
+    def add(self, item: Dict[str, Any]) -> None:
+        fields = self._fields
+        pool = self._pool
+        position = self.count
+        self.count += 1
+        if self.kind == 'products':
+            category = item.get('category') or ''
+            self.categories[category] = self.categories.get(category, 0) + 1
+        refs = []
+        flags = 0
+        extra = {}
+        for bit, field in enumerate(fields):
+            value = item.get(field)
+            if isinstance(value, str):
+                refs.extend(pool.add(value))
+                flags |= 1 << bit
+            else:
+                refs.extend((0, 0))
+                if field in item:
+                    extra[field] = value
+        price = item.get('price')
+        if isinstance(price, float):
+            flags |= _PRICE_FLAG
+        else:
+            if 'price' in item:
+                extra['price'] = price
+            price = 0.0
+        stock = item.get('stock')
+        if isinstance(stock, int) and not isinstance(stock, bool):
+            flags |= _STOCK_FLAG
+        else:
+            if 'stock' in item:
+                extra['stock'] = stock
+            stock = 0
+        for key, value in item.items():
+            if key not in fields and key not in ('price', 'stock'):
+                extra[key] = value
+        if extra:
+            refs.extend(pool.add(json.dumps(extra, ensure_ascii=False)))
+            flags |= 1 << len(fields)
+        else:
+            refs.extend((0, 0))
+        self._records += _RECORD.pack(*refs, price, stock, flags)
+
+        normalized = normalize_name(str(item.get('name', '')))
+        if not normalized:
+            return
+        encoded = normalized.encode('utf-8')
+        offset, length = pool.add(normalized)
+        self._names.append((encoded, position, offset, length))
+        # Un sufijo por comienzo de palabra, como en CatalogIndex
+        start = 0
+        while True:
+            self._suffixes.append((encoded[start:], position, offset + start, length - start))
+            start = encoded.find(b' ', start) + 1
+            if start == 0:
+                break
+
+    def finish(self) -> Tuple[bytes, bytes, bytes]:
+        self._names.sort()
+        self._suffixes.sort()
+        return (bytes(self._records),
+                b''.join(_ENTRY.pack(off, length, pos) for _, pos, off, length in self._names),
+                b''.join(_ENTRY.pack(off, length, pos) for _, pos, off, length in self._suffixes))
+
+
+class CatalogSnapshotBuilder:
+    """Builds a snapshot from the items as they stream past.
+
+    ``wrap`` returns the same items while packing them, so a writer that is
+    already iterating the catalog (``JsonDataSource.save_stream``) produces
+    the snapshot in the same pass, without loading the catalog back.
+    """
+
+    def __init__(self):
+        self._pool = _PoolWriter()
+        self._packers = {kind: _ItemPacker(kind, self._pool) for kind in _STRING_FIELDS}
+
+    def add(self, kind: str, item: Dict[str, Any]) -> None:
+        self._packers[kind].add(item)
+
+    def wrap(self, kind: str, items: Iterable[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+        packer = self._packers[kind]
+        for item in items:
+            packer.add(item)
+            yield item
+
+    def write(self, data: Dict[str, Any], path: str, version: Optional[int] = None) -> None:
+        """Write the snapshot (atomically replaces ``path``); list keys of ``data`` are ignored"""
+        pool = self._pool
+        products = self._packers['products']
+        services = self._packers['services']
+        product_records, product_names, product_suffixes = products.finish()
+        service_records, service_names, service_suffixes = services.finish()
+
+        meta = json.dumps({
+            'data': {k: v for k, v in data.items() if k not in ('products', 'services')},
+            'product_categories': products.categories,
+            'version': version,
+        }, ensure_ascii=False).encode('utf-8')
+        if len(pool.buffer) >= 2 ** 32:
+            raise ValueError("Catalog too large for the snapshot format (string pool over 4 GiB)")
+
+        blobs = [meta, bytes(pool.buffer), product_records, service_records,
+                 product_names, service_names, product_suffixes, service_suffixes]
+        counts = [len(meta), len(pool.buffer), products.count, services.count,
+                  len(product_names) // _ENTRY.size, len(service_names) // _ENTRY.size,
+                  len(product_suffixes) // _ENTRY.size, len(service_suffixes) // _ENTRY.size]
+        sections = []
+        offset = _HEADER.size
+        for blob, count in zip(blobs, counts):
+            sections.extend((offset, count))
+            offset += len(blob)
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_path, 'wb') as f:
+                f.write(_HEADER.pack(MAGIC, FORMAT_VERSION, *sections))
+                for blob in blobs:
+                    f.write(blob)
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+
+def write_catalog_snapshot(data: Dict[str, Any], path: str, version: Optional[int] = None) -> None:
+    """Write ``data`` as a compact binary snapshot (atomically replaces ``path``).
+
+    Readers that already mapped the previous file keep using it until they
+    reopen, since the old inode stays alive while mapped.
+    """
+    builder = CatalogSnapshotBuilder()
+    for kind in _STRING_FIELDS:
+        for item in data.get(kind, []) or []:
+            builder.add(kind, item)
+    builder.write(data, path, version)
+
+
+class _MappedItems:
+    """Read-only view over the records and name indexes of one item kind"""
+
+    def __init__(self, catalog: 'MmapCatalog', kind: str, records: Tuple[int, int],
+                 names: Tuple[int, int], suffixes: Tuple[int, int]):
+        self._catalog = catalog
+        self._fields = _STRING_FIELDS[kind]
+        self._records_offset, self.count = records
+        self._names = names
+        self._suffixes = suffixes
+        self._fuzzy = None
+        self._fuzzy_lock = threading.Lock()
+
+    def item(self, position: int) -> Dict[str, Any]:
+        """Decode one record into a dict (only this record is touched)"""
+        mm = self._catalog._mm
+        pool = self._catalog._pool_offset
+        values = _RECORD.unpack_from(mm, self._records_offset + position * _RECORD.size)
+        price, stock, flags = values[10:]
+        item: Dict[str, Any] = {}
+        for bit, field in enumerate(self._fields[:3]):
+            if flags & (1 << bit):
+                item[field] = self._catalog._string(values[bit * 2], values[bit * 2 + 1])
+        if flags & _PRICE_FLAG:
+            item['price'] = price
+        if flags & (1 << 3):
+            item[self._fields[3]] = self._catalog._string(values[6], values[7])
+        if flags & _STOCK_FLAG:
+            item['stock'] = stock
+        if flags & (1 << 4):
+            item.update(json.loads(mm[pool + values[8]:pool + values[8] + values[9]]))
+        return item
+
+    def items(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        count = self.count if limit is None else min(limit, self.count)
+        return [self.item(position) for position in range(count)]
+
+    def name(self, position: int) -> str:
+        values = _RECORD.unpack_from(self._catalog._mm, self._records_offset + position * _RECORD.size)
+        return self._catalog._string(values[2], values[3]) if values[12] & 2 else ''
+
+    def get(self, name: str) -> Optional[Dict[str, Any]]:
+        key = normalize_name(name).encode('utf-8')
+        offset, count = self._names
+        i = self._catalog._bisect(offset, count, key)
+        if i < count:
+            entry_off, length, position = self._catalog._entry(offset, i)
+            if self._catalog._key(entry_off, length) == key:
+                return self.item(position)
+        return None
+
+    def search(self, text: str, limit: int) -> List[Dict[str, Any]]:
+        prefix = normalize_name(text).encode('utf-8')
+        if not prefix:
+            return []
+        offset, count = self._suffixes
+        found = []
+        seen = set()
+        i = self._catalog._bisect(offset, count, prefix)
+        while i < count:
+            entry_off, length, position = self._catalog._entry(offset, i)
+            if not self._catalog._key(entry_off, length).startswith(prefix):
+                break
+            if position not in seen:
+                seen.add(position)
+                found.append(self.item(position))
+                if len(found) >= limit:
+                    break
+            i += 1
+        return found
+
+    def resolve(self, text: str, limit: int, min_score: float) -> List[Tuple[Dict[str, Any], float]]:
+        if self._fuzzy is None:
+            # El índice de trigramas vive en la memoria del proceso: se crea al primer uso
+            from src.domain.services.fuzzy_resolver import FuzzyResolver
+            with self._fuzzy_lock:
+                if self._fuzzy is None:
+                    self._fuzzy = FuzzyResolver([self.name(i) for i in range(self.count)])
+        return [(self.item(position), score)
+                for position, score in self._fuzzy.resolve(text, limit, min_score)]
+
+
+class MmapCatalog:
+    """Catalog served straight from a memory-mapped snapshot file.
+
+    Every action-server worker maps the same read-only file, so the catalog
+    pages live once in the OS page cache instead of once per process as
+    parsed dicts. Opening only reads the header; records are decoded on
+    access. Implements the same lookup methods as ``CatalogIndex``.
+    """
+
+    _instances: Dict[str, Tuple['MmapCatalog', float]] = {}
+    _instances_lock = threading.Lock()
+
+    def __init__(self, path: str):
+        self.path = path
+        with open(path, 'rb') as f:
+            stat = os.fstat(f.fileno())
+            self._stat = (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        header = _HEADER.unpack_from(self._mm, 0)
+        if header[0] != MAGIC or header[1] != FORMAT_VERSION:
+            raise ValueError(f"{path} is not a catalog snapshot (format {FORMAT_VERSION})")
+        sections = dict(zip(_SECTIONS, zip(header[2::2], header[3::2])))
+        meta_offset, meta_length = sections['meta']
+        meta = json.loads(self._mm[meta_offset:meta_offset + meta_length])
+        self.data: Dict[str, Any] = meta['data']
+        self.product_categories: Dict[str, int] = meta['product_categories']
+        # Versión del catálogo JSON de la que salió (None si no se indicó)
+        self.version: Optional[int] = meta.get('version')
+        self._pool_offset = sections['pool'][0]
+        self.products = _MappedItems(self, 'products', sections['products'],
+                                     sections['product_names'], sections['product_suffixes'])
+        self.services = _MappedItems(self, 'services', sections['services'],
+                                     sections['service_names'], sections['service_suffixes'])
+
+    @classmethod
+    def for_path(cls, path: str, check_interval: float = 1.0) -> 'MmapCatalog':
+        """Shared catalog for ``path``, remapped when the file is replaced.
+
+        The file is stat'ed at most once per ``check_interval`` seconds.
+        """
+        key = os.path.abspath(path)
+        cached = cls._instances.get(key)
+        now = time.monotonic()
+        if cached is not None and now - cached[1] < check_interval:
+            return cached[0]
+        with cls._instances_lock:
+            cached = cls._instances.get(key)
+            if cached is not None and now - cached[1] < check_interval:
+                return cached[0]
+            catalog = cached[0] if cached is not None else None
+            if catalog is None or catalog._file_changed():
+                catalog = cls(path)
+            cls._instances[key] = (catalog, now)
+            return catalog
+
+    def _file_changed(self) -> bool:
+        try:
+            stat = os.stat(self.path)
+        except OSError:
+            return False
+        return (stat.st_ino, stat.st_mtime_ns, stat.st_size) != self._stat
+
+    # --- Protocolo de búsqueda (igual que CatalogIndex) --------------------
+
+    def get_product_by_name(self, name: str) -> Optional[Dict[str, Any]]:
+        """Find a product by its (normalized) exact name"""
+        return self.products.get(name)
+
+    def get_service_by_name(self, name: str) -> Optional[Dict[str, Any]]:
+        """Find a service by its (normalized) exact name"""
+        return self.services.get(name)
+
+    def search_products(self, text: str, limit: int = 10) -> List[Dict[str, Any]]:
+        """Find products whose name contains a word starting with ``text``"""
+        return self.products.search(text, limit)
+
+    def search_services(self, text: str, limit: int = 10) -> List[Dict[str, Any]]:
+        """Find services whose name contains a word starting with ``text``"""
+        return self.services.search(text, limit)
+
+    def resolve_product(self, text: str, limit: int = 5,
+                        min_score: float = 0.3) -> List[Tuple[Dict[str, Any], float]]:
+        """Fuzzy-match a product name; returns (product, score) best first"""
+        return self.products.resolve(text, limit, min_score)
+
+    def resolve_service(self, text: str, limit: int = 5,
+                        min_score: float = 0.3) -> List[Tuple[Dict[str, Any], float]]:
+        """Fuzzy-match a service name; returns (service, score) best first"""
+        return self.services.resolve(text, limit, min_score)
+
+    def list_products(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        return self.products.items(limit)
+
+    def list_services(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        return self.services.items(limit)
+
+    def count_products(self) -> int:
+        return self.products.count
+
+    def count_services(self) -> int:
+        return self.services.count
+
+    def product_category_counts(self) -> Dict[str, int]:
+        return self.product_categories
+
+    def warm_up(self) -> None:
+        """Build the per-process fuzzy indexes"""
+        self.products.resolve('', 0, 1.0)
+        self.services.resolve('', 0, 1.0)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Materialize the whole catalog (for tools and checks, not for serving)"""
+        data = dict(self.data)
+        data['products'] = self.products.items()
+        data['services'] = self.services.items()
+        return data
+
+    # --- Acceso al mapa ------------------------------------------------------
+
+    def _string(self, offset: int, length: int) -> str:
+        start = self._pool_offset + offset
+        return str(self._mm[start:start + length], 'utf-8')
+
+    def _key(self, offset: int, length: int) -> bytes:
+        start = self._pool_offset + offset
+        return self._mm[start:start + length]
+
+    def _entry(self, section_offset: int, index: int) -> Tuple[int, int, int]:
+        return _ENTRY.unpack_from(self._mm, section_offset + index * _ENTRY.size)
+
+    def _bisect(self, section_offset: int, count: int, key: bytes) -> int:
+        """First entry whose key is >= ``key``"""
+        low, high = 0, count
+        while low < high:
+            middle = (low + high) // 2
+            entry_off, length, _ = self._entry(section_offset, middle)
+            if self._key(entry_off, length) < key:
+                low = middle + 1
+            else:
+                high = middle
+        return low
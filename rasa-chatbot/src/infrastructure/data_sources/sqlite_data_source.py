@@ -0,0 +1,385 @@
+# rasa-chatbot/src/infrastructure/data_sources/sqlite_data_source.py
+import json
+import os
+import sqlite3
+import threading
+from itertools import islice
+from typing import Dict, Any, Iterable, Iterator, List, Optional, Tuple
+from src.application.interfaces.data_source_interface import DataSourceInterface
+from src.domain.services.catalog_diff import ITEM_LISTS, diff_catalog
+from src.domain.services.catalog_index import normalize_name
+from src.infrastructure.monitoring.metrics import metrics
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS changes (
+    version INTEGER PRIMARY KEY,
+    delta TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS items (
+    kind TEXT NOT NULL,
+    id TEXT,
+    name TEXT,
+    name_norm TEXT,
+    category TEXT,
+    price REAL,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_items_id ON items (kind, id);
+CREATE INDEX IF NOT EXISTS idx_items_name ON items (kind, name_norm);
+CREATE INDEX IF NOT EXISTS idx_items_category ON items (kind, category);
+CREATE INDEX IF NOT EXISTS idx_items_price ON items (kind, price);
+CREATE TABLE IF NOT EXISTS item_words (
+    kind TEXT NOT NULL,
+    suffix TEXT NOT NULL,
+    item INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_item_words_suffix ON item_words (kind, suffix, item);
+CREATE INDEX IF NOT EXISTS idx_item_words_item ON item_words (item);
+"""
+
+# Clave reservada en 'meta' para la versión de los datos
+_VERSION_KEY = '_version'
+
+
+class SqliteDataSource(DataSourceInterface):
+    """Almacenamiento en SQLite con índices por id, nombre, categoría y precio.
+
+    Los datos de nivel superior (nombre, sitio web...) van a ``meta``; cada
+    producto o servicio es una fila de ``items`` con el item completo en JSON
+    más las columnas indexadas. Las consultas (``get_product_by_name``,
+    ``list_products_by_category``, ``list_by_price_range``...) usan esos
+    índices sin cargar el catálogo entero. ``item_words`` guarda cada
+    comienzo de palabra del nombre normalizado, para que ``search_*``
+    encuentre lo mismo que ``CatalogIndex``. ``update_data`` aplica solo el
+    delta y lo registra en ``changes`` para ``changes_since``.
+    """
+
+    BATCH_SIZE = 1000
+
+    def __init__(self, db_path: str):
+        self.db_path = db_path
+        self._local = threading.local()
+        self._fuzzy_cache: Dict[str, Tuple[int, Any, List[int]]] = {}
+        directory = os.path.dirname(db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with self._connection() as conn:
+            conn.executescript(_SCHEMA)
+            # Bases creadas antes de item_words: se indexan una vez
+            if conn.execute('SELECT EXISTS (SELECT 1 FROM items) '
+                            'AND NOT EXISTS (SELECT 1 FROM item_words)').fetchone()[0]:
+                self._index_words(conn, conn.execute('SELECT rowid, kind, name_norm FROM items'))
+
+    def _connection(self) -> sqlite3.Connection:
+        """One connection per thread (sqlite3 connections are not shareable)"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path)
+            conn.execute('PRAGMA journal_mode=WAL')
+            self._local.conn = conn
+        return conn
+
+    # --- DataSourceInterface ---------------------------------------------
+
+    def save_data(self, data: Dict[str, Any]) -> None:
+        """Replace all stored data"""
+        streams = {key: data[key] for key in ITEM_LISTS if isinstance(data.get(key), list)}
+        self.save_stream({k: v for k, v in data.items() if k not in streams}, streams)
+
+    @metrics.timed('data_source_seconds', source='sqlite', operation='save')
+    def save_stream(self, data: Dict[str, Any],
+                    streams: Dict[str, Iterable[Dict[str, Any]]]) -> Dict[str, int]:
+        """Replace all stored data, inserting streamed items in batches"""
+        counts = {}
+        conn = self._connection()
+        with conn:
+            version = self._version(conn) + 1
+            conn.execute('DELETE FROM items')
+            conn.execute('DELETE FROM item_words')
+            conn.execute('DELETE FROM meta')
+            conn.execute('DELETE FROM changes')
+            self._set_meta(conn, data)
+            for kind, items in streams.items():
+                counts[kind] = 0
+                iterator = iter(items)
+                while True:
+                    batch = list(islice(iterator, self.BATCH_SIZE))
+                    if not batch:
+                        break
+                    conn.executemany(
+                        'INSERT INTO items (kind, id, name, name_norm, category, price, data) '
+                        'VALUES (?, ?, ?, ?, ?, ?, ?)',
+                        (self._row(kind, item) for item in batch),
+                    )
+                    counts[kind] += len(batch)
+            self._index_words(conn, conn.execute('SELECT rowid, kind, name_norm FROM items'))
+            self._set_version(conn, version)
+        return counts
+
+    @metrics.timed('data_source_seconds', source='sqlite', operation='load')
+    def load_data(self) -> Dict[str, Any]:
+        """Load the whole catalog as a dict"""
+        conn = self._connection()
+        data = {
+            key: json.loads(value)
+            for key, value in conn.execute('SELECT key, value FROM meta WHERE key != ?', (_VERSION_KEY,))
+        }
+        # products y services siempre están, aunque no tengan filas
+        kinds = list(ITEM_LISTS)
+        kinds += [row[0] for row in conn.execute('SELECT DISTINCT kind FROM items') if row[0] not in kinds]
+        for kind in kinds:
+            data[kind] = list(self._iter_items(kind))
+        return data
+
+    @metrics.timed('data_source_seconds', source='sqlite', operation='update')
+    def update_data(self, data: Dict[str, Any]) -> None:
+        """Apply only what changed (items diffed by id) and log the delta"""
+        delta = diff_catalog(self.load_data(), data)
+        if not delta:
+            return
+        conn = self._connection()
+        with conn:
+            version = self._version(conn) + 1
+            set_values = dict(delta.get('set', {}))
+            for kind in list(set_values):
+                if isinstance(set_values[kind], list) and kind in ITEM_LISTS:
+                    # Lista sin ids utilizables: se reemplaza completa
+                    conn.execute('DELETE FROM items WHERE kind = ?', (kind,))
+                    conn.execute('DELETE FROM item_words WHERE kind = ?', (kind,))
+                    conn.executemany(
+                        'INSERT INTO items (kind, id, name, name_norm, category, price, data) '
+                        'VALUES (?, ?, ?, ?, ?, ?, ?)',
+                        (self._row(kind, item) for item in set_values.pop(kind)),
+                    )
+                    self._index_words(conn, conn.execute(
+                        'SELECT rowid, kind, name_norm FROM items WHERE kind = ?', (kind,)))
+            self._set_meta(conn, set_values)
+            for kind, items_diff in delta.get('items', {}).items():
+                for item_id in items_diff.get('removed', []):
+                    conn.execute('DELETE FROM item_words WHERE item IN '
+                                 '(SELECT rowid FROM items WHERE kind = ? AND id = ?)', (kind, item_id))
+                    conn.execute('DELETE FROM items WHERE kind = ? AND id = ?', (kind, item_id))
+                for change in items_diff.get('changed', []):
+                    row = conn.execute('SELECT rowid, data FROM items WHERE kind = ? AND id = ?',
+                                       (kind, change['id'])).fetchone()
+                    item = json.loads(row[1])
+                    for key in change.get('unset', ()):
+                        item.pop(key, None)
+                    item.update(change['fields'])
+                    values = self._row(kind, item)
+                    conn.execute(
+                        'UPDATE items SET id = ?, name = ?, name_norm = ?, category = ?, price = ?, data = ? '
+                        'WHERE rowid = ?',
+                        values[1:] + (row[0],),
+                    )
+                    conn.execute('DELETE FROM item_words WHERE item = ?', (row[0],))
+                    self._index_words(conn, [(row[0], kind, values[3])])
+                for item in items_diff.get('added', []):
+                    values = self._row(kind, item)
+                    cursor = conn.execute(
+                        'INSERT INTO items (kind, id, name, name_norm, category, price, data) '
+                        'VALUES (?, ?, ?, ?, ?, ?, ?)',
+                        values,
+                    )
+                    self._index_words(conn, [(cursor.lastrowid, kind, values[3])])
+                if 'order' in items_diff:
+                    self._reorder(conn, kind, items_diff['order'])
+            conn.execute('INSERT INTO changes (version, delta) VALUES (?, ?)',
+                         (version, json.dumps(delta, ensure_ascii=False)))
+            self._set_version(conn, version)
+
+    def current_version(self) -> int:
+        return self._version(self._connection())
+
+    def changes_since(self, version: int) -> Optional[List[Dict[str, Any]]]:
+        conn = self._connection()
+        first = conn.execute('SELECT MIN(version) FROM changes').fetchone()[0]
+        current = self._version(conn)
+        if version >= current:
+            return []
+        # El log empieza en el último save completo: antes de eso hay que recargar
+        if first is None or version < first - 1:
+            return None
+        return [
+            {'version': v, 'delta': json.loads(delta)}
+            for v, delta in conn.execute('SELECT version, delta FROM changes WHERE version > ? '
+                                         'ORDER BY version', (version,))
+        ]
+
+    # --- Consultas indexadas ---------------------------------------------
+
+    def get_product_by_name(self, name: str) -> Optional[Dict[str, Any]]:
+        return self._get_by_name('products', name)
+
+    def get_service_by_name(self, name: str) -> Optional[Dict[str, Any]]:
+        return self._get_by_name('services', name)
+
+    def search_products(self, text: str, limit: int = 10) -> List[Dict[str, Any]]:
+        """Products with a word of the normalized name starting with ``text``"""
+        return self._search('products', text, limit)
+
+    def search_services(self, text: str, limit: int = 10) -> List[Dict[str, Any]]:
+        """Services with a word of the normalized name starting with ``text``"""
+        return self._search('services', text, limit)
+
+    def list_products_by_category(self, category: str, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        return self._query('SELECT data FROM items WHERE kind = ? AND category = ? ORDER BY rowid',
+                           ('products', category), limit)
+
+    def list_by_price_range(self, kind: str, min_price: float, max_price: float,
+                            limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        return self._query('SELECT data FROM items WHERE kind = ? AND price BETWEEN ? AND ? ORDER BY price',
+                           (kind, min_price, max_price), limit)
+
+    def list_products(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        return self._query('SELECT data FROM items WHERE kind = ? ORDER BY rowid', ('products',), limit)
+
+    def list_services(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        return self._query('SELECT data FROM items WHERE kind = ? ORDER BY rowid', ('services',), limit)
+
+    def count_products(self) -> int:
+        return self._count('products')
+
+    def count_services(self) -> int:
+        return self._count('services')
+
+    def product_category_counts(self) -> Dict[str, int]:
+        rows = self._connection().execute(
+            'SELECT category, COUNT(*) FROM items WHERE kind = ? GROUP BY category ORDER BY MIN(rowid)',
+            ('products',),
+        )
+        return {category or '': count for category, count in rows}
+
+    def resolve_product(self, text: str, limit: int = 5,
+                        min_score: float = 0.3) -> List[Tuple[Dict[str, Any], float]]:
+        return self._resolve('products', text, limit, min_score)
+
+    def resolve_service(self, text: str, limit: int = 5,
+                        min_score: float = 0.3) -> List[Tuple[Dict[str, Any], float]]:
+        return self._resolve('services', text, limit, min_score)
+
+    # --- Internos ----------------------------------------------------------
+
+    @staticmethod
+    def _row(kind: str, item: Dict[str, Any]) -> Tuple:
+        name = str(item.get('name', ''))
+        price = item.get('price')
+        return (
+            kind,
+            item.get('id'),
+            name,
+            normalize_name(name),
+            item.get('category'),
+            price if isinstance(price, (int, float)) else None,
+            json.dumps(item, ensure_ascii=False),
+        )
+
+    def _iter_items(self, kind: str) -> Iterator[Dict[str, Any]]:
+        for (data,) in self._connection().execute(
+                'SELECT data FROM items WHERE kind = ? ORDER BY rowid', (kind,)):
+            yield json.loads(data)
+
+    def _get_by_name(self, kind: str, name: str) -> Optional[Dict[str, Any]]:
+        row = self._connection().execute(
+            'SELECT data FROM items WHERE kind = ? AND name_norm = ? ORDER BY rowid LIMIT 1',
+            (kind, normalize_name(name)),
+        ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def _search(self, kind: str, text: str, limit: int) -> List[Dict[str, Any]]:
+        # Mismo orden que CatalogIndex: por sufijo y, a igual sufijo, por posición
+        prefix = normalize_name(text)
+        if not prefix:
+            return []
+        rows = self._connection().execute(
+            'SELECT w.item, i.data FROM item_words w JOIN items i ON i.rowid = w.item '
+            'WHERE w.kind = ? AND w.suffix >= ? AND w.suffix < ? ORDER BY w.suffix, w.item',
+            (kind, prefix, prefix + '\U0010ffff'),
+        )
+        found = []
+        seen = set()
+        for rowid, data in rows:
+            if rowid in seen:
+                continue
+            seen.add(rowid)
+            found.append(json.loads(data))
+            if len(found) >= limit:
+                break
+        return found
+
+    def _query(self, sql: str, params: Tuple, limit: Optional[int]) -> List[Dict[str, Any]]:
+        if limit is not None:
+            sql += ' LIMIT ?'
+            params = params + (limit,)
+        return [json.loads(data) for (data,) in self._connection().execute(sql, params)]
+
+    def _count(self, kind: str) -> int:
+        return self._connection().execute('SELECT COUNT(*) FROM items WHERE kind = ?', (kind,)).fetchone()[0]
+
+    def _resolve(self, kind: str, text: str, limit: int, min_score: float) -> List[Tuple[Dict[str, Any], float]]:
+        # Solo los nombres se cargan en memoria, una vez por versión de los datos
+        from src.domain.services.fuzzy_resolver import FuzzyResolver
+        conn = self._connection()
+        version = self._version(conn)
+        cached = self._fuzzy_cache.get(kind)
+        if cached is None or cached[0] != version:
+            rows = conn.execute('SELECT rowid, name FROM items WHERE kind = ? ORDER BY rowid', (kind,)).fetchall()
+            cached = (version, FuzzyResolver([name or '' for _, name in rows]), [rowid for rowid, _ in rows])
+            self._fuzzy_cache[kind] = cached
+        _, resolver, rowids = cached
+        results = []
+        for position, score in resolver.resolve(text, limit, min_score):
+            row = conn.execute('SELECT data FROM items WHERE rowid = ?', (rowids[position],)).fetchone()
+            if row:
+                results.append((json.loads(row[0]), score))
+        return results
+
+    def _reorder(self, conn: sqlite3.Connection, kind: str, order: List[str]) -> None:
+        """Reinsert the items of ``kind`` so their rowids follow ``order``"""
+        rows = {row[0]: row for row in conn.execute(
+            'SELECT id, name, name_norm, category, price, data FROM items WHERE kind = ?', (kind,))}
+        conn.execute('DELETE FROM item_words WHERE kind = ?', (kind,))
+        conn.execute('DELETE FROM items WHERE kind = ?', (kind,))
+        conn.executemany(
+            'INSERT INTO items (kind, id, name, name_norm, category, price, data) '
+            'VALUES (?, ?, ?, ?, ?, ?, ?)',
+            ((kind,) + rows[item_id] for item_id in order),
+        )
+        self._index_words(conn, conn.execute(
+            'SELECT rowid, kind, name_norm FROM items WHERE kind = ?', (kind,)))
+
+    @staticmethod
+    def _index_words(conn: sqlite3.Connection, rows: Iterable[Tuple[int, str, str]]) -> None:
+        """Add a row to ``item_words`` for every word start of each (rowid, kind, name_norm)"""
+        def suffixes():
+            for rowid, kind, name_norm in rows:
+                if not name_norm:
+                    continue
+                words = name_norm.split(' ')
+                for i in range(len(words)):
+                    yield kind, ' '.join(words[i:]), rowid
+        conn.executemany('INSERT INTO item_words (kind, suffix, item) VALUES (?, ?, ?)', suffixes())
+
+    def _set_meta(self, conn: sqlite3.Connection, data: Dict[str, Any]) -> None:
+        conn.executemany('INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)',
+                         ((key, json.dumps(value, ensure_ascii=False)) for key, value in data.items()))
+
+    def _version(self, conn: sqlite3.Connection) -> int:
+        row = conn.execute('SELECT value FROM meta WHERE key = ?', (_VERSION_KEY,)).fetchone()
+        return int(row[0]) if row else 0
+
+    def _set_version(self, conn: sqlite3.Connection, version: int) -> None:
+        conn.execute('INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)', (_VERSION_KEY, str(version)))
+
+
+def migrate_json_to_sqlite(json_path: str, db_path: str) -> Dict[str, int]:
+    """Copy a ``*_data.json`` catalog into a SQLite database"""
+    from src.infrastructure.data_sources.json_data_source import JsonDataSource
+    data = JsonDataSource(json_path).load_data()
+    streams = {key: data[key] for key in ITEM_LISTS if isinstance(data.get(key), list)}
+    header = {k: v for k, v in data.items() if k not in streams}
+    return SqliteDataSource(db_path).save_stream(header, streams)
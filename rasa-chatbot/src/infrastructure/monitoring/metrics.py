@@ -0,0 +1,238 @@
+# rasa-chatbot/src/infrastructure/monitoring/metrics.py
+import atexit
+import functools
+import json
+import os
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager, nullcontext
+from typing import Dict, Any, Callable, ContextManager, Iterator, List, Optional, Tuple
+from src.config.settings import Settings
+
+# Límites (en segundos) de los buckets de los histogramas, como en Prometheus
+DEFAULT_BUCKETS = (0.001, 0.005, 0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 300.0)
+PREFIX = 'chatbot_'
+
+_LabelKey = Tuple[Tuple[str, str], ...]
+_NULL_TIMER = nullcontext()
+
+
+class _Histogram:
+    __slots__ = ('bucket_counts', 'count', 'sum', 'max')
+
+    def __init__(self, buckets: int):
+        self.bucket_counts = [0] * (buckets + 1)     # el último es +Inf
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+
+class Metrics:
+    """In-process counters, timers and histograms with labels.
+
+    Disabled by default (``METRICS_ENABLED=1`` or ``--metrics`` turns it
+    on): every recording call then returns right after checking
+    ``enabled``, and ``timer`` hands back a shared no-op context manager.
+    Labels set with ``set_labels`` (e.g. the company being refreshed) are
+    added to everything recorded afterwards in this process, including
+    from worker threads.
+    """
+
+    def __init__(self, enabled: bool = False, buckets: Tuple[float, ...] = DEFAULT_BUCKETS):
+        self.enabled = enabled
+        self.buckets = tuple(buckets)
+        self._labels: Dict[str, str] = {}
+        self._counters: Dict[Tuple[str, _LabelKey], float] = {}
+        self._histograms: Dict[Tuple[str, _LabelKey], _Histogram] = {}
+        self._lock = threading.Lock()
+        self._exporter: Optional[threading.Thread] = None
+
+    def set_labels(self, **labels: Any) -> None:
+        """Labels added to every metric recorded from now on (``None`` removes one)"""
+        for name, value in labels.items():
+            if value is None:
+                self._labels.pop(name, None)
+            else:
+                self._labels[name] = str(value)
+
+    def inc(self, name: str, value: float = 1, **labels: Any) -> None:
+        """Add ``value`` to a counter"""
+        if not self.enabled:
+            return
+        key = (name, self._label_key(labels))
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + value
+
+    def observe(self, name: str, value: float, **labels: Any) -> None:
+        """Record one value (usually seconds) in a histogram"""
+        if not self.enabled:
+            return
+        key = (name, self._label_key(labels))
+        bucket = bisect_left(self.buckets, value)
+        with self._lock:
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                histogram = self._histograms[key] = _Histogram(len(self.buckets))
+            histogram.bucket_counts[bucket] += 1
+            histogram.count += 1
+            histogram.sum += value
+            histogram.max = max(histogram.max, value)
+
+    def timer(self, name: str, **labels: Any) -> ContextManager:
+        """Context manager recording its wall time in the ``name`` histogram"""
+        if not self.enabled:
+            return _NULL_TIMER
+        return self._timer(name, labels)
+
+    @contextmanager
+    def _timer(self, name: str, labels: Dict[str, Any]) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - start, **labels)
+
+    def timed(self, name: str, **labels: Any) -> Callable:
+        """Decorator timing every call of the function (checked per call, so it
+        follows ``enabled`` changes made after import)"""
+        def decorator(fn: Callable) -> Callable:
+            @functools.wraps(fn)
+            def wrapper(*args, **kwargs):
+                if not self.enabled:
+                    return fn(*args, **kwargs)
+                start = time.perf_counter()
+                try:
+                    return fn(*args, **kwargs)
+                finally:
+                    self.observe(name, time.perf_counter() - start, **labels)
+            return wrapper
+        return decorator
+
+    def reset(self) -> None:
+        with self._lock:
+            self._counters.clear()
+            self._histograms.clear()
+
+    def snapshot(self) -> Dict[str, List[Dict[str, Any]]]:
+        """JSON-serializable copy of everything recorded (see ``merge``)"""
+        with self._lock:
+            return {
+                'counters': [{'name': name, 'labels': dict(key), 'value': value}
+                             for (name, key), value in sorted(self._counters.items())],
+                'histograms': [{'name': name, 'labels': dict(key), 'count': h.count,
+                                'sum': h.sum, 'max': h.max, 'buckets': list(self.buckets),
+                                'bucket_counts': list(h.bucket_counts)}
+                               for (name, key), h in sorted(self._histograms.items())],
+            }
+
+    def merge(self, snapshot: Dict[str, List[Dict[str, Any]]]) -> None:
+        """Add a snapshot taken in another process (e.g. a refresh-all worker)"""
+        with self._lock:
+            for counter in snapshot.get('counters', []):
+                key = (counter['name'], tuple(sorted(counter['labels'].items())))
+                self._counters[key] = self._counters.get(key, 0) + counter['value']
+            for entry in snapshot.get('histograms', []):
+                if tuple(entry['buckets']) != self.buckets:
+                    continue
+                key = (entry['name'], tuple(sorted(entry['labels'].items())))
+                histogram = self._histograms.get(key)
+                if histogram is None:
+                    histogram = self._histograms[key] = _Histogram(len(self.buckets))
+                histogram.bucket_counts = [a + b for a, b in zip(histogram.bucket_counts, entry['bucket_counts'])]
+                histogram.count += entry['count']
+                histogram.sum += entry['sum']
+                histogram.max = max(histogram.max, entry['max'])
+
+    def to_prometheus(self) -> str:
+        """Prometheus text exposition format (for the node_exporter textfile collector)"""
+        snapshot = self.snapshot()
+        lines = []
+        declared = set()
+        for counter in snapshot['counters']:
+            name = PREFIX + counter['name']
+            if name not in declared:
+                lines.append(f"# TYPE {name} counter")
+                declared.add(name)
+            lines.append(f"{name}{_format_labels(counter['labels'])} {counter['value']:g}")
+        for entry in snapshot['histograms']:
+            name = PREFIX + entry['name']
+            if name not in declared:
+                lines.append(f"# TYPE {name} histogram")
+                declared.add(name)
+            cumulative = 0
+            bounds = [f"{bound:g}" for bound in entry['buckets']] + ['+Inf']
+            for bound, count in zip(bounds, entry['bucket_counts']):
+                cumulative += count
+                lines.append(f"{name}_bucket{_format_labels(entry['labels'], le=bound)} {cumulative}")
+            lines.append(f"{name}_sum{_format_labels(entry['labels'])} {entry['sum']:.6f}")
+            lines.append(f"{name}_count{_format_labels(entry['labels'])} {entry['count']}")
+        return '\n'.join(lines) + '\n'
+
+    def write_prometheus(self, path: str) -> None:
+        _write_atomic(path, self.to_prometheus())
+
+    def start_export(self, path: str, interval: float) -> None:
+        """Rewrite the Prometheus text file every ``interval`` seconds.
+
+        For long-running processes such as the action server, which never
+        reach the end-of-run ``write_prometheus`` of ``main.py``. Runs in a
+        daemon thread; the file is removed at exit, so a stopped process does
+        not leave its last values behind.
+        """
+        if not self.enabled or self._exporter is not None:
+            return
+
+        def export() -> None:
+            while True:
+                time.sleep(interval)
+                try:
+                    self.write_prometheus(path)
+                except OSError as e:
+                    print(f"Error writing metrics to {path}: {e}")
+
+        def remove() -> None:
+            if os.path.exists(path):
+                os.remove(path)
+
+        self.write_prometheus(path)
+        atexit.register(remove)
+        self._exporter = threading.Thread(target=export, name='metrics-export', daemon=True)
+        self._exporter.start()
+
+    def write_report(self, path: str, **extra: Any) -> None:
+        """JSON run report: ``extra`` fields plus the recorded metrics"""
+        report = dict(extra, metrics=self.snapshot())
+        _write_atomic(path, json.dumps(report, indent=4, ensure_ascii=False))
+
+    def _label_key(self, labels: Dict[str, Any]) -> _LabelKey:
+        if not self._labels:
+            return tuple(sorted((name, str(value)) for name, value in labels.items()))
+        merged = dict(self._labels)
+        merged.update((name, str(value)) for name, value in labels.items())
+        return tuple(sorted(merged.items()))
+
+
+def _format_labels(labels: Dict[str, str], **extra: str) -> str:
+    labels = dict(labels, **extra)
+    if not labels:
+        return ''
+    return '{' + ','.join(f'{name}="{_escape(value)}"' for name, value in sorted(labels.items())) + '}'
+
+
+def _escape(value: str) -> str:
+    return value.replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
+
+
+def _write_atomic(path: str, content: str) -> None:
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        f.write(content)
+    os.replace(tmp_path, path)
+
+
+# Instancia compartida por todo el proceso
+metrics = Metrics(enabled=Settings.METRICS_ENABLED)
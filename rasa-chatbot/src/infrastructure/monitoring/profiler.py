@@ -0,0 +1,193 @@
+# rasa-chatbot/src/infrastructure/monitoring/profiler.py
+import cProfile
+import json
+import os
+import re
+import sys
+import threading
+import time
+import tracemalloc
+from collections import Counter
+from contextlib import contextmanager, nullcontext
+from typing import Dict, Any, ContextManager, Iterable, Iterator, List, Optional
+
+MODES = ('cprofile', 'sampling', 'memory')
+
+_NULL_STAGE = nullcontext()
+_UNSAFE_CHARS = re.compile(r'[^\w.-]+')
+
+
+class _Stage:
+    __slots__ = ('name', 'path', 'profile', 'peak', 'snapshot', 'overhead')
+
+    def __init__(self, name: str, path: str):
+        self.name = name
+        self.path = path
+        self.profile: Optional[cProfile.Profile] = None
+        self.peak = 0
+        self.snapshot: Optional[tracemalloc.Snapshot] = None
+        self.overhead = 0.0     # tiempo del propio profiler dentro de la etapa (no se informa)
+
+
+class StageProfiler:
+    """Profiles named pipeline stages (``--profile`` in main.py).
+
+    Each stage can run under cProfile (one ``.pstats`` file per stage),
+    under a sampling profiler that records the stacks of every thread into
+    a collapsed-stack file for flamegraphs (``stacks.collapsed``, with the
+    stage path as root frames), and under tracemalloc (peak memory and top
+    allocation sites per stage, in ``stages.json``). The time spent taking
+    snapshots and writing the profiles of inner stages is left out of the
+    outer stage's time.
+
+    Stages may nest: cProfile is paused in the outer stage while an inner
+    one runs, so each ``.pstats`` covers only its own stage; memory peaks
+    of inner stages count towards the outer ones. cProfile only sees the
+    thread that entered the stage; scraper fetch threads show up in the
+    sampled stacks. Disabled until ``configure`` is called, ``stage`` then
+    returns a shared no-op context manager.
+    """
+
+    SAMPLE_INTERVAL = 0.005
+    TOP_ALLOCATIONS = 10
+
+    def __init__(self):
+        self.enabled = False
+        self.output_dir: Optional[str] = None
+        self.modes: tuple = ()
+        self.stages: List[Dict[str, Any]] = []
+        self._stack: List[_Stage] = []
+        self._samples: Counter = Counter()
+        self._sampler: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+
+    def configure(self, output_dir: str, modes: Iterable[str] = MODES) -> None:
+        """Start profiling the stages that run from now on into ``output_dir``"""
+        modes = tuple(modes)
+        unknown = set(modes) - set(MODES)
+        if unknown:
+            raise ValueError(f"Unknown profile modes: {', '.join(sorted(unknown))}")
+        os.makedirs(output_dir, exist_ok=True)
+        self.output_dir = output_dir
+        self.modes = modes
+        self.stages = []
+        self._samples.clear()
+        self.enabled = True
+        if 'memory' in modes and not tracemalloc.is_tracing():
+            tracemalloc.start()
+        if 'sampling' in modes:
+            self._stop.clear()
+            self._sampler = threading.Thread(target=self._sample_loop, name='profiler-sampler', daemon=True)
+            self._sampler.start()
+
+    def stage(self, name: str) -> ContextManager:
+        """Context manager profiling the code it wraps as stage ``name``"""
+        if not self.enabled:
+            return _NULL_STAGE
+        return self._stage(name)
+
+    @contextmanager
+    def _stage(self, name: str) -> Iterator[None]:
+        setup_start = time.perf_counter()
+        parent = self._stack[-1] if self._stack else None
+        stage = _Stage(name, f"{parent.path};{name}" if parent else name)
+        if parent is not None and parent.profile is not None:
+            parent.profile.disable()
+        if 'memory' in self.modes:
+            stage.snapshot = self._snapshot()
+            if parent is not None:
+                parent.peak = max(parent.peak, tracemalloc.get_traced_memory()[1])
+            tracemalloc.reset_peak()
+        if 'cprofile' in self.modes:
+            stage.profile = cProfile.Profile()
+        self._stack.append(stage)
+        start = time.perf_counter()
+        if parent is not None:
+            parent.overhead += start - setup_start
+        if stage.profile is not None:
+            stage.profile.enable()
+        try:
+            yield
+        finally:
+            if stage.profile is not None:
+                stage.profile.disable()
+            finish_start = time.perf_counter()
+            self._stack.pop()
+            self._finish(stage, finish_start - start - stage.overhead, parent)
+            if parent is not None:
+                parent.overhead += stage.overhead + time.perf_counter() - finish_start
+            if parent is not None and parent.profile is not None:
+                parent.profile.enable()
+
+    def _finish(self, stage: _Stage, seconds: float, parent: Optional[_Stage]) -> None:
+        index = len(self.stages) + 1
+        record: Dict[str, Any] = {'stage': stage.path, 'seconds': round(seconds, 4)}
+        if stage.profile is not None:
+            filename = f"{index:02d}_{_UNSAFE_CHARS.sub('_', stage.path)}.pstats"
+            stage.profile.dump_stats(os.path.join(self.output_dir, filename))
+            record['pstats'] = filename
+        if 'memory' in self.modes:
+            peak = max(stage.peak, tracemalloc.get_traced_memory()[1])
+            record['peak_mb'] = round(peak / 1e6, 2)
+            # Lo que más creció durante la etapa (memoria que sigue viva al terminar)
+            record['top_allocations'] = [
+                {'location': str(stat.traceback), 'size_diff_mb': round(stat.size_diff / 1e6, 3),
+                 'count_diff': stat.count_diff}
+                for stat in self._snapshot().compare_to(stage.snapshot, 'lineno')[:self.TOP_ALLOCATIONS]
+                if stat.size_diff > 0
+            ]
+            stage.snapshot = None
+            if parent is not None:
+                parent.peak = max(parent.peak, peak)
+            tracemalloc.reset_peak()
+        self.stages.append(record)
+
+    @staticmethod
+    def _snapshot() -> tracemalloc.Snapshot:
+        """Traced allocations, without the profiler's own"""
+        return tracemalloc.take_snapshot().filter_traces([
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, cProfile.__file__),
+            tracemalloc.Filter(False, __file__),
+        ])
+
+    def _sample_loop(self) -> None:
+        own_id = threading.get_ident()
+        while not self._stop.wait(self.SAMPLE_INTERVAL):
+            stack = list(self._stack)
+            if not stack:
+                continue
+            root = stack[-1].path
+            names = {thread.ident: thread.name for thread in threading.enumerate()}
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id == own_id:
+                    continue
+                frames = []
+                while frame is not None:
+                    code = frame.f_code
+                    frames.append(f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})")
+                    frame = frame.f_back
+                thread_name = names.get(thread_id, str(thread_id))
+                self._samples[';'.join([root, thread_name] + frames[::-1])] += 1
+
+    def save(self) -> Optional[str]:
+        """Stop profiling and write ``stages.json`` (and the collapsed stacks)"""
+        if not self.enabled:
+            return None
+        self.enabled = False
+        if self._sampler is not None:
+            self._stop.set()
+            self._sampler.join()
+            self._sampler = None
+            with open(os.path.join(self.output_dir, 'stacks.collapsed'), 'w', encoding='utf-8') as f:
+                for stack, count in sorted(self._samples.items()):
+                    f.write(f"{stack} {count}\n")
+        if 'memory' in self.modes and tracemalloc.is_tracing():
+            tracemalloc.stop()
+        with open(os.path.join(self.output_dir, 'stages.json'), 'w', encoding='utf-8') as f:
+            json.dump({'modes': list(self.modes), 'stages': self.stages}, f, indent=4)
+        return self.output_dir
+
+
+# Instancia compartida por todo el proceso
+profiler = StageProfiler()
@@ -1,6 +1,8 @@
 from typing import Dict, Any
 import yaml
+from src.infrastructure.monitoring.metrics import metrics
 
+@metrics.timed('generator_seconds', generator='domain')
 def generate_domain_yaml(company_data: Dict[str, Any]) -> str:
     """Generate domain.yml content"""
     domain = {
@@ -1,54 +1,191 @@
-from typing import Dict, Any
-import yaml
+from dataclasses import dataclass
+from io import StringIO
+import json
+import re
+from typing import Dict, Any, Iterable, Iterator, List, Optional, TextIO, Tuple
+from src.domain.services.catalog_index import normalize_name
+from src.domain.services.example_sampler import budgeted_examples, dedupe_templates, sample_items
+from src.infrastructure.monitoring.metrics import metrics
+
+
+@dataclass
+class NluOptions:
+    """How NLU examples are generated for a company"""
+    # 'templates': las plantillas para cada item (crece con el catálogo salvo
+    #              que se fije max_examples_per_intent)
+    # 'lookup': plantillas fijas + lookup tables y sinónimos con todos los nombres
+    mode: str = 'templates'
+    entity_examples: int = 10       # nombres anotados por intent en modo 'lookup'
+    synonyms: bool = True           # variantes sin tildes -> nombre del catálogo
+    # Tope de ejemplos por intent del catálogo; se eligen por muestreo
+    # estratificado (categoría y banda de precio) con semilla fija
+    max_examples_per_intent: Optional[int] = None
+    seed: int = 0
+    price_bands: int = 4
+    # Un archivo por categoría de productos en <salida>/nlu/ (Rasa carga el
+    # directorio completo); solo se regeneran las categorías que cambiaron
+    shard_by_category: bool = False
+
+
+PRODUCT_TEMPLATES = [
+    "What is the price of {name}?",
+    "Tell me about {name}",
+    "Do you have {name}?",
+    "I want to know more about {name}",
+]
+
+SERVICE_TEMPLATES = [
+    "What is the cost of {name}?",
+    "Tell me about {name} service",
+    "Do you offer {name}?",
+    "I need information about {name}",
+]
+
+GREET_EXAMPLES = ['hey', 'hello', 'hi', 'good morning', 'good evening']
+GOODBYE_EXAMPLES = ['bye', 'goodbye', 'see you around', 'see you later']
+
+# Caracteres que YAML no admite ni dentro de un bloque literal
+_NON_PRINTABLE = re.compile('[\x00-\x08\x0b\x0c\x0e-\x1f\x7f-\x84\x86-\x9f\ufeff\ufffe\uffff]')
+
+# Un nombre con estos caracteres rompería la anotación [nombre](entidad)
+_ANNOTATION_CHARS = re.compile(r'[\[\]()]')
+
+# Líneas agrupadas por write() al emitir
+_WRITE_BATCH = 1000
+
+
+def _clean_example(text: str) -> str:
+    """Single-line, YAML-safe text for a literal block"""
+    return ' '.join(_NON_PRINTABLE.sub(' ', text).split())
+
+
+def _fill(templates: List[str], names: Iterable[str]) -> Iterator[str]:
+    for name in names:
+        for template in templates:
+            yield template.format(name=name)
+
 
 def generate_product_intents(products: list) -> dict:
     """Generate intents for products"""
-    examples = []
-    for product in products:
-        examples.extend([
-            f"What is the price of {product['name']}?",
-            f"Tell me about {product['name']}",
-            f"Do you have {product['name']}?",
-            f"I want to know more about {product['name']}"
-        ])
-    
     return {
         'intent': 'ask_product_info',
-        'examples': '\n'.join(f"- {example}" for example in examples)
+        'examples': '\n'.join(f"- {example}" for example in _fill(PRODUCT_TEMPLATES, (p['name'] for p in products)))
     }
 
 def generate_service_intents(services: list) -> dict:
     """Generate intents for services"""
-    examples = []
-    for service in services:
-        examples.extend([
-            f"What is the cost of {service['name']}?",
-            f"Tell me about {service['name']} service",
-            f"Do you offer {service['name']}?",
-            f"I need information about {service['name']}"
-        ])
-    
     return {
         'intent': 'ask_service_info',
-        'examples': '\n'.join(f"- {example}" for example in examples)
+        'examples': '\n'.join(f"- {example}" for example in _fill(SERVICE_TEMPLATES, (s['name'] for s in services)))
     }
 
-def generate_nlu_yaml(company_data: Dict[str, Any]) -> str:
-    """Generate NLU training data in YAML format"""
-    nlu_data = {
-        'version': '3.1',
-        'nlu': [
-            generate_product_intents(company_data['products']),
-            generate_service_intents(company_data['services']),
-            {
-                'intent': 'greet',
-                'examples': '- hey\n- hello\n- hi\n- good morning\n- good evening'
-            },
-            {
-                'intent': 'goodbye',
-                'examples': '- bye\n- goodbye\n- see you around\n- see you later'
-            }
-        ]
+def _catalog_examples(items: List[Dict[str, Any]], templates: List[str],
+                      options: NluOptions) -> Iterator[str]:
+    templates = dedupe_templates(templates)
+    if options.max_examples_per_intent is None:
+        return _fill(templates, (_clean_example(str(item['name'])) for item in items))
+    pairs = budgeted_examples(items, templates, options.max_examples_per_intent,
+                              options.seed, options.price_bands)
+    return (template.format(name=_clean_example(str(item['name']))) for item, template in pairs)
+
+def iter_nlu_intents(company_data: Dict[str, Any], options: Optional[NluOptions] = None,
+                     common: bool = True) -> Iterator[Tuple[str, Iterable[str]]]:
+    """(intent, examples) pairs of the NLU data; examples are produced lazily
+    and are safe to emit as single lines of a YAML literal block.
+    ``common=False`` leaves out the intents that do not depend on the catalog."""
+    options = options or NluOptions()
+    yield 'ask_product_info', _catalog_examples(company_data['products'], PRODUCT_TEMPLATES, options)
+    yield 'ask_service_info', _catalog_examples(company_data['services'], SERVICE_TEMPLATES, options)
+    if common:
+        yield 'greet', GREET_EXAMPLES
+        yield 'goodbye', GOODBYE_EXAMPLES
+
+def _representative_names(items: List[Dict[str, Any]], options: NluOptions) -> List[str]:
+    """Stratified sample of names usable inside entity annotations"""
+    usable = [item for item in items
+              if _clean_example(str(item['name'])) and not _ANNOTATION_CHARS.search(str(item['name']))]
+    sampled = sample_items(usable, options.entity_examples, options.seed, options.price_bands)
+    return [_clean_example(str(item['name'])) for item in sampled]
+
+def _synonyms(names: Iterable[str]) -> Iterator[Tuple[str, List[str]]]:
+    """(canonical name, [variant]) for names whose accent-free form differs"""
+    seen = set()
+    for name in names:
+        variant = normalize_name(name)
+        if variant != name.casefold() and name not in seen:
+            seen.add(name)
+            yield name, [variant]
+
+def iter_nlu_sections(company_data: Dict[str, Any], options: Optional[NluOptions] = None,
+                      common: bool = True) -> Iterator[Tuple[str, str, Iterable[str]]]:
+    """(section, name, examples) entries of the NLU file: ``intent``, ``lookup``
+    or ``synonym`` sections, in the order they are written"""
+    options = options or NluOptions()
+    if options.mode == 'templates':
+        for intent, examples in iter_nlu_intents(company_data, options, common):
+            yield 'intent', intent, examples
+        return
+    if options.mode != 'lookup':
+        raise ValueError(f"Unknown NLU mode: {options.mode}")
+
+    # Plantillas fijas con unos pocos nombres anotados; el resto lo aportan
+    # las lookup tables (RegexFeaturizer) y los sinónimos
+    for intent, entity, templates, items in (
+            ('ask_product_info', 'product', PRODUCT_TEMPLATES, company_data['products']),
+            ('ask_service_info', 'service', SERVICE_TEMPLATES, company_data['services'])):
+        names = _representative_names(items, options)
+        yield 'intent', intent, _fill(dedupe_templates(templates), (f"[{name}]({entity})" for name in names))
+    if common:
+        yield 'intent', 'greet', GREET_EXAMPLES
+        yield 'intent', 'goodbye', GOODBYE_EXAMPLES
+    for entity, items in (('product', company_data['products']), ('service', company_data['services'])):
+        if not items:
+            continue
+        yield 'lookup', entity, (_clean_example(str(item['name'])) for item in items)
+    if options.synonyms:
+        for items in (company_data['products'], company_data['services']):
+            names = (_clean_example(str(item['name'])) for item in items)
+            for canonical, variants in _synonyms(names):
+                yield 'synonym', canonical, variants
+
+def nlu_schema(options: Optional[NluOptions] = None) -> Dict[str, List[str]]:
+    """Intents and entities annotated in the generated NLU data"""
+    options = options or NluOptions()
+    return {
+        'intents': ['ask_product_info', 'ask_service_info', 'greet', 'goodbye'],
+        'entities': ['product', 'service'] if options.mode == 'lookup' else [],
     }
-    
-    return yaml.dump(nlu_data, allow_unicode=True)
\ No newline at end of file
+
+@metrics.timed('generator_seconds', generator='nlu')
+def write_nlu_yaml(company_data: Dict[str, Any], stream: TextIO,
+                   options: Optional[NluOptions] = None, common: bool = True) -> None:
+    """Write the NLU training data to ``stream`` as it is generated.
+
+    Examples go out in Rasa's literal block style (``examples: |-``) in
+    batches, without building the example list, the joined string or a
+    YAML node tree, so memory stays flat whatever the catalog size.
+    Sections without examples are left out.
+    """
+    stream.write("version: '3.1'\nnlu:\n")
+    for section, name, examples in iter_nlu_sections(company_data, options, common):
+        examples = iter(examples)
+        first = next(examples, None)
+        if first is None:
+            continue
+        if section == 'synonym':
+            # Los nombres del catálogo pueden contener ':' o '#'
+            name = json.dumps(name, ensure_ascii=False)
+        stream.write(f"- {section}: {name}\n  examples: |-\n")
+        batch = [f"    - {first}\n"]
+        for example in examples:
+            batch.append(f"    - {example}\n")
+            if len(batch) >= _WRITE_BATCH:
+                stream.write(''.join(batch))
+                batch.clear()
+        stream.write(''.join(batch))
+
+def generate_nlu_yaml(company_data: Dict[str, Any], options: Optional[NluOptions] = None) -> str:
+    """Generate NLU training data in YAML format"""
+    output = StringIO()
+    write_nlu_yaml(company_data, output, options)
+    return output.getvalue()
\ No newline at end of file
@@ -0,0 +1,46 @@
+import glob
+import os
+import subprocess
+from typing import List, Optional
+from src.application.interfaces.model_trainer_interface import ModelTrainerInterface
+
+
+class RasaCliTrainer(ModelTrainerInterface):
+    """Train models by running the ``rasa train`` CLI.
+
+    The domain defaults to the ``domain.yml`` generated in ``data_dir`` by
+    the orchestrator, not the one at the project root.
+    """
+
+    def __init__(self, data_dir: str = 'data', domain_path: Optional[str] = None,
+                 config_path: str = 'config.yml', models_dir: str = 'models',
+                 finetune_epoch_fraction: float = 0.5):
+        self.data_dir = data_dir
+        self.domain_path = domain_path or os.path.join(data_dir, 'domain.yml')
+        self.config_path = config_path
+        self.models_dir = models_dir
+        # Al hacer finetune basta con una fracción de los epochs de config.yml
+        self.finetune_epoch_fraction = finetune_epoch_fraction
+
+    def train(self, finetune_from: Optional[str] = None) -> str:
+        command = self._command(finetune_from)
+        subprocess.run(command, check=True)
+        model = self.latest_model()
+        if model is None:
+            raise RuntimeError(f"rasa train finished without a model in {self.models_dir}")
+        return model
+
+    def latest_model(self) -> Optional[str]:
+        models = glob.glob(os.path.join(self.models_dir, '*.tar.gz'))
+        return max(models, key=os.path.getmtime) if models else None
+
+    def _command(self, finetune_from: Optional[str]) -> List[str]:
+        command = ['rasa', 'train',
+                   '--data', self.data_dir,
+                   '--domain', self.domain_path,
+                   '--config', self.config_path,
+                   '--out', self.models_dir]
+        if finetune_from:
+            command += ['--finetune', finetune_from,
+                        '--epoch-fraction', str(self.finetune_epoch_fraction)]
+        return command
@@ -1,6 +1,8 @@
 from typing import Dict, Any
 import yaml
+from src.infrastructure.monitoring.metrics import metrics
 
+@metrics.timed('generator_seconds', generator='stories')
 def generate_stories_yaml(company_data: Dict[str, Any]) -> str:
     """Generate stories.yml content"""
     stories = {
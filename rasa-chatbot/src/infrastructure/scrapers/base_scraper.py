@@ -1,23 +1,300 @@
 # Clase base para los scrapers
 from abc import ABC
 from src.application.interfaces.scraper_interface import ScraperInterface
+from src.infrastructure.scrapers.fetch_engine import FetchEngine
+from src.infrastructure.scrapers.http_cache import HttpCache, CacheEntry
+from src.infrastructure.scrapers.stream_parser import CardStreamParser, strainer_matcher
+from src.infrastructure.monitoring.metrics import metrics
+from src.config.settings import Settings
+import codecs
+import itertools
+import re
 import requests
-from bs4 import BeautifulSoup
-from typing import Dict, List, Any
+from html import unescape
+from bs4 import BeautifulSoup, SoupStrainer
+from typing import Dict, List, Any, Generator, Iterable, Iterator, Callable, Optional, Tuple
+from urllib.parse import urljoin
 
 class BaseScraper(ScraperInterface, ABC):
     """Base scraper implementation"""
     
-    def __init__(self, base_url: str):
+    # Límite de seguridad para la paginación (evita bucles con enlaces "next" circulares)
+    MAX_PAGES = 1000
+    # Tamaño de los trozos leídos en modo streaming (ya descomprimidos)
+    STREAM_CHUNK_SIZE = 64 * 1024
+    
+    _NEXT_LINK_RE = re.compile(r'<(?:a|link)\b[^>]*\brel=["\']?next\b[^>]*>', re.IGNORECASE)
+    _HREF_RE = re.compile(r'\bhref\s*=\s*(?:"([^"]*)"|\'([^\']*)\'|([^\s>]+))', re.IGNORECASE)
+    
+    def __init__(self, base_url: str, max_workers: int = 8, per_host_limit: int = 4,
+                 http_cache: Optional[HttpCache] = None, parser: str = 'html.parser',
+                 restrict_to_cards: bool = False, stream: bool = False,
+                 max_response_bytes: Optional[int] = None):
         self.base_url = base_url
+        self.parser = parser
+        self.restrict_to_cards = restrict_to_cards
+        self.stream = stream
+        if max_response_bytes is None:
+            max_response_bytes = int(Settings.SCRAPING_MAX_RESPONSE_MB * 1e6)
+        self.max_response_bytes = max_response_bytes
         self.session = requests.Session()
+        self.fetcher = FetchEngine(self.session, max_workers=max_workers,
+                                   per_host_limit=per_host_limit)
+        if http_cache is None and Settings.HTTP_CACHE_ENABLED:
+            http_cache = HttpCache(Settings.HTTP_CACHE_DIR, Settings.DATA_EXPIRY_HOURS)
+        self.http_cache = http_cache
     
     def _get_soup(self, url: str) -> BeautifulSoup:
         """Get BeautifulSoup object from URL"""
-        response = self.session.get(url)
-        response.raise_for_status()
-        return BeautifulSoup(response.text, 'html.parser')
+        response = self.fetcher.get(url)
+        return self._make_soup(response.text)
+    
+    def _get_soups(self, urls: Iterable[str]) -> List[BeautifulSoup]:
+        """Fetch several URLs concurrently and parse them in order"""
+        futures = [self.fetcher.submit(url) for url in urls]
+        return [self._make_soup(future.result().text) for future in futures]
+    
+    def _make_soup(self, markup: str, card_filter: Optional[SoupStrainer] = None) -> BeautifulSoup:
+        """Parse markup with the configured backend.
+        
+        With ``restrict_to_cards`` only the subtrees matched by ``card_filter``
+        are turned into Tag objects, which skips most of a catalog page.
+        """
+        parse_only = card_filter if self.restrict_to_cards else None
+        with metrics.timer('scraper_parse_seconds', parser=self.parser):
+            return BeautifulSoup(markup, self.parser, parse_only=parse_only)
+    
+    @staticmethod
+    def card_filter(tag: str, css_class: str) -> SoupStrainer:
+        """Strainer for ``<tag class="... css_class ...">`` card containers"""
+        return SoupStrainer(tag, class_=re.compile(rf'(^|\s){re.escape(css_class)}(\s|$)'))
+    
+    def _iter_items(self, first_url: str,
+                    parse_page: Callable[[BeautifulSoup], Iterable[Dict[str, Any]]],
+                    card_filter: Optional[SoupStrainer] = None) -> Iterator[Dict[str, Any]]:
+        """Yield the items of a paginated listing, page by page.
+        
+        The next page (``rel="next"`` link) is requested before the items of
+        the current one are yielded, so downloads overlap with the consumer.
+        Only one page is held in memory at a time. With an HTTP cache, pages
+        that are fresh or answer 304 reuse the items parsed last time.
+        ``card_filter`` names the card containers ``parse_page`` reads, for
+        scrapers configured with ``restrict_to_cards`` or ``stream``.
+        """
+        if self.stream:
+            yield from self._iter_items_streaming(first_url, parse_page, card_filter)
+            return
+        # Los planes de selectores dan su propia clave (cambia con los selectores)
+        parser = getattr(parse_page, 'cache_key', None) or parse_page.__qualname__
+        url = first_url
+        seen = {url}
+        future = self.fetcher.run(self._fetch_page, url)
+        pages = 0
+        while future is not None:
+            items, next_url = self._read_page(url, future.result(), parser, parse_page, card_filter)
+            pages += 1
+            future = None
+            if next_url and next_url not in seen and pages < self.MAX_PAGES:
+                seen.add(next_url)
+                future = self.fetcher.run(self._fetch_page, next_url)
+                url = next_url
+            yield from items
+    
+    def _iter_items_streaming(self, first_url: str,
+                              parse_page: Callable[[BeautifulSoup], Iterable[Dict[str, Any]]],
+                              card_filter: Optional[SoupStrainer] = None) -> Iterator[Dict[str, Any]]:
+        """``_iter_items`` for ``stream=True``: pages are parsed while they download.
+        
+        Pages are fetched one after the other in the calling thread (the
+        next link is only known once a page ends), but within a page the
+        cards are parsed and their items yielded as soon as they close.
+        """
+        # Los planes de selectores dan su propia clave (cambia con los selectores)
+        parser = getattr(parse_page, 'cache_key', None) or parse_page.__qualname__
+        url = first_url
+        seen = {url}
+        pages = 0
+        while url is not None:
+            next_url = yield from self._stream_page(url, parser, parse_page, card_filter)
+            pages += 1
+            url = None
+            if next_url and next_url not in seen and pages < self.MAX_PAGES:
+                seen.add(next_url)
+                url = next_url
+    
+    def _stream_page(self, url: str, parser: str,
+                     parse_page: Callable[[BeautifulSoup], Iterable[Dict[str, Any]]],
+                     card_filter: Optional[SoupStrainer]
+                     ) -> Generator[Dict[str, Any], None, Optional[str]]:
+        """Yield the items of one page as it streams in; returns the next URL.
+        
+        The body is decoded chunk by chunk and fed to a ``CardStreamParser``,
+        so the page is never held as one string (the HTTP cache gets it
+        written to a temporary file as it arrives) and never turned into a
+        full tree. Without a
+        ``card_filter`` cards cannot be cut out and the page is parsed whole
+        once downloaded. Bodies over ``max_response_bytes`` are rejected.
+        """
+        entry = self.http_cache.lookup(url) if self.http_cache is not None else None
+        headers = {}
+        if entry is not None:
+            if entry.is_fresh(self.http_cache.max_age_seconds):
+                self.http_cache.record(fresh_hits=1, bytes_saved=entry.body_size)
+                return (yield from self._read_cached(url, entry, parser, parse_page, card_filter))
+            headers = entry.conditional_headers()
+        
+        with self.fetcher.stream(url, self.max_response_bytes, headers=headers) as response:
+            if entry is not None and response.status_code == 304:
+                self.http_cache.record(revalidated=1, bytes_saved=entry.body_size)
+            else:
+                if self.http_cache is not None:
+                    self.http_cache.record(misses=1)
+                return (yield from self._parse_stream(url, response, parser, parse_page, card_filter))
+        return (yield from self._read_cached(url, entry, parser, parse_page, card_filter))
+    
+    def _read_cached(self, url: str, entry: CacheEntry, parser: str,
+                     parse_page: Callable[[BeautifulSoup], Iterable[Dict[str, Any]]],
+                     card_filter: Optional[SoupStrainer]
+                     ) -> Generator[Dict[str, Any], None, Optional[str]]:
+        items, next_url = self._read_page(url, (entry, None), parser, parse_page, card_filter)
+        yield from items
+        return next_url
+    
+    def _parse_stream(self, url: str, response: requests.Response, parser: str,
+                      parse_page: Callable[[BeautifulSoup], Iterable[Dict[str, Any]]],
+                      card_filter: Optional[SoupStrainer]
+                      ) -> Generator[Dict[str, Any], None, Optional[str]]:
+        # Sin charset en la respuesta requests usa el mismo valor que para response.text
+        decoder = codecs.getincrementaldecoder(response.encoding or 'utf-8')(errors='replace')
+        cards_parser = CardStreamParser(strainer_matcher(card_filter), self.parser) if card_filter else None
+        # Sin tarjetas que recortar la página se parsea entera: hace falta el cuerpo
+        body: Optional[List[str]] = [] if cards_parser is None else None
+        # Si no, la caché recibe el cuerpo en un temporal a medida que llega
+        body_file = self.http_cache.open_body(url) if self.http_cache is not None and body is None else None
+        items: List[Dict[str, Any]] = []
+        try:
+            chunks = self.fetcher.iter_body(response, self.STREAM_CHUNK_SIZE, self.max_response_bytes)
+            texts = (decoder.decode(chunk) for chunk in chunks)
+            for text in itertools.chain(texts, [decoder.decode(b'', final=True)]):
+                if body is not None:
+                    body.append(text)
+                else:
+                    if body_file is not None:
+                        body_file.write(text)
+                    cards = cards_parser.feed(text)
+                    if cards:
+                        yield from self._parse_cards(cards, parse_page, items)
+            
+            if cards_parser is not None:
+                cards = cards_parser.close()
+                if cards:
+                    yield from self._parse_cards(cards, parse_page, items)
+                next_url = urljoin(url, cards_parser.next_href) if cards_parser.next_href else None
+            else:
+                soup = self._make_soup(''.join(body))
+                next_url = self._next_page_url(soup, url)
+                for item in parse_page(soup):
+                    items.append(item)
+                    yield item
+                soup.decompose()
+            
+            if self.http_cache is not None:
+                etag, last_modified = response.headers.get('ETag'), response.headers.get('Last-Modified')
+                if body_file is not None:
+                    self.http_cache.store_written(url, body_file, etag, last_modified, parser, items, next_url)
+                else:
+                    self.http_cache.store(url, ''.join(body), etag, last_modified, parser, items, next_url)
+        finally:
+            # Descarga cortada o consumidor que dejó de iterar: no queda nada a medias
+            if body_file is not None:
+                body_file.discard()
+        return next_url
+    
+    def _parse_cards(self, cards: List[str],
+                     parse_page: Callable[[BeautifulSoup], Iterable[Dict[str, Any]]],
+                     items: List[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+        """Parse a batch of card markup and yield its items"""
+        soup = self._make_soup(''.join(cards))
+        for item in parse_page(soup):
+            if self.http_cache is not None:
+                items.append(item)
+            yield item
+        soup.decompose()
+    
+    def _fetch_page(self, url: str) -> Tuple[Optional[CacheEntry], Optional[requests.Response]]:
+        """Fetch a page (in a pool thread) going through the HTTP cache.
+        
+        Returns ``(entry, None)`` when the cached copy is still valid and
+        ``(entry_or_None, response)`` when the page was downloaded.
+        """
+        if self.http_cache is None:
+            return None, self.fetcher.get(url)
+        entry = self.http_cache.lookup(url)
+        if entry is not None and entry.is_fresh(self.http_cache.max_age_seconds):
+            self.http_cache.record(fresh_hits=1, bytes_saved=entry.body_size)
+            return entry, None
+        headers = entry.conditional_headers() if entry is not None else {}
+        response = self.fetcher.get(url, headers=headers)
+        if entry is not None and response.status_code == 304:
+            self.http_cache.record(revalidated=1, bytes_saved=entry.body_size)
+            return entry, None
+        self.http_cache.record(misses=1)
+        return entry, response
+    
+    def _read_page(self, url: str, fetched: Tuple[Optional[CacheEntry], Optional[requests.Response]],
+                   parser: str, parse_page: Callable[[BeautifulSoup], Iterable[Dict[str, Any]]],
+                   card_filter: Optional[SoupStrainer] = None
+                   ) -> Tuple[Iterable[Dict[str, Any]], Optional[str]]:
+        """Turn a fetched page into (items, next_url), parsing only when needed"""
+        entry, response = fetched
+        if response is None and entry is not None:
+            cached = entry.get_parsed(parser)
+            if cached is not None:
+                self.http_cache.record(parses_skipped=1)
+                if not entry.is_fresh(self.http_cache.max_age_seconds):
+                    self.http_cache.refresh(entry, parser)
+                return cached
+        
+        body = response.text if response is not None else entry.read_body()
+        soup = self._make_soup(body, card_filter)
+        if self.restrict_to_cards and card_filter is not None:
+            # El enlace "next" no forma parte de las tarjetas: se busca en el HTML crudo
+            next_url = self._next_page_url_from_markup(body, url)
+        else:
+            next_url = self._next_page_url(soup, url)
+        if self.http_cache is None:
+            return parse_page(soup), next_url
+        
+        items = list(parse_page(soup))
+        soup.decompose()
+        if response is not None:
+            self.http_cache.store(url, body, response.headers.get('ETag'),
+                                  response.headers.get('Last-Modified'), parser, items, next_url)
+        else:
+            self.http_cache.refresh(entry, parser, items, next_url)
+        return items, next_url
+    
+    def _next_page_url(self, soup: BeautifulSoup, current_url: str) -> Optional[str]:
+        """Find the URL of the next listing page, if any"""
+        link = soup.find(['a', 'link'], rel='next', href=True)
+        return urljoin(current_url, link['href']) if link else None
+    
+    def _next_page_url_from_markup(self, markup: str, current_url: str) -> Optional[str]:
+        """Find the next page link without building a tree"""
+        link = self._NEXT_LINK_RE.search(markup)
+        if not link:
+            return None
+        href = self._HREF_RE.search(link.group(0))
+        if not href:
+            return None
+        return urljoin(current_url, unescape(next(g for g in href.groups() if g is not None)))
+    
+    def close(self) -> None:
+        """Release fetch threads and pooled connections"""
+        self.fetcher.close()
+        self.session.close()
     
     def _clean_price(self, price_str: str) -> float:
         """Clean price string and convert to float"""
-        return float(''.join(filter(str.isdigit, price_str))) / 100
\ No newline at end of file
+        return float(''.join(filter(str.isdigit, price_str))) / 100
+    
\ No newline at end of file
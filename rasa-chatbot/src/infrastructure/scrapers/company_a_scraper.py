@@ -1,4 +1,5 @@
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Iterator
+from bs4 import BeautifulSoup
 from .base_scraper import BaseScraper
 from src.domain.entities.product import Product
 from src.domain.entities.service import Service
@@ -6,11 +7,28 @@ from src.domain.entities.service import Service
 class CompanyAScraper(BaseScraper):
     """Scraper implementation for Company A"""
     
+    PRODUCT_CARDS = BaseScraper.card_filter('div', 'product-card')
+    SERVICE_CARDS = BaseScraper.card_filter('div', 'service-card')
+    
     def scrape_products(self) -> List[Dict[str, Any]]:
         """Scrape products from Company A website"""
-        products = []
-        soup = self._get_soup(f"{self.base_url}/products")
-        
+        return list(self.iter_products())
+    
+    def scrape_services(self) -> List[Dict[str, Any]]:
+        """Scrape services from Company A website"""
+        return list(self.iter_services())
+    
+    def iter_products(self) -> Iterator[Dict[str, Any]]:
+        """Yield products from every page of the Company A catalog"""
+        return self._iter_items(f"{self.base_url}/products", self._parse_products,
+                                self.PRODUCT_CARDS)
+    
+    def iter_services(self) -> Iterator[Dict[str, Any]]:
+        """Yield services from every page of the Company A catalog"""
+        return self._iter_items(f"{self.base_url}/services", self._parse_services,
+                                self.SERVICE_CARDS)
+    
+    def _parse_products(self, soup: BeautifulSoup) -> Iterator[Dict[str, Any]]:
         # Ejemplo de implementación - ajustar según el HTML real
         for product_elem in soup.find_all('div', class_='product-card'):
             product = Product(
@@ -20,15 +38,9 @@ class CompanyAScraper(BaseScraper):
                 price=self._clean_price(product_elem.find('span', class_='price').text),
                 category=product_elem.find('span', class_='category').text.strip()
             )
-            products.append(vars(product))
-        
-        return products
+            yield vars(product)
     
-    def scrape_services(self) -> List[Dict[str, Any]]:
-        """Scrape services from Company A website"""
-        services = []
-        soup = self._get_soup(f"{self.base_url}/services")
-        
+    def _parse_services(self, soup: BeautifulSoup) -> Iterator[Dict[str, Any]]:
         # Ejemplo de implementación - ajustar según el HTML real
         for service_elem in soup.find_all('div', class_='service-card'):
             service = Service(
@@ -38,6 +50,4 @@ class CompanyAScraper(BaseScraper):
                 price=self._clean_price(service_elem.find('span', class_='price').text),
                 duration=service_elem.find('span', class_='duration').text.strip()
             )
-            services.append(vars(service))
-        
-        return services
\ No newline at end of file
+            yield vars(service)
\ No newline at end of file
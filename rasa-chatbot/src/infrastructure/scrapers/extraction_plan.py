@@ -0,0 +1,231 @@
+# rasa-chatbot/src/infrastructure/scrapers/extraction_plan.py
+import hashlib
+import json
+import re
+from dataclasses import MISSING, dataclass, fields
+from typing import Dict, Any, Iterator, List, Optional, Tuple
+from bs4 import BeautifulSoup, SoupStrainer, Tag
+
+# Selector simple: etiqueta, clases y un atributo opcional, p.ej. 'span.price',
+# '.product-card', 'div.card.featured', 'a[rel=next]' (sin combinadores)
+_SELECTOR_RE = re.compile(
+    r'^(?P<tag>[A-Za-z][\w-]*)?(?P<classes>(?:\.[\w-]+)*)'
+    r'(?:\[(?P<attr>[\w-]+)(?:=(?P<quote>["\']?)(?P<value>[^\]"\']*)(?P=quote))?\])?$'
+)
+FIELD_TYPES = ('text', 'price', 'int')
+
+
+@dataclass(frozen=True)
+class Selector:
+    """A compiled single-element selector"""
+    tag: Optional[str]
+    classes: frozenset
+    attr: Optional[str] = None
+    value: Optional[str] = None
+
+    @classmethod
+    def parse(cls, selector: str) -> 'Selector':
+        match = _SELECTOR_RE.match(selector.strip())
+        if not match or not (match.group('tag') or match.group('classes') or match.group('attr')):
+            raise ValueError(f"Unsupported selector {selector!r} (use tag.class[attr=value])")
+        classes = frozenset(c for c in match.group('classes').split('.') if c)
+        return cls(match.group('tag'), classes, match.group('attr'), match.group('value'))
+
+    def matches(self, element: Tag) -> bool:
+        if self.tag is not None and element.name != self.tag:
+            return False
+        if self.classes and not self.classes.issubset(element.get('class') or ()):
+            return False
+        if self.attr is not None:
+            actual = element.get(self.attr)
+            if actual is None:
+                return False
+            # rel, class, etc. son multivaluados: basta con que contenga el valor
+            if self.value is not None and self.value != actual and \
+                    not (isinstance(actual, list) and self.value in actual):
+                return False
+        return True
+
+    def strainer(self) -> SoupStrainer:
+        """SoupStrainer keeping only the matching subtrees (for ``restrict_to_cards``)"""
+        attrs = {}
+        if self.classes:
+            attrs['class'] = _token_pattern(sorted(self.classes)[0])
+        if self.attr is not None:
+            # Al construir el árbol los atributos multivaluados llegan sin separar
+            attrs[self.attr] = _token_pattern(self.value) if self.value is not None else True
+        return SoupStrainer(self.tag, attrs=attrs)
+
+
+def _token_pattern(token: str) -> 're.Pattern':
+    """Matches ``token`` as one of the space-separated words of a value"""
+    return re.compile(rf'(^|\s){re.escape(token)}(\s|$)')
+
+
+@dataclass(frozen=True)
+class PriceRule:
+    """How a company writes its prices.
+
+    With ``implied_decimals`` every digit is kept and the last N are the
+    decimals (``$1.299`` -> 12.99 with 2, like ``BaseScraper._clean_price``).
+    Otherwise ``thousands`` separators are dropped and the first number left
+    is read, with ``decimal`` marking its decimals (``$1.299,50`` with decimal
+    ',' and thousands '.' -> 1299.5; ``1.299,50 - 1.500`` -> 1299.5).
+    """
+    decimal: str = '.'
+    thousands: str = ','
+    implied_decimals: Optional[int] = None
+
+    def __post_init__(self):
+        if self.decimal == self.thousands:
+            raise ValueError("Price decimal and thousands separators must differ")
+
+    @classmethod
+    def from_dict(cls, data: Optional[Dict[str, Any]]) -> 'PriceRule':
+        unknown = set(data or {}) - {'decimal', 'thousands', 'implied_decimals'}
+        if unknown:
+            raise ValueError(f"Unknown price options: {', '.join(sorted(unknown))}")
+        return cls(**(data or {}))
+
+    def parse(self, text: str) -> Optional[float]:
+        if self.implied_decimals is not None:
+            digits = ''.join(filter(str.isdigit, text))
+            return int(digits) / 10 ** self.implied_decimals if digits else None
+        # Sin separadores de miles el número queda contiguo; cualquier otro
+        # carácter (moneda, espacios, un segundo precio) lo corta
+        match = re.search(rf'\d+(?:{re.escape(self.decimal)}\d+)?', text.replace(self.thousands, ''))
+        if match is None:
+            return None
+        return float(match.group().replace(self.decimal, '.'))
+
+
+@dataclass(frozen=True)
+class FieldSpec:
+    name: str
+    selector: Optional[Selector]    # None: la propia tarjeta
+    attr: Optional[str]             # None: texto del elemento
+    type: str = 'text'
+    required: bool = False
+    default: Any = None
+
+
+def _field_spec(name: str, config: Any) -> FieldSpec:
+    if isinstance(config, str):
+        config = {'selector': config}
+    unknown = set(config) - {'selector', 'attr', 'type', 'required', 'default'}
+    if unknown:
+        raise ValueError(f"Field {name}: unknown options {', '.join(sorted(unknown))}")
+    field_type = config.get('type', 'text')
+    if field_type not in FIELD_TYPES:
+        raise ValueError(f"Field {name}: type must be one of {', '.join(FIELD_TYPES)}")
+    selector = config.get('selector')
+    if selector is None and 'attr' not in config:
+        raise ValueError(f"Field {name} needs a selector or an attr of the card")
+    return FieldSpec(name, Selector.parse(selector) if selector else None, config.get('attr'),
+                     field_type, bool(config.get('required', False)), config.get('default'))
+
+
+class ExtractionPlan:
+    """Card and field selectors of one listing, compiled once.
+
+    ``extract`` walks each card's subtree a single time: every element is
+    checked against the fields still missing (indexed by tag name) and the
+    walk stops as soon as all fields are found, instead of one ``find``
+    per field re-walking the card. Calling the plan with a soup yields the
+    items of a page, so it can be passed to ``BaseScraper._iter_items``.
+    """
+
+    def __init__(self, card: str, fields_config: Dict[str, Any], price_rule: Optional[PriceRule] = None,
+                 entity: Optional[type] = None, name: str = 'items'):
+        self.card = Selector.parse(card)
+        self.fields = [_field_spec(field_name, config) for field_name, config in fields_config.items()]
+        if not self.fields:
+            raise ValueError(f"Listing {name} has no fields")
+        self.price_rule = price_rule or PriceRule()
+        self._card_fields = [(i, spec) for i, spec in enumerate(self.fields) if spec.selector is None]
+        self._by_tag: Dict[Optional[str], List[Tuple[int, Selector]]] = {}
+        for i, spec in enumerate(self.fields):
+            if spec.selector is not None:
+                self._by_tag.setdefault(spec.selector.tag, []).append((i, spec.selector))
+        self._any_tag = self._by_tag.pop(None, [])
+        self._nested = len(self.fields) - len(self._card_fields)
+        # Claves (y valores por defecto) de la entidad, para items con la misma forma
+        self._template: Dict[str, Any] = {}
+        if entity is not None:
+            for entity_field in fields(entity):
+                default = entity_field.default
+                self._template[entity_field.name] = None if default is MISSING else default
+        fingerprint = hashlib.sha256(json.dumps(
+            [card, fields_config, vars(self.price_rule)], sort_keys=True, default=str
+        ).encode('utf-8')).hexdigest()[:12]
+        self._cache_key = f"ExtractionPlan.{name}.{fingerprint}"
+
+    @property
+    def cache_key(self) -> str:
+        """Parser name for the HTTP cache: changes when the selectors change"""
+        return self._cache_key
+
+    def card_filter(self) -> SoupStrainer:
+        return self.card.strainer()
+
+    def __call__(self, soup: BeautifulSoup) -> Iterator[Dict[str, Any]]:
+        return self.iter_items(soup)
+
+    def iter_items(self, soup: BeautifulSoup) -> Iterator[Dict[str, Any]]:
+        first_class = min(self.card.classes) if self.card.classes else None
+        candidates = soup.find_all(self.card.tag or True, class_=first_class) if first_class \
+            else soup.find_all(self.card.tag or True)
+        for element in candidates:
+            if not self.card.matches(element):
+                continue
+            item = self.extract(element)
+            if item is not None:
+                yield item
+
+    def extract(self, card: Tag) -> Optional[Dict[str, Any]]:
+        """One item from a card, or None if a required field is missing"""
+        found: List[Optional[Tag]] = [None] * len(self.fields)
+        for i, _ in self._card_fields:
+            found[i] = card
+        pending = self._nested
+        by_tag = self._by_tag
+        any_tag = self._any_tag
+        if pending:
+            for element in card.descendants:
+                name = element.name     # None en los nodos de texto
+                if name is None:
+                    continue
+                group = by_tag.get(name, any_tag) if not any_tag else by_tag.get(name, []) + any_tag
+                for i, selector in group:
+                    if found[i] is None and selector.matches(element):
+                        found[i] = element
+                        pending -= 1
+                if not pending:
+                    break
+
+        item = dict(self._template)
+        for spec, element in zip(self.fields, found):
+            value = self._value(spec, element) if element is not None else None
+            if value is None:
+                if spec.required:
+                    return None
+                value = spec.default
+            item[spec.name] = value
+        return item
+
+    def _value(self, spec: FieldSpec, element: Tag) -> Any:
+        if spec.attr is not None:
+            raw = element.get(spec.attr)
+            if isinstance(raw, list):
+                raw = ' '.join(raw)
+        else:
+            raw = element.get_text()
+        if raw is None:
+            return None
+        raw = raw.strip()
+        if spec.type == 'price':
+            return self.price_rule.parse(raw)
+        if spec.type == 'int':
+            digits = ''.join(filter(str.isdigit, raw))
+            return int(digits) if digits else None
+        return raw
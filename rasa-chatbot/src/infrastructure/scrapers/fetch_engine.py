@@ -0,0 +1,147 @@
+# rasa-chatbot/src/infrastructure/scrapers/fetch_engine.py
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util import make_headers
+from src.infrastructure.monitoring.metrics import metrics
+
+# Codificaciones que urllib3 sabe descomprimir aquí: gzip y deflate siempre,
+# br/zstd solo si están instalados brotli/zstandard
+ACCEPT_ENCODING = make_headers(accept_encoding=True)['accept-encoding']
+
+
+class ResponseTooLarge(requests.RequestException):
+    """The response body is over the size cap of a streaming fetch"""
+
+
+class FetchEngine:
+    """Concurrent HTTP fetcher shared by the scrapers.
+
+    Requests run on a bounded thread pool over one pooled ``requests``
+    session, so connections are reused across threads. At most
+    ``per_host_limit`` requests are in flight against the same host.
+    """
+
+    def __init__(self, session: Optional[requests.Session] = None,
+                 max_workers: int = 8, per_host_limit: int = 4,
+                 timeout: Optional[float] = 30.0):
+        self.session = session or requests.Session()
+        self.max_workers = max_workers
+        self.per_host_limit = per_host_limit
+        self.timeout = timeout
+        adapter = HTTPAdapter(pool_connections=max_workers, pool_maxsize=max_workers)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._host_slots: Dict[str, threading.BoundedSemaphore] = {}
+        self._lock = threading.Lock()
+
+    def __enter__(self) -> 'FetchEngine':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        """Fetch a URL in the calling thread, honoring the per-host limit"""
+        kwargs.setdefault('timeout', self.timeout)
+        start = time.perf_counter()
+        with self._host_slot(url):
+            response = self.session.get(url, **kwargs)
+        if metrics.enabled:
+            host = urlsplit(url).netloc
+            metrics.observe('scraper_request_seconds', time.perf_counter() - start, host=host)
+            metrics.inc('scraper_requests_total', host=host, status=response.status_code)
+            metrics.inc('scraper_response_bytes_total', len(response.content), host=host)
+        response.raise_for_status()
+        return response
+
+    @contextmanager
+    def stream(self, url: str, max_bytes: Optional[int] = None, **kwargs) -> Iterator[requests.Response]:
+        """Open a streaming GET, holding the host slot until the body is read.
+        
+        The body is not downloaded up front: read it with ``iter_body``.
+        Compressed encodings are negotiated and ``max_bytes`` (if given) is
+        checked against ``Content-Length`` before reading anything.
+        """
+        kwargs.setdefault('timeout', self.timeout)
+        headers = dict(kwargs.pop('headers', None) or {})
+        headers.setdefault('Accept-Encoding', ACCEPT_ENCODING)
+        start = time.perf_counter()
+        with self._host_slot(url):
+            response = self.session.get(url, headers=headers, stream=True, **kwargs)
+            try:
+                response.raise_for_status()
+                length = response.headers.get('Content-Length')
+                if max_bytes is not None and length and length.isdigit() and int(length) > max_bytes:
+                    raise ResponseTooLarge(f"{url} is {int(length)} bytes (limit {max_bytes})", response=response)
+                yield response
+            finally:
+                response.close()
+                if metrics.enabled:
+                    host = urlsplit(url).netloc
+                    metrics.observe('scraper_request_seconds', time.perf_counter() - start, host=host)
+                    metrics.inc('scraper_requests_total', host=host, status=response.status_code)
+
+    @staticmethod
+    def iter_body(response: requests.Response, chunk_size: int = 64 * 1024,
+                  max_bytes: Optional[int] = None) -> Iterator[bytes]:
+        """Decompressed body chunks of a ``stream`` response, as they arrive.
+        
+        Raises ``ResponseTooLarge`` as soon as the decompressed size goes
+        over ``max_bytes`` (which also stops compression bombs).
+        """
+        size = 0
+        try:
+            for chunk in response.iter_content(chunk_size):
+                size += len(chunk)
+                if max_bytes is not None and size > max_bytes:
+                    raise ResponseTooLarge(f"{response.url} is over {max_bytes} bytes", response=response)
+                yield chunk
+        finally:
+            if metrics.enabled:
+                metrics.inc('scraper_response_bytes_total', size, host=urlsplit(response.url).netloc)
+
+    def submit(self, url: str, **kwargs) -> 'Future[requests.Response]':
+        """Schedule a fetch and return its future"""
+        return self._get_executor().submit(self.get, url, **kwargs)
+
+    def run(self, fn: Callable[..., Any], *args, **kwargs) -> Future:
+        """Run a fetch-bound callable (e.g. a cache-aware fetch) on the pool"""
+        return self._get_executor().submit(fn, *args, **kwargs)
+
+    def fetch_all(self, urls: Iterable[str], **kwargs) -> List[requests.Response]:
+        """Fetch many URLs concurrently; responses keep the order of ``urls``"""
+        futures = [self.submit(url, **kwargs) for url in urls]
+        return [future.result() for future in futures]
+
+    def close(self) -> None:
+        """Shut down the worker threads (the session stays usable)"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            with self._lock:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=self.max_workers, thread_name_prefix='fetch'
+                    )
+        return self._executor
+
+    def _host_slot(self, url: str) -> threading.BoundedSemaphore:
+        host = urlsplit(url).netloc
+        slot = self._host_slots.get(host)
+        if slot is None:
+            with self._lock:
+                slot = self._host_slots.setdefault(
+                    host, threading.BoundedSemaphore(self.per_host_limit)
+                )
+        return slot
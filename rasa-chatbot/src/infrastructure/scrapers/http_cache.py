@@ -0,0 +1,182 @@
+# rasa-chatbot/src/infrastructure/scrapers/http_cache.py
+import hashlib
+import json
+import os
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Tuple
+
+
+@dataclass
+class HttpCacheStats:
+    """Counters of what the cache saved during one refresh"""
+    fresh_hits: int = 0          # entrada vigente: ni petición ni parseo
+    revalidated: int = 0         # 304 Not Modified: sin descarga
+    misses: int = 0              # descarga completa
+    parses_skipped: int = 0      # páginas cuyos items salieron de la caché
+    bytes_saved: int = 0         # cuerpos que no hubo que descargar
+
+    def report(self) -> str:
+        """One-line human readable summary"""
+        total = self.fresh_hits + self.revalidated + self.misses
+        return (f"HTTP cache: {total} pages, {self.fresh_hits} fresh, "
+                f"{self.revalidated} not modified, {self.misses} downloaded, "
+                f"{self.parses_skipped} parses skipped, "
+                f"{self.bytes_saved / 1024:.1f} KiB not downloaded")
+
+
+@dataclass
+class CacheEntry:
+    """Cached response for one URL plus the items already extracted from it"""
+    url: str
+    fetched_at: float
+    body_path: str
+    body_size: int
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    # nombre del parser -> {'items': [...], 'next_url': ...}
+    parsed: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+
+    def is_fresh(self, max_age_seconds: float) -> bool:
+        return time.time() - self.fetched_at < max_age_seconds
+
+    def conditional_headers(self) -> Dict[str, str]:
+        headers = {}
+        if self.etag:
+            headers['If-None-Match'] = self.etag
+        if self.last_modified:
+            headers['If-Modified-Since'] = self.last_modified
+        return headers
+
+    def read_body(self) -> str:
+        with open(self.body_path, 'r', encoding='utf-8') as f:
+            return f.read()
+
+    def get_parsed(self, parser: str) -> Optional[Tuple[List[Dict[str, Any]], Optional[str]]]:
+        result = self.parsed.get(parser)
+        if result is None:
+            return None
+        return result['items'], result['next_url']
+
+
+class BodyWriter:
+    """Writes a page body to a temporary file while it downloads.
+
+    Streaming scrapers use it so the body never has to be kept in memory
+    to be cached; ``HttpCache.store_written`` publishes the file.
+    """
+
+    def __init__(self, body_path: str):
+        self.body_path = body_path
+        self.tmp_path = f"{body_path}.{threading.get_ident()}.tmp"
+        self.size = 0
+        self._file = open(self.tmp_path, 'wb')
+
+    def write(self, text: str) -> None:
+        data = text.encode('utf-8')
+        self._file.write(data)
+        self.size += len(data)
+
+    def close(self) -> None:
+        self._file.close()
+
+    def discard(self) -> None:
+        """Drop the temporary file (no-op once stored)"""
+        self._file.close()
+        if os.path.exists(self.tmp_path):
+            os.remove(self.tmp_path)
+
+
+class HttpCache:
+    """On-disk HTTP cache for scraped pages.
+
+    For every URL it keeps the body, its ``ETag``/``Last-Modified`` validators
+    and the items each page parser extracted from it. Entries younger than
+    ``max_age_hours`` are served without any request; older ones are
+    revalidated with a conditional GET.
+    """
+
+    def __init__(self, cache_dir: str, max_age_hours: float):
+        self.cache_dir = Path(cache_dir)
+        self.max_age_seconds = max_age_hours * 3600
+        self.stats = HttpCacheStats()
+        self._lock = threading.Lock()
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    def lookup(self, url: str) -> Optional[CacheEntry]:
+        """Return the cached entry for ``url`` or None"""
+        try:
+            with open(self._meta_path(url), 'r', encoding='utf-8') as f:
+                entry = CacheEntry(**json.load(f))
+        except (FileNotFoundError, ValueError, TypeError):
+            return None
+        if not os.path.exists(entry.body_path):
+            return None
+        return entry
+
+    def store(self, url: str, body: str, etag: Optional[str], last_modified: Optional[str],
+              parser: str, items: List[Dict[str, Any]], next_url: Optional[str]) -> CacheEntry:
+        """Save a freshly downloaded page and the items parsed from it"""
+        body_path = self._body_path(url)
+        self._write_atomic(body_path, body)
+        return self._save_new_entry(url, body_path, len(body.encode('utf-8')), etag, last_modified,
+                                    parser, items, next_url)
+
+    def open_body(self, url: str) -> BodyWriter:
+        """Start writing the body of ``url`` incrementally (see ``store_written``)"""
+        return BodyWriter(self._body_path(url))
+
+    def store_written(self, url: str, body: BodyWriter, etag: Optional[str], last_modified: Optional[str],
+                      parser: str, items: List[Dict[str, Any]], next_url: Optional[str]) -> CacheEntry:
+        """Like ``store`` for a body already written with ``open_body``"""
+        body.close()
+        os.replace(body.tmp_path, body.body_path)
+        return self._save_new_entry(url, body.body_path, body.size, etag, last_modified,
+                                    parser, items, next_url)
+
+    def refresh(self, entry: CacheEntry, parser: str,
+                items: Optional[List[Dict[str, Any]]] = None, next_url: Optional[str] = None) -> None:
+        """Mark an entry as revalidated now, optionally adding parsed items"""
+        entry.fetched_at = time.time()
+        if items is not None:
+            entry.parsed[parser] = {'items': items, 'next_url': next_url}
+        self._save_entry(entry)
+
+    def record(self, **increments: int) -> None:
+        """Thread-safe increment of the stats counters"""
+        with self._lock:
+            for name, value in increments.items():
+                setattr(self.stats, name, getattr(self.stats, name) + value)
+
+    def _body_path(self, url: str) -> str:
+        return str(self._meta_path(url).with_suffix('.html'))
+
+    def _save_new_entry(self, url: str, body_path: str, body_size: int, etag: Optional[str],
+                        last_modified: Optional[str], parser: str, items: List[Dict[str, Any]],
+                        next_url: Optional[str]) -> CacheEntry:
+        entry = CacheEntry(
+            url=url,
+            fetched_at=time.time(),
+            body_path=body_path,
+            body_size=body_size,
+            etag=etag,
+            last_modified=last_modified,
+            parsed={parser: {'items': items, 'next_url': next_url}},
+        )
+        self._save_entry(entry)
+        return entry
+
+    def _meta_path(self, url: str) -> Path:
+        return self.cache_dir / f"{hashlib.sha1(url.encode('utf-8')).hexdigest()}.json"
+
+    def _save_entry(self, entry: CacheEntry) -> None:
+        self._write_atomic(str(self._meta_path(entry.url)),
+                           json.dumps(vars(entry), ensure_ascii=False))
+
+    def _write_atomic(self, path: str, content: str) -> None:
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(content)
+        os.replace(tmp_path, path)
@@ -0,0 +1,72 @@
+from typing import Dict, List, Any, Iterator, Optional
+from .base_scraper import BaseScraper
+from .extraction_plan import ExtractionPlan, PriceRule
+from src.domain.entities.product import Product
+from src.domain.entities.service import Service
+
+# Listados que sabe scrapear y la entidad cuyo formato siguen sus items
+LISTINGS = {'products': Product, 'services': Service}
+LISTING_OPTIONS = {'path', 'card', 'fields', 'price'}
+
+
+def compile_selectors(selectors: Dict[str, Any]) -> Dict[str, ExtractionPlan]:
+    """Compile the ``selectors`` of a company config into one plan per listing.
+
+    ``selectors`` maps ``products``/``services`` to ``path`` (relative to the
+    website, defaults to ``/products`` or ``/services``), ``card`` (selector
+    of the card containers), ``fields`` (field name -> selector or options)
+    and ``price`` (a ``PriceRule``); a top-level ``price`` applies to every
+    listing without its own.
+    """
+    selectors = dict(selectors or {})
+    shared_price = selectors.pop('price', None)
+    unknown = set(selectors) - set(LISTINGS)
+    if unknown:
+        raise ValueError(f"Unknown listings in selectors: {', '.join(sorted(unknown))}")
+    plans = {}
+    for listing, config in selectors.items():
+        extra = set(config) - LISTING_OPTIONS
+        if extra:
+            raise ValueError(f"Unknown options for {listing}: {', '.join(sorted(extra))}")
+        if 'card' not in config or not config.get('fields'):
+            raise ValueError(f"Selectors for {listing} need a card and fields")
+        plans[listing] = ExtractionPlan(config['card'], config['fields'],
+                                        PriceRule.from_dict(config.get('price', shared_price)),
+                                        entity=LISTINGS[listing], name=listing)
+    return plans
+
+
+class SelectorScraper(BaseScraper):
+    """Scraper driven by the card/field selectors of the company config.
+
+    A new site only needs a ``selectors`` entry in ``companies.yml``; the
+    selectors are compiled once here and every card is read in a single
+    walk of its subtree (see ``ExtractionPlan``).
+    """
+
+    def __init__(self, base_url: str, selectors: Optional[Dict[str, Any]] = None, **kwargs):
+        super().__init__(base_url, **kwargs)
+        self.plans = compile_selectors(selectors)
+        self.card_filters = {listing: plan.card_filter() for listing, plan in self.plans.items()}
+        self.paths = {listing: selectors[listing].get('path', f'/{listing}') for listing in self.plans}
+
+    def scrape_products(self) -> List[Dict[str, Any]]:
+        return list(self.iter_products())
+
+    def scrape_services(self) -> List[Dict[str, Any]]:
+        return list(self.iter_services())
+
+    def iter_products(self) -> Iterator[Dict[str, Any]]:
+        return self._iter_listing('products')
+
+    def iter_services(self) -> Iterator[Dict[str, Any]]:
+        return self._iter_listing('services')
+
+    def _iter_listing(self, listing: str) -> Iterator[Dict[str, Any]]:
+        """Yield the items of a listing (nothing if it has no selectors)"""
+        plan = self.plans.get(listing)
+        if plan is None:
+            return iter(())
+        path = self.paths[listing]
+        url = path if '://' in path else f"{self.base_url.rstrip('/')}/{path.lstrip('/')}"
+        return self._iter_items(url, plan, self.card_filters[listing])
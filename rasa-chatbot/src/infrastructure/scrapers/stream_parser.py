@@ -0,0 +1,164 @@
+# rasa-chatbot/src/infrastructure/scrapers/stream_parser.py
+from html.parser import HTMLParser
+from typing import Callable, Dict, List, Optional
+from bs4 import SoupStrainer
+
+# Decide si una etiqueta (nombre, atributos crudos) abre una tarjeta
+CardMatcher = Callable[[str, Dict[str, str]], bool]
+
+
+def strainer_matcher(card_filter: SoupStrainer) -> CardMatcher:
+    """Card test from the SoupStrainer used for ``restrict_to_cards``"""
+    allow = getattr(card_filter, 'allow_tag_creation', None)
+    if allow is not None:       # bs4 >= 4.13
+        return lambda name, attrs: allow(None, name, attrs)
+    return lambda name, attrs: bool(card_filter.search_tag(name, attrs))
+
+
+def _is_next_link(name: str, attrs: Dict[str, str]) -> bool:
+    return name in ('a', 'link') and 'next' in (attrs.get('rel') or '').lower().split() \
+        and attrs.get('href') is not None
+
+
+class CardStreamParser:
+    """Cuts the card subtrees out of a page while it is still downloading.
+
+    ``feed`` takes the next piece of decoded markup and returns the markup
+    of the cards closed by it, so they can be parsed (and their items
+    emitted) before the rest of the page arrives. Everything outside the
+    cards is discarded as it goes, and the ``href`` of the first
+    ``rel="next"`` link is kept in ``next_href``. Uses the lxml pull parser
+    for ``parser='lxml'`` and the standard ``html.parser`` otherwise.
+    """
+
+    def __init__(self, is_card: CardMatcher, parser: str = 'html.parser'):
+        self.next_href: Optional[str] = None
+        if parser == 'lxml':
+            self._backend = _LxmlCards(self, is_card)
+        else:
+            self._backend = _HtmlParserCards(self, is_card)
+
+    def feed(self, markup: str) -> List[str]:
+        return self._backend.feed(markup)
+
+    def close(self) -> List[str]:
+        """Finish the page; returns the cards still pending"""
+        return self._backend.close()
+
+    def _see_tag(self, name: str, attrs: Dict[str, str]) -> None:
+        if self.next_href is None and _is_next_link(name, attrs):
+            self.next_href = attrs['href']
+
+
+class _LxmlCards:
+    def __init__(self, owner: CardStreamParser, is_card: CardMatcher):
+        from lxml import etree
+        self._etree = etree
+        self._owner = owner
+        self._is_card = is_card
+        self._parser = etree.HTMLPullParser(events=('start', 'end'))
+        self._card = None       # tarjeta abierta (las tarjetas anidadas quedan dentro de ella)
+
+    def feed(self, markup: str) -> List[str]:
+        self._parser.feed(markup)
+        return self._drain()
+
+    def close(self) -> List[str]:
+        try:
+            self._parser.close()
+        except self._etree.XMLSyntaxError:
+            pass                # página vacía o truncada: se devuelve lo que haya
+        return self._drain()
+
+    def _drain(self) -> List[str]:
+        cards = []
+        for event, element in self._parser.read_events():
+            if not isinstance(element.tag, str):
+                continue        # comentarios e instrucciones de procesamiento
+            if event == 'start':
+                self._owner._see_tag(element.tag, element.attrib)
+                if self._card is None and self._is_card(element.tag, dict(element.attrib)):
+                    self._card = element
+            elif element is self._card:
+                cards.append(self._etree.tostring(element, encoding='unicode', method='html', with_tail=False))
+                self._card = None
+                self._discard(element)
+            elif self._card is None:
+                self._discard(element)
+        return cards
+
+    @staticmethod
+    def _discard(element) -> None:
+        """Free a finished element and the siblings already handled before it"""
+        element.clear(keep_tail=False)
+        parent = element.getparent()
+        if parent is not None:
+            while element.getprevious() is not None:
+                del parent[0]
+
+
+class _HtmlParserCards(HTMLParser):
+    def __init__(self, owner: CardStreamParser, is_card: CardMatcher):
+        # Las referencias se reescriben tal cual llegan (sin convertir)
+        super().__init__(convert_charrefs=False)
+        self._owner = owner
+        self._is_card = is_card
+        self._card_tag: Optional[str] = None
+        self._depth = 0
+        self._parts: List[str] = []
+        self._cards: List[str] = []
+
+    def feed(self, markup: str) -> List[str]:
+        super().feed(markup)
+        return self._take()
+
+    def close(self) -> List[str]:
+        super().close()
+        return self._take()
+
+    def _take(self) -> List[str]:
+        cards, self._cards = self._cards, []
+        return cards
+
+    def handle_starttag(self, tag, attrs):
+        attrs = {name: value if value is not None else '' for name, value in attrs}
+        self._owner._see_tag(tag, attrs)
+        if self._card_tag is None:
+            if not self._is_card(tag, attrs):
+                return
+            self._card_tag = tag
+        if tag == self._card_tag:
+            self._depth += 1
+        self._parts.append(self.get_starttag_text())
+
+    def handle_startendtag(self, tag, attrs):
+        self._owner._see_tag(tag, {name: value if value is not None else '' for name, value in attrs})
+        if self._card_tag is not None:
+            self._parts.append(self.get_starttag_text())
+
+    def handle_endtag(self, tag):
+        if self._card_tag is None:
+            return
+        self._parts.append(f'</{tag}>')
+        if tag == self._card_tag:
+            self._depth -= 1
+            if not self._depth:
+                self._cards.append(''.join(self._parts))
+                self._parts = []
+                self._card_tag = None
+
+    def handle_data(self, data):
+        if self._card_tag is not None:
+            self._parts.append(data)
+
+    def handle_entityref(self, name):
+        if self._card_tag is not None:
+            self._parts.append(f'&{name};')
+
+    def handle_charref(self, name):
+        if self._card_tag is not None:
+            self._parts.append(f'&#{name};')
+
+    def handle_comment(self, data):
+        if self._card_tag is not None:
+            self._parts.append(f'<!--{data}-->')
@@ -0,0 +1,6 @@
+# rasa-chatbot/tests/conftest.py
+import sys
+from pathlib import Path
+
+# Los módulos se importan como en main.py: 'src.…' relativo a rasa-chatbot/
+sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -0,0 +1,96 @@
+# rasa-chatbot/tests/test_example_sampler.py
+from src.domain.services.chatbot_orchestrator import _nlu_shard_artifacts
+from src.domain.services.example_sampler import budgeted_examples, dedupe_templates, sample_items, split_budget
+from src.infrastructure.rasa_integration.nlu_generator import NluOptions
+
+
+def _catalog(size=400):
+    categories = ('Muebles', 'Luz', 'Cocina', 'Jardín')
+    return [
+        {'id': f'p{i}', 'name': f'Producto {i}', 'category': categories[i % len(categories)],
+         'price': float(i % 97)}
+        for i in range(size)
+    ]
+
+
+def _ids(items):
+    return [item['id'] for item in items]
+
+
+def test_same_seed_gives_the_same_sample():
+    items = _catalog()
+
+    first = sample_items(items, 40, seed=7)
+
+    assert _ids(first) == _ids(sample_items(items, 40, seed=7))
+    assert _ids(first) == _ids(sample_items(list(items), 40, seed=7))
+    assert _ids(first) != _ids(sample_items(items, 40, seed=8))
+
+
+def test_sample_keeps_catalog_order_and_budget():
+    items = _catalog()
+    positions = {item['id']: i for i, item in enumerate(items)}
+
+    sample = sample_items(items, 40, seed=1)
+
+    assert len(sample) == 40
+    assert [positions[item_id] for item_id in _ids(sample)] == sorted(positions[i] for i in _ids(sample))
+    assert sample_items(items, 0) == []
+    assert sample_items(items, len(items) + 1) == items
+
+
+def test_every_category_is_represented_proportionally():
+    items = _catalog()
+
+    sample = sample_items(items, 40, seed=3, price_bands=1)
+
+    counts = {}
+    for item in sample:
+        counts[item['category']] = counts.get(item['category'], 0) + 1
+    assert counts == {'Muebles': 10, 'Luz': 10, 'Cocina': 10, 'Jardín': 10}
+
+
+def test_changing_one_stratum_does_not_reshuffle_the_others():
+    items = _catalog()
+    # Cambia el nombre de un item: ningún estrato cambia de tamaño
+    changed = [dict(item, name='Otro nombre') if item['id'] == 'p0' else item for item in items]
+
+    assert _ids(sample_items(items, 40, seed=5)) == _ids(sample_items(changed, 40, seed=5))
+
+
+def test_budgeted_examples_are_deterministic_and_capped():
+    items = _catalog()
+    templates = ['Tell me about {name}', 'What is {name}?', 'Info on {name} please']
+
+    pairs = budgeted_examples(items, templates, budget=50, seed=2)
+
+    assert 0 < len(pairs) <= 50
+    assert [(item['id'], t) for item, t in pairs] == \
+        [(item['id'], t) for item, t in budgeted_examples(items, templates, budget=50, seed=2)]
+    assert len(budgeted_examples(items[:5], templates, budget=50)) == 15
+
+
+def test_near_duplicate_templates_are_dropped():
+    templates = ['Tell me about {name}', 'tell me about {name}!', 'How much is {name}?']
+
+    assert dedupe_templates(templates) == ['Tell me about {name}', 'How much is {name}?']
+
+
+def test_split_budget_adds_up_to_exactly_the_budget():
+    sizes = {'Muebles': 1, 'Luz': 1, 'Cocina': 1, 'Jardín': 997}
+
+    for budget in (0, 3, 10, 999, 5000):
+        shares = split_budget(sizes, budget)
+        assert sum(shares.values()) == budget, budget
+    assert split_budget({'a': 1, 'b': 1, 'c': 2}, 8) == {'a': 2, 'b': 2, 'c': 4}
+
+
+def test_category_shards_share_the_example_cap():
+    data = {'products': [dict(item, name=f"Producto {item['id']}") for item in _catalog(10)]
+            + [{'id': f'x{i}', 'name': f'Extra {i}', 'category': 'Otros'} for i in range(990)],
+            'services': []}
+    options = NluOptions(max_examples_per_intent=12, shard_by_category=True)
+
+    shards = [artifact.shard for artifact in _nlu_shard_artifacts(data, options) if not artifact.shard.common]
+
+    assert sum(shard.options.max_examples_per_intent for shard in shards) == 12
@@ -0,0 +1,129 @@
+# rasa-chatbot/tests/test_extraction_plan.py
+import pytest
+from bs4 import BeautifulSoup
+
+from benchmarks.bench_extraction import COMPANY_A_SELECTORS
+from benchmarks.local_server import CatalogSiteServer
+from src.infrastructure.scrapers.extraction_plan import ExtractionPlan, PriceRule, Selector
+from src.infrastructure.scrapers.http_cache import HttpCache
+from src.infrastructure.scrapers.selector_scraper import SelectorScraper, compile_selectors
+
+PAGE = """
+<div class="product-card featured" data-id="p1">
+  <h2>Silla</h2><span class="price">$1.299,50</span><span class="category">Muebles</span>
+</div>
+<div class="product-card" data-id="p2">
+  <h2>Mesa</h2><span class="category">Muebles</span>
+</div>
+<div class="banner"><h2>Oferta</h2></div>
+"""
+
+
+@pytest.mark.parametrize('rule, text, expected', [
+    (PriceRule(), '$1,299.50', 1299.5),
+    (PriceRule(decimal=',', thousands='.'), '$1.299,50', 1299.5),
+    (PriceRule(decimal=',', thousands='.'), '€ 15', 15.0),
+    (PriceRule(implied_decimals=2), '$1.299', 12.99),
+    (PriceRule(implied_decimals=0), '1 299 CLP', 1299.0),
+    (PriceRule(), 'Consultar', None),
+    (PriceRule(), '...', None),
+    (PriceRule(decimal=',', thousands='.'), '1.299,50 - 1.500', 1299.5),
+    (PriceRule(thousands=' '), 'USD 12 500.75', 12500.75),
+    (PriceRule(), '$1 299', 1.0),
+    (PriceRule(implied_decimals=2), 'Gratis', None),
+])
+def test_price_rules(rule, text, expected):
+    assert rule.parse(text) == expected
+
+
+def test_price_rule_validation():
+    with pytest.raises(ValueError):
+        PriceRule(decimal='.', thousands='.')
+    with pytest.raises(ValueError):
+        PriceRule.from_dict({'decimals': ','})
+    assert PriceRule.from_dict(None) == PriceRule()
+    assert PriceRule.from_dict({'decimal': ',', 'thousands': '.'}) == PriceRule(',', '.')
+
+
+def test_selector_parsing():
+    selector = Selector.parse('a.nav.next[rel="next"]')
+    assert (selector.tag, selector.classes, selector.attr, selector.value) == \
+        ('a', frozenset({'nav', 'next'}), 'rel', 'next')
+    assert Selector.parse('.product-card').tag is None
+    for invalid in ('', 'div > span', 'div span', '#id'):
+        with pytest.raises(ValueError):
+            Selector.parse(invalid)
+
+
+def test_plan_extracts_fields_with_the_price_rule():
+    plan = ExtractionPlan('div.product-card', {
+        'id': {'attr': 'data-id'},
+        'name': {'selector': 'h2', 'required': True},
+        'price': {'selector': 'span.price', 'type': 'price'},
+        'category': 'span.category',
+    }, PriceRule(decimal=',', thousands='.'))
+
+    items = list(plan(BeautifulSoup(PAGE, 'html.parser')))
+
+    assert items == [
+        {'id': 'p1', 'name': 'Silla', 'price': 1299.5, 'category': 'Muebles'},
+        {'id': 'p2', 'name': 'Mesa', 'price': None, 'category': 'Muebles'},
+    ]
+
+
+def test_required_field_missing_skips_the_card():
+    plan = ExtractionPlan('div.product-card', {
+        'name': 'h2',
+        'price': {'selector': 'span.price', 'type': 'price', 'required': True},
+    })
+
+    assert [item['name'] for item in plan(BeautifulSoup(PAGE, 'html.parser'))] == ['Silla']
+
+
+def test_card_filter_keeps_only_the_cards():
+    plan = ExtractionPlan('div.product-card', {'name': 'h2'})
+
+    soup = BeautifulSoup(PAGE, 'html.parser', parse_only=plan.card_filter())
+
+    assert [item['name'] for item in plan(soup)] == ['Silla', 'Mesa']
+
+
+def test_fingerprint_follows_the_selectors_and_price_rule():
+    fields = {'name': 'h2'}
+    base = ExtractionPlan('div.product-card', fields).cache_key
+
+    assert ExtractionPlan('div.product-card', fields).cache_key == base
+    assert ExtractionPlan('div.card', fields).cache_key != base
+    assert ExtractionPlan('div.product-card', fields, PriceRule(implied_decimals=2)).cache_key != base
+    assert ExtractionPlan.__qualname__ == 'ExtractionPlan'
+
+
+def test_compile_selectors_applies_the_shared_price_rule():
+    plans = compile_selectors({
+        'price': {'implied_decimals': 2},
+        'products': {'card': 'div.product-card', 'fields': {'name': 'h2'}},
+        'services': {'card': 'div.service-card', 'fields': {'name': 'h3'},
+                     'price': {'decimal': ',', 'thousands': '.'}},
+    })
+
+    assert plans['products'].price_rule == PriceRule(implied_decimals=2)
+    assert plans['services'].price_rule == PriceRule(decimal=',', thousands='.')
+    with pytest.raises(ValueError):
+        compile_selectors({'products': {'card': 'div.product-card'}})
+    with pytest.raises(ValueError):
+        compile_selectors({'offers': {'card': 'div', 'fields': {'name': 'h2'}}})
+
+
+@pytest.mark.parametrize('stream', [False, True])
+def test_selector_scraper_caches_pages_under_the_plan_key(stream, tmp_path):
+    with CatalogSiteServer(latency=0, per_page=5) as site:
+        scraper = SelectorScraper(site.url, COMPANY_A_SELECTORS, restrict_to_cards=True, stream=stream,
+                                  http_cache=HttpCache(str(tmp_path), 1))
+        try:
+            items = list(scraper.iter_products())
+            entry = scraper.http_cache.lookup(f'{site.url}/products')
+        finally:
+            scraper.close()
+
+    assert len(items) == 5
+    assert list(entry.parsed) == [scraper.plans['products'].cache_key]
@@ -0,0 +1,96 @@
+# rasa-chatbot/tests/test_fuzzy_resolver.py
+import pytest
+
+from benchmarks.load_test_actions import StubDispatcher, StubTracker
+from src.domain.services.catalog_index import CatalogIndex
+from src.domain.services.fuzzy_resolver import FuzzyResolver
+
+NAMES = ['Silla de oficina ergonómica', 'Mesa de comedor extensible', 'Lámpara de pie LED',
+         'Sillón reclinable', 'Mesa ratona']
+
+
+def _best(resolver, query, **kwargs):
+    results = resolver.resolve(query, **kwargs)
+    return NAMES[results[0][0]] if results else None
+
+
+def test_one_typo_still_matches():
+    resolver = FuzzyResolver(NAMES)
+
+    assert _best(resolver, 'Silla de oficina ergonomca') == 'Silla de oficina ergonómica'
+    assert _best(resolver, 'lampara de pi LED') == 'Lámpara de pie LED'
+
+
+def test_partial_query_matches_the_name_that_contains_it():
+    resolver = FuzzyResolver(NAMES)
+
+    assert _best(resolver, 'mesa comedor') == 'Mesa de comedor extensible'
+    assert _best(resolver, 'reclinable') == 'Sillón reclinable'
+
+
+def test_empty_and_too_short_queries_find_nothing_useful():
+    resolver = FuzzyResolver(NAMES)
+
+    assert resolver.resolve('') == []
+    assert resolver.resolve('  ¿? ') == []
+    assert resolver.resolve('x', min_score=0.3) == []
+
+
+def test_scores_are_sorted_and_cut_at_min_score():
+    resolver = FuzzyResolver(NAMES)
+
+    results = resolver.resolve('mesa', limit=5)
+    scores = [score for _, score in results]
+    assert scores == sorted(scores, reverse=True)
+    assert all(0 < score <= 1 for score in scores)
+    cutoff = (scores[0] + scores[-1]) / 2
+    assert [pair for pair in results if pair[1] >= cutoff] == resolver.resolve('mesa', limit=5, min_score=cutoff)
+    assert resolver.resolve('Mesa ratona', min_score=1.0) == [(4, 1.0)]
+
+
+def test_posting_budget_and_candidates_bound_the_work():
+    names = [f'Producto genérico {i}' for i in range(100)] + ['Producto genérico cebra']
+
+    # La consulta solo tiene trigramas comunes: se leen las primeras max_postings entradas
+    truncated = FuzzyResolver(names, max_postings=10).resolve('producto generico', limit=50)
+    assert truncated and all(position < 10 for position, _ in truncated)
+    assert len(FuzzyResolver(names, candidates=3).resolve('producto generico', limit=50)) == 3
+    # Un trigrama raro entra en el presupuesto aunque las listas comunes no
+    assert FuzzyResolver(names, max_postings=10).resolve('generico cebra', limit=1)[0][0] == 100
+
+
+class _SpyCatalog(CatalogIndex):
+    def __init__(self, data):
+        super().__init__(data)
+        self.resolved = []
+
+    def resolve_product(self, text, limit=5, min_score=0.3):
+        self.resolved.append(text)
+        return super().resolve_product(text, limit, min_score)
+
+
+@pytest.fixture
+def actions(monkeypatch):
+    pytest.importorskip('rasa_sdk')
+    from actions import actions as module
+    catalog = _SpyCatalog({'products': [
+        {'id': f'p{i}', 'name': name, 'description': name, 'price': 10.0 + i} for i, name in enumerate(NAMES)
+    ], 'services': []})
+    monkeypatch.setattr(module, '_get_catalog', lambda: catalog)
+    return module, catalog
+
+
+def _ask_product(module, name):
+    dispatcher = StubDispatcher()
+    module.ActionProductInfo().run(dispatcher, StubTracker('test', {}, {'product': name}), {})
+    return dispatcher.messages[-1]['text']
+
+
+def test_action_only_falls_back_to_fuzzy_without_an_exact_match(actions):
+    module, catalog = actions
+
+    assert 'Mesa ratona' in _ask_product(module, 'mesa RATONA')
+    assert catalog.resolved == []
+
+    assert 'Silla de oficina ergonómica' in _ask_product(module, 'Silla de oficina ergonomca')
+    assert catalog.resolved == ['Silla de oficina ergonomca']
@@ -0,0 +1,176 @@
+# rasa-chatbot/tests/test_json_data_source.py
+import json
+import os
+import time
+
+import pytest
+
+from src.infrastructure.data_sources.catalog_cache import CatalogCache
+from src.infrastructure.data_sources.json_data_source import JsonDataSource
+
+
+def _catalog(price=10.0):
+    return {
+        'company_name': 'Company A',
+        'products': [
+            {'id': 'p1', 'name': 'Silla', 'price': price, 'category': 'Muebles'},
+            {'id': 'p2', 'name': 'Mesa', 'price': 50.0, 'category': 'Muebles'},
+        ],
+        'services': [{'id': 's1', 'name': 'Armado', 'price': 5.0}],
+    }
+
+
+@pytest.fixture
+def source(tmp_path):
+    return JsonDataSource(str(tmp_path / 'company_data.json'))
+
+
+def test_update_appends_delta_without_rewriting_snapshot(source):
+    source.save_data(_catalog())
+    base = source.current_version()
+    snapshot = open(source.file_path, encoding='utf-8').read()
+
+    updated = _catalog(price=12.5)
+    updated['products'].append({'id': 'p3', 'name': 'Lámpara', 'price': 7.0, 'category': 'Luz'})
+    source.update_data(updated)
+
+    assert open(source.file_path, encoding='utf-8').read() == snapshot
+    with open(source.changes_path, encoding='utf-8') as f:
+        entries = [json.loads(line) for line in f]
+    assert len(entries) == 1
+    assert entries[0]['version'] == base + 1
+    delta = entries[0]['delta']['items']['products']
+    assert [item['id'] for item in delta['added']] == ['p3']
+    assert delta['changed'] == [{'id': 'p1', 'fields': {'price': 12.5}}]
+    assert source.load_data() == updated
+    assert source.current_version() == base + 1
+
+
+def test_update_without_changes_writes_nothing(source):
+    source.save_data(_catalog())
+    base = source.current_version()
+    source.update_data(_catalog())
+    assert not os.path.exists(source.changes_path)
+    assert source.current_version() == base
+
+
+def test_removed_items_and_changes_since(source):
+    source.save_data(_catalog())
+    base = source.current_version()
+    smaller = _catalog()
+    smaller['products'] = smaller['products'][:1]
+    source.update_data(smaller)
+    smaller['products'] = [dict(smaller['products'][0], price=3.0)]
+    source.update_data(smaller)
+
+    assert [entry['version'] for entry in source.changes_since(base)] == [base + 1, base + 2]
+    assert [entry['version'] for entry in source.changes_since(base + 1)] == [base + 2]
+    assert source.load_data()['products'] == [{'id': 'p1', 'name': 'Silla', 'price': 3.0, 'category': 'Muebles'}]
+
+
+def test_compaction_folds_the_log_into_a_new_snapshot(source, monkeypatch):
+    monkeypatch.setattr(JsonDataSource, 'COMPACT_AFTER_CHANGES', 3)
+    source.save_data(_catalog())
+    base = source.current_version()
+    for price in (1.0, 2.0):
+        source.update_data(_catalog(price=price))
+    assert len(source._read_changes()) == 2
+
+    source.update_data(_catalog(price=3.0))
+
+    assert not os.path.exists(source.changes_path)
+    assert source._peek_snapshot_version() == base + 3
+    assert source.load_data() == _catalog(price=3.0)
+    # Los deltas compactados ya no se pueden pedir: hay que recargar todo
+    assert source.changes_since(base + 1) is None
+    assert source.changes_since(base + 3) == []
+
+
+def test_partial_last_line_of_the_log_is_ignored(source):
+    source.save_data(_catalog())
+    source.update_data(_catalog(price=2.0))
+    version = source.current_version()
+    with open(source.changes_path, 'a', encoding='utf-8') as f:
+        f.write('{"version": %d, "delta": {"set"' % (version + 1))
+    assert source.load_with_version() == (_catalog(price=2.0), version)
+
+
+def test_read_only_source_does_not_create_files(tmp_path):
+    path = tmp_path / 'missing' / 'company_data.json'
+    reader = JsonDataSource(str(path), read_only=True)
+
+    assert reader.load_with_version() == ({}, 0)
+    with pytest.raises(PermissionError):
+        reader.save_data(_catalog())
+    with pytest.raises(PermissionError):
+        reader.update_data(_catalog())
+    assert not path.parent.exists()
+
+
+def test_catalog_cache_serves_empty_catalog_until_first_publish(tmp_path):
+    path = str(tmp_path / 'company_data.json')
+    cache = CatalogCache(path, check_interval=0)
+
+    assert cache.get() == {}
+    assert cache.get_index().count_products() == 0
+    assert os.listdir(tmp_path) == []
+
+    JsonDataSource(path).save_data(_catalog())
+    with cache._lock:
+        cache._reload()
+    assert cache.get_index().get_product_by_name('silla')['price'] == 10.0
+
+
+def test_catalog_cache_applies_new_deltas(tmp_path):
+    path = str(tmp_path / 'company_data.json')
+    writer = JsonDataSource(path)
+    writer.save_data(_catalog())
+    base = writer.current_version()
+    cache = CatalogCache(path, check_interval=0)
+    assert cache.get_index().get_product_by_name('Silla')['price'] == 10.0
+
+    writer.update_data(_catalog(price=5.0))
+    with cache._lock:
+        cache._reload()
+
+    assert cache.get_index().get_product_by_name('Silla')['price'] == 5.0
+    assert cache.stats()['delta_reloads'] == 1
+    assert cache.stats()['data_version'] == base + 1
+
+
+def test_catalog_cache_reloads_rewritten_file_after_check_interval(tmp_path):
+    path = str(tmp_path / 'company_data.json')
+    writer = JsonDataSource(path)
+    writer.save_data(_catalog())
+    cache = CatalogCache(path, check_interval=0.2)
+    assert cache.get()['products'][0]['price'] == 10.0
+    cache.get()  # arranca el intervalo de comprobación
+
+    writer.save_data(_catalog(price=12.5))
+    # Dentro del intervalo se sigue sirviendo la versión cargada
+    assert cache.get()['products'][0]['price'] == 10.0
+
+    deadline = time.monotonic() + 5
+    while cache.get()['products'][0]['price'] != 12.5:
+        assert time.monotonic() < deadline, 'catalog was not reloaded'
+        time.sleep(0.05)
+
+    assert cache.get_index().get_product_by_name('Silla')['price'] == 12.5
+    assert cache.stats()['reloads'] == 1
+    assert cache.version == 2
+
+
+@pytest.mark.parametrize('reshape', [
+    lambda products: products[::-1],
+    lambda products: products[:1] + [{'id': 'p9', 'name': 'Banco', 'price': 20.0}] + products[1:],
+    lambda products: [dict(products[1], price=1.0), {'id': 'p9', 'name': 'Banco'}],
+], ids=['reorder', 'insert in the middle', 'remove, change and reorder'])
+def test_update_keeps_the_order_it_was_given(source, reshape):
+    source.save_data(_catalog())
+    expected = _catalog()
+    expected['products'] = reshape(expected['products'])
+
+    source.update_data(expected)
+
+    assert source.load_data() == expected
+    assert CatalogCache(source.file_path).get() == expected
@@ -0,0 +1,25 @@
+# rasa-chatbot/tests/test_metrics.py
+import time
+
+from src.infrastructure.monitoring.metrics import Metrics
+
+
+def test_start_export_rewrites_the_textfile_periodically(tmp_path):
+    path = tmp_path / 'actions.prom'
+    metrics = Metrics(enabled=True)
+    metrics.start_export(str(path), interval=0.05)
+    assert path.exists()
+
+    metrics.inc('action_fuzzy_lookups_total', entity='product')
+    deadline = time.monotonic() + 5
+    while 'chatbot_action_fuzzy_lookups_total{entity="product"} 1' not in path.read_text(encoding='utf-8'):
+        assert time.monotonic() < deadline, 'metrics were never exported'
+        time.sleep(0.02)
+
+
+def test_start_export_does_nothing_when_disabled(tmp_path):
+    path = tmp_path / 'actions.prom'
+
+    Metrics(enabled=False).start_export(str(path), interval=0.05)
+
+    assert not path.exists()
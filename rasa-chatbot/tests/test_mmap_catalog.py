@@ -0,0 +1,91 @@
+# rasa-chatbot/tests/test_mmap_catalog.py
+import pytest
+
+from src.domain.services.catalog_index import CatalogIndex
+from src.infrastructure.data_sources.json_data_source import JsonDataSource
+from src.infrastructure.data_sources.mmap_catalog import (
+    CatalogSnapshotBuilder, MmapCatalog, snapshot_path_for, write_catalog_snapshot,
+)
+
+CATALOG = {
+    'company': 'ACME',
+    'website': 'https://acme.example',
+    'products': [
+        {'id': 'p1', 'name': 'Apple iPhone 15 Pro', 'description': 'Teléfono', 'price': 999.0,
+         'category': 'phones', 'stock': 3},
+        {'id': 'p2', 'name': 'iPad Pro', 'price': 799, 'category': 'tablets', 'stock': True},
+        {'id': 'p3', 'name': 'Pro Display', 'price': None, 'category': 'monitors', 'tags': ['4k']},
+        {'id': 4, 'description': 'Sin nombre'},
+    ],
+    'services': [
+        {'id': 's1', 'name': 'Reparación de pantalla', 'price': 49.5, 'duration': '1h'},
+    ],
+}
+
+
+def test_snapshot_round_trips_every_item(tmp_path):
+    path = str(tmp_path / 'acme.catalog')
+    write_catalog_snapshot(CATALOG, path, version=7)
+
+    catalog = MmapCatalog(path)
+
+    assert catalog.to_dict() == CATALOG
+    assert catalog.version == 7
+    assert catalog.count_products() == 4
+    assert catalog.product_category_counts() == {'phones': 1, 'tablets': 1, 'monitors': 1, '': 1}
+
+
+def test_snapshot_lookups_match_catalog_index(tmp_path):
+    path = str(tmp_path / 'acme.catalog')
+    write_catalog_snapshot(CATALOG, path)
+    catalog = MmapCatalog(path)
+    index = CatalogIndex(CATALOG)
+
+    assert catalog.get_product_by_name('ipad  PRO') == index.get_product_by_name('ipad  PRO')
+    assert catalog.get_service_by_name('reparacion de pantalla')['id'] == 's1'
+    for text in ('pro', 'iphone 15', 'display', 'pantalla', 'zzz'):
+        assert catalog.search_products(text) == index.search_products(text), text
+    assert catalog.search_products('pro', limit=1) == index.search_products('pro', limit=1)
+
+
+def test_streamed_builder_writes_the_same_file(tmp_path):
+    written = str(tmp_path / 'written.catalog')
+    streamed = str(tmp_path / 'streamed.catalog')
+    write_catalog_snapshot(CATALOG, written)
+
+    builder = CatalogSnapshotBuilder()
+    for kind in ('products', 'services'):
+        assert list(builder.wrap(kind, iter(CATALOG[kind]))) == CATALOG[kind]
+    builder.write({'company': 'ACME', 'website': 'https://acme.example'}, streamed)
+
+    assert open(written, 'rb').read() == open(streamed, 'rb').read()
+
+
+def test_other_files_are_rejected(tmp_path):
+    path = tmp_path / 'acme.catalog'
+    path.write_bytes(b'not a snapshot'.ljust(512, b'\0'))
+
+    with pytest.raises(ValueError):
+        MmapCatalog(str(path))
+
+
+def test_every_publish_of_the_json_source_refreshes_the_snapshot(tmp_path, monkeypatch):
+    path = str(tmp_path / 'acme_data.json')
+    snapshot = snapshot_path_for(path)
+    source = JsonDataSource(path, snapshot_path=snapshot)
+    source.save_stream({'company': 'ACME'}, {'products': iter(CATALOG['products'][:2]), 'services': iter([])})
+    assert MmapCatalog(snapshot).get_product_by_name('iPad Pro')['price'] == 799
+
+    # Un delta del log también llega al snapshot
+    data = source.load_data()
+    data['products'][1] = dict(data['products'][1], price=5.0)
+    source.update_data(data)
+    catalog = MmapCatalog(snapshot)
+    assert catalog.get_product_by_name('iPad Pro')['price'] == 5.0
+    assert catalog.version == source.current_version()
+
+    # Y la compactación
+    monkeypatch.setattr(JsonDataSource, 'COMPACT_AFTER_CHANGES', 1)
+    data['products'].append(CATALOG['products'][2])
+    source.update_data(data)
+    assert MmapCatalog(snapshot).to_dict() == source.load_data()
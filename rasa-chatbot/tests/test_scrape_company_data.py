@@ -0,0 +1,57 @@
+# rasa-chatbot/tests/test_scrape_company_data.py
+import threading
+
+import pytest
+
+from src.application.use_cases.scrape_company_data import ScrapeCompanyDataUseCase
+from src.infrastructure.data_sources.json_data_source import JsonDataSource
+
+
+class FakeScraper:
+    def __init__(self, products_fail=False):
+        self.products_fail = products_fail
+        self.events = []
+
+    def iter_products(self):
+        yield {'id': 'p1', 'name': 'Silla'}
+        if self.products_fail:
+            raise RuntimeError('products page failed')
+        yield {'id': 'p2', 'name': 'Mesa'}
+
+    def iter_services(self):
+        try:
+            for i in range(100):
+                yield {'id': f's{i}', 'name': f'Servicio {i}'}
+        finally:
+            self.events.append(('services closed', threading.current_thread().name))
+
+    def close(self):
+        self.events.append(('scraper closed', None))
+
+
+def _prefetch_threads():
+    return [thread for thread in threading.enumerate() if thread.name.endswith('(_produce)')]
+
+
+def test_execute_saves_both_streams(tmp_path):
+    source = JsonDataSource(str(tmp_path / 'company_data.json'))
+    scraper = FakeScraper()
+
+    counts = ScrapeCompanyDataUseCase(scraper, source, buffer_size=5).execute('ACME', 'https://acme.example')
+
+    assert counts == {'products': 2, 'services': 100}
+    assert len(source.load_data()['services']) == 100
+    assert scraper.events[-1] == ('scraper closed', None)
+
+
+def test_failing_products_stop_the_services_thread_before_closing(tmp_path):
+    source = JsonDataSource(str(tmp_path / 'company_data.json'))
+    scraper = FakeScraper(products_fail=True)
+
+    with pytest.raises(RuntimeError):
+        ScrapeCompanyDataUseCase(scraper, source, buffer_size=5).execute('ACME', 'https://acme.example')
+
+    # El productor cerró su generador (en su propio hilo) antes de cerrar el scraper
+    assert [event for event, _ in scraper.events] == ['services closed', 'scraper closed']
+    assert scraper.events[0][1] != threading.current_thread().name
+    assert not _prefetch_threads()
@@ -0,0 +1,79 @@
+# rasa-chatbot/tests/test_sqlite_data_source.py
+import sqlite3
+
+from src.domain.services.catalog_index import CatalogIndex
+from src.infrastructure.data_sources.sqlite_data_source import SqliteDataSource
+
+CATALOG = {
+    'company': 'ACME',
+    'products': [
+        {'id': 'p1', 'name': 'Apple iPhone 15 Pro', 'category': 'phones', 'price': 999.0},
+        {'id': 'p2', 'name': 'iPad Pro', 'category': 'tablets', 'price': 799.0},
+        {'id': 'p3', 'name': 'Pro Display', 'category': 'monitors', 'price': 4999.0},
+        {'id': 'p4', 'name': 'Cámara Pronto', 'category': 'cameras', 'price': 150.0},
+    ],
+}
+
+
+def _names(items):
+    return [item['name'] for item in items]
+
+
+def test_load_data_always_returns_both_item_lists(tmp_path):
+    source = SqliteDataSource(str(tmp_path / 'catalog.db'))
+    source.save_data(CATALOG)
+
+    data = source.load_data()
+
+    assert data['services'] == []
+    assert len(data['products']) == 4
+    assert SqliteDataSource(str(tmp_path / 'empty.db')).load_data()['products'] == []
+
+
+def test_search_matches_word_prefixes_like_catalog_index(tmp_path):
+    source = SqliteDataSource(str(tmp_path / 'catalog.db'))
+    source.save_data(CATALOG)
+    index = CatalogIndex(source.load_data())
+
+    for text in ('pro', 'ipad', 'iphone 15', 'camara', 'display', 'zzz'):
+        assert _names(source.search_products(text)) == _names(index.search_products(text)), text
+    assert _names(source.search_products('pro', limit=2)) == _names(index.search_products('pro', limit=2))
+
+
+def test_update_data_keeps_the_word_index_in_sync(tmp_path):
+    source = SqliteDataSource(str(tmp_path / 'catalog.db'))
+    source.save_data(CATALOG)
+
+    updated = dict(CATALOG, products=[
+        {'id': 'p1', 'name': 'Apple iPhone 16', 'category': 'phones', 'price': 999.0},
+        {'id': 'p2', 'name': 'iPad Pro', 'category': 'tablets', 'price': 799.0},
+        {'id': 'p5', 'name': 'Studio Pro Max', 'category': 'monitors', 'price': 1999.0},
+    ])
+    source.update_data(updated)
+
+    assert _names(source.search_products('pro')) == _names(CatalogIndex(updated).search_products('pro'))
+    assert source.search_products('iphone 15') == []
+    assert _names(source.search_products('16')) == ['Apple iPhone 16']
+
+
+def test_existing_database_without_word_index_is_indexed_on_open(tmp_path):
+    path = str(tmp_path / 'catalog.db')
+    SqliteDataSource(path).save_data(CATALOG)
+    conn = sqlite3.connect(path)
+    conn.execute('DROP TABLE item_words')
+    conn.commit()
+    conn.close()
+
+    assert _names(SqliteDataSource(path).search_products('display')) == ['Pro Display']
+
+
+def test_update_data_keeps_the_order_it_was_given(tmp_path):
+    source = SqliteDataSource(str(tmp_path / 'catalog.db'))
+    source.save_data(CATALOG)
+    products = CATALOG['products']
+    updated = dict(CATALOG, products=[products[2], {'id': 'p9', 'name': 'Pro Stand'}, products[0], products[3]])
+
+    source.update_data(updated)
+
+    assert source.load_data()['products'] == updated['products']
+    assert _names(source.search_products('pro')) == _names(CatalogIndex(updated).search_products('pro'))
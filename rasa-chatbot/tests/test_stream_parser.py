@@ -0,0 +1,90 @@
+# rasa-chatbot/tests/test_stream_parser.py
+import os
+
+import pytest
+
+from benchmarks.local_server import CatalogSiteServer, render_catalog_page
+from src.infrastructure.scrapers.base_scraper import BaseScraper
+from src.infrastructure.scrapers.company_a_scraper import CompanyAScraper
+from src.infrastructure.scrapers.fetch_engine import ResponseTooLarge
+from src.infrastructure.scrapers.http_cache import HttpCache
+from src.infrastructure.scrapers.stream_parser import CardStreamParser, strainer_matcher
+
+PARSERS = ('html.parser', 'lxml')
+PAGE = ('<html><body><nav><a href="/">Inicio</a></nav>'
+        '<div class="product-card" data-id="p1"><h2>Silla &amp; mesa</h2>'
+        '<div class="product-card inner"><span>anidada</span></div></div>'
+        '<p>ruido</p><div class="product-card" data-id="p2"><h2>Lámpara</h2><br/></div>'
+        '<a rel="next" href="/products?page=2">Siguiente</a></body></html>')
+
+
+def _cards(parser, chunk_size):
+    cards_parser = CardStreamParser(strainer_matcher(BaseScraper.card_filter('div', 'product-card')), parser)
+    cards = []
+    for start in range(0, len(PAGE), chunk_size):
+        cards.extend(cards_parser.feed(PAGE[start:start + chunk_size]))
+    cards.extend(cards_parser.close())
+    return cards, cards_parser.next_href
+
+
+@pytest.mark.parametrize('parser', PARSERS)
+def test_cards_are_cut_out_whatever_the_chunk_boundaries(parser):
+    whole, next_href = _cards(parser, len(PAGE))
+
+    assert len(whole) == 2
+    assert 'anidada' in whole[0] and 'Lámpara' in whole[1]
+    assert 'ruido' not in ''.join(whole) and 'Inicio' not in ''.join(whole)
+    assert next_href == '/products?page=2'
+    for chunk_size in (1, 7, 64):
+        assert _cards(parser, chunk_size) == (whole, next_href)
+
+
+@pytest.mark.parametrize('parser', PARSERS)
+def test_streaming_scraper_matches_the_full_body_scraper(parser, tmp_path):
+    with CatalogSiteServer(latency=0, per_page=30, pages=3) as site:
+        scrapers = [CompanyAScraper(site.url, parser=parser, restrict_to_cards=True, stream=stream,
+                                    http_cache=HttpCache(str(tmp_path / str(stream)), 1))
+                    for stream in (False, True)]
+        try:
+            full, streamed = [list(scraper.iter_products()) for scraper in scrapers]
+        finally:
+            for scraper in scrapers:
+                scraper.close()
+
+    assert len(full) == 90
+    assert streamed == full
+
+
+def test_streamed_pages_are_cached_without_leftover_temp_files(tmp_path):
+    cache_dir = tmp_path / 'cache'
+    with CatalogSiteServer(latency=0, per_page=20, pages=2) as site:
+        scraper = CompanyAScraper(site.url, restrict_to_cards=True, stream=True,
+                                  http_cache=HttpCache(str(cache_dir), 1))
+        try:
+            first = list(scraper.iter_products())
+            entry = scraper.http_cache.lookup(f'{site.url}/products')
+            served = site.requests_served
+            second = list(scraper.iter_products())
+        finally:
+            scraper.close()
+
+        assert site.requests_served == served      # la segunda vez sale todo de la caché
+    assert second == first
+    assert entry.read_body() == render_catalog_page('products', 1, 20, 2)
+    assert entry.body_size == os.path.getsize(entry.body_path)
+    assert scraper.http_cache.stats.fresh_hits == 2
+    assert not [name for name in os.listdir(cache_dir) if name.endswith('.tmp')]
+
+
+def test_responses_over_the_size_cap_are_rejected_and_not_cached(tmp_path):
+    cache_dir = tmp_path / 'cache'
+    with CatalogSiteServer(latency=0, per_page=200) as site:
+        scraper = CompanyAScraper(site.url, restrict_to_cards=True, stream=True,
+                                  http_cache=HttpCache(str(cache_dir), 1), max_response_bytes=4096)
+        try:
+            with pytest.raises(ResponseTooLarge):
+                list(scraper.iter_products())
+        finally:
+            scraper.close()
+
+    assert os.listdir(cache_dir) == []
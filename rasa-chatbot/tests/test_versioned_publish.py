@@ -0,0 +1,79 @@
+# rasa-chatbot/tests/test_versioned_publish.py
+import os
+import time
+
+import pytest
+
+from src.infrastructure.data_sources.json_data_source import JsonDataSource
+
+
+def _catalog(name):
+    return {'products': [{'id': 'p1', 'name': name, 'price': 10.0}], 'services': []}
+
+
+@pytest.fixture
+def source(tmp_path):
+    return JsonDataSource(str(tmp_path / 'company_data.json'))
+
+
+def test_save_publishes_a_version_linked_as_the_current_file(source):
+    source.save_data(_catalog('Silla'))
+    version = source.current_version()
+
+    assert version in source.published_versions()
+    assert os.path.samefile(source.file_path, source.version_path(version))
+    assert source.load_data() == _catalog('Silla')
+
+
+def test_pinned_version_survives_later_publishes(source):
+    source.save_data(_catalog('Silla'))
+    pinned = source.current_version()
+    source.save_data(_catalog('Mesa'))
+
+    assert source.load_version(pinned) == _catalog('Silla')
+    assert source.load_data() == _catalog('Mesa')
+    assert source.load_version(pinned + 100) is None
+
+
+def test_failed_stream_keeps_the_previous_snapshot(source, tmp_path):
+    source.save_data(_catalog('Silla'))
+    version = source.current_version()
+
+    def broken_items():
+        yield {'id': 'p1', 'name': 'Mesa'}
+        raise RuntimeError('scraper failed')
+
+    with pytest.raises(RuntimeError):
+        source.save_stream({}, {'products': broken_items()})
+
+    assert source.load_data() == _catalog('Silla')
+    assert source.current_version() == version
+    assert not [name for name in os.listdir(tmp_path) if name.endswith('.tmp')]
+
+
+def test_gc_removes_only_versions_replaced_before_the_grace_period(source):
+    for name in ('Silla', 'Mesa', 'Lámpara'):
+        source.save_data(_catalog(name))
+    versions = source.published_versions()
+    old, middle, latest = versions[-3:]
+    # La versión "middle" se publicó hace una hora: "old" quedó reemplazada entonces
+    an_hour_ago = time.time() - 3600
+    os.utime(source.version_path(middle), (an_hour_ago, an_hour_ago))
+
+    removed = source.gc_versions(grace_seconds=600)
+
+    assert old in removed
+    assert middle not in removed and latest not in removed
+    assert source.published_versions()[-2:] == [middle, latest]
+
+
+def test_gc_never_removes_the_latest_version(source):
+    source.save_data(_catalog('Silla'))
+    latest = source.current_version()
+    past = time.time() - 3600
+    os.utime(source.version_path(latest), (past, past))
+
+    source.gc_versions(grace_seconds=0)
+
+    assert source.published_versions() == [latest]
+    assert source.load_data() == _catalog('Silla')